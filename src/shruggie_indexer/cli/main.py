@@ -13,10 +13,12 @@ See spec sections 8.1-8.11 for full behavioral guidance.
 from __future__ import annotations
 
 import logging
+import os
 import signal
 import sys
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from enum import IntEnum
 from pathlib import Path
@@ -37,6 +39,10 @@ __all__ = [
 
 logger = logging.getLogger("shruggie_indexer")
 
+# In-place sidecar writes are small and independent; threads overlap their
+# open/write/close syscalls, which release the GIL.
+_INPLACE_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 # ---------------------------------------------------------------------------
 # Exit codes (spec section 8.10)
@@ -820,7 +826,7 @@ def _write_inplace_tree(
     _is_root: bool = True,
     write_directory_meta: bool = True,
 ) -> None:
-    """Recursively write in-place sidecar files for an entry tree.
+    """Write in-place sidecar files for an entry tree.
 
     Walks the ``items`` tree and writes a sidecar file for each entry.
     The root directory entry is skipped because its in-place sidecar
@@ -830,23 +836,58 @@ def _write_inplace_tree(
     When *write_directory_meta* is ``False``, directory-level sidecar
     files (``_directorymeta3.json``) are suppressed.  Per-file sidecars
     are unaffected.
+
+    Each sidecar is an independent small file, so the writes are spread
+    over a thread pool.  Every failed write is logged with its path, and
+    the first failure is re-raised once the pool has drained.
     """
-    if entry.type == "file":
-        item_path = root_path / entry.file_system.relative
-        write_fn(entry, item_path, "file")
-    elif entry.type == "directory":
-        if not _is_root and write_directory_meta:
-            dir_path = root_path / entry.file_system.relative
-            write_fn(entry, dir_path, "directory")
-        if entry.items:
-            for child in entry.items:
-                _write_inplace_tree(
-                    child,
-                    root_path,
-                    write_fn,
-                    _is_root=False,
-                    write_directory_meta=write_directory_meta,
-                )
+    jobs = _collect_inplace_writes(
+        entry, root_path, _is_root=_is_root, write_directory_meta=write_directory_meta
+    )
+    if len(jobs) <= 1:
+        for job in jobs:
+            write_fn(*job)
+        return
+    with ThreadPoolExecutor(max_workers=min(_INPLACE_WRITE_WORKERS, len(jobs))) as pool:
+        # submit() rather than map(): map() cancels the outstanding writes
+        # as soon as one raises, while here every sidecar gets its attempt.
+        futures = [pool.submit(write_fn, *job) for job in jobs]
+    first_exc: BaseException | None = None
+    for (_, path, _), future in zip(jobs, futures, strict=True):
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Sidecar write FAILED: %s: %s", path, exc)
+            if first_exc is None:
+                first_exc = exc
+    if first_exc is not None:
+        raise first_exc
+
+
+def _collect_inplace_writes(
+    entry: Any,
+    root_path: Path,
+    *,
+    _is_root: bool,
+    write_directory_meta: bool,
+) -> list[tuple[Any, Path, str]]:
+    """Return ``(entry, path, kind)`` sidecar jobs for *entry*'s tree.
+
+    Walks the tree with an explicit stack (children pushed in reverse), so
+    jobs come out in the same depth-first order as a recursive walk
+    without its frame overhead or recursion limit.
+    """
+    jobs: list[tuple[Any, Path, str]] = []
+    stack: list[tuple[Any, bool]] = [(entry, _is_root)]
+    while stack:
+        node, is_root = stack.pop()
+        if node.type == "file":
+            jobs.append((node, root_path / node.file_system.relative, "file"))
+        elif node.type == "directory":
+            if not is_root and write_directory_meta:
+                jobs.append((node, root_path / node.file_system.relative, "directory"))
+            if node.items:
+                stack.extend((child, False) for child in reversed(node.items))
+    return jobs
 
 
 def _rename_tree(
@@ -72,6 +72,8 @@ def _print_result_summary(result) -> None:
         click.echo("Errors:", err=True)
         for error in result.errors:
             click.echo(f"  - {error}", err=True)
+        if result.errors_truncated:
+            click.echo(f"  ... and {result.errors_truncated} more", err=True)
 
 
 # ---------------------------------------------------------------------------
@@ -22,6 +22,7 @@ from shruggie_indexer.core.entry import (
 from shruggie_indexer.core.exif import extract_exif
 from shruggie_indexer.core.hashing import (
     NULL_HASHES,
+    hash_bytes,
     hash_directory_id,
     hash_file,
     hash_string,
@@ -60,10 +61,18 @@ from shruggie_indexer.core.rules import (
 from shruggie_indexer.core.serializer import serialize_entry, write_inplace, write_output
 from shruggie_indexer.core.sidecar import discover_and_parse
 from shruggie_indexer.core.timestamps import extract_timestamps
-from shruggie_indexer.core.traversal import list_children
+from shruggie_indexer.core.traversal import (
+    ChildEntry,
+    ScanResult,
+    iter_children,
+    list_children,
+    scan_children,
+    walk_tree,
+)
 
 __all__ = [
     "NULL_HASHES",
+    "ChildEntry",
     "DedupAction",
     "DedupRegistry",
     "DedupResult",
@@ -75,6 +84,7 @@ __all__ = [
     "RollbackPlan",
     "RollbackResult",
     "RollbackStats",
+    "ScanResult",
     "SidecarRule",
     "apply_dedup",
     "build_directory_entry",
@@ -90,10 +100,12 @@ __all__ = [
     "extract_components",
     "extract_exif",
     "extract_timestamps",
+    "hash_bytes",
     "hash_directory_id",
     "hash_file",
     "hash_string",
     "index_path",
+    "iter_children",
     "list_children",
     "load_meta2",
     "load_rules",
@@ -102,11 +114,13 @@ __all__ = [
     "relative_forward_slash",
     "rename_item",
     "resolve_path",
+    "scan_children",
     "scan_tree",
     "select_id",
     "serialize_entry",
     "validate_extension",
     "verify_file_hash",
+    "walk_tree",
     "write_inplace",
     "write_output",
 ]
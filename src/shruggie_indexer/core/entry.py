@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
+import stat
 import time
 import uuid
 from datetime import UTC, datetime
@@ -173,6 +175,19 @@ def _make_indexed_at() -> TimestampPair:
     return TimestampPair(iso=iso, unix=unix_ms)
 
 
+def _dirent_is_file(entry: os.DirEntry[str]) -> bool:
+    """Return ``entry.is_file()``, treating an ``OSError`` as "not a file".
+
+    ``is_file()`` may need a ``stat`` call (no ``d_type``, or a symlink to
+    follow), which can fail for a single entry; that entry is skipped
+    rather than aborting the whole listing.
+    """
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
 def _enumerate_siblings(path: Path) -> list[Path]:
     """List sibling files in the path's parent directory.
 
@@ -180,12 +195,12 @@ def _enumerate_siblings(path: Path) -> list[Path]:
     """
     parent = path.parent
     try:
-        return sorted(
-            (p for p in parent.iterdir() if p.is_file()),
-            key=lambda p: p.name.lower(),
-        )
+        with os.scandir(parent) as it:
+            names = [e.name for e in it if _dirent_is_file(e)]
     except OSError:
         return []
+    names.sort(key=str.casefold)
+    return [parent / n for n in names]
 
 
 # ---------------------------------------------------------------------------
@@ -676,14 +691,26 @@ def index_path(
     are ignored for single-file targets.
     """
     resolved = resolve_path(target)
-    target_type = "file" if resolved.is_file() else "directory" if resolved.is_dir() else "unknown"
+    # Classify the target from one stat() instead of probing it repeatedly
+    # with is_file()/is_dir().
+    try:
+        target_mode = resolved.stat().st_mode
+    except OSError:
+        target_mode = 0
+    target_type = (
+        "file"
+        if stat.S_ISREG(target_mode)
+        else "directory"
+        if stat.S_ISDIR(target_mode)
+        else "unknown"
+    )
     logger.info("index_path: target=%s, type=%s", resolved, target_type)
 
     # Generate a session ID if the caller did not supply one.
     if session_id is None:
         session_id = str(uuid.uuid4())
 
-    if resolved.is_file():
+    if target_type == "file":
         entry = build_file_entry(
             resolved,
             config,
@@ -694,7 +721,7 @@ def index_path(
         _annotate_relationships(entry, config)
         return entry
 
-    if resolved.is_dir():
+    if target_type == "directory":
         entry = build_directory_entry(
             resolved,
             config,
@@ -829,8 +856,14 @@ def cleanup_stale_metadata(
     # ── Scan and delete stale artifacts ────────────────────────────────
     deleted = 0
     for dir_path in traversed:
+        # Only names matching the metadata convention are candidates, so
+        # test the name before the (cached) dirent type and build a Path
+        # only for those.
         try:
-            children = list(dir_path.iterdir())
+            with os.scandir(dir_path) as it:
+                names = [
+                    e.name for e in it if _STALE_METADATA_RE.search(e.name) and _dirent_is_file(e)
+                ]
         except OSError as exc:
             logger.warning(
                 "Cannot scan directory for stale metadata: %s: %s",
@@ -838,11 +871,8 @@ def cleanup_stale_metadata(
                 exc,
             )
             continue
-        for child in children:
-            if not child.is_file():
-                continue
-            if not _STALE_METADATA_RE.search(child.name):
-                continue
+        for name in names:
+            child = dir_path / name
             if child in protected:
                 continue
             # Stale artifact — delete it.
@@ -15,6 +15,7 @@ See spec §6.3 for full behavioral guidance.
 from __future__ import annotations
 
 import hashlib
+import queue
 import unicodedata
 from typing import TYPE_CHECKING
 
@@ -27,6 +28,7 @@ if TYPE_CHECKING:
 __all__ = [
     "CHUNK_SIZE",
     "NULL_HASHES",
+    "hash_bytes",
     "hash_directory_id",
     "hash_file",
     "hash_string",
@@ -51,9 +53,35 @@ _DEFAULT_ALGORITHMS: tuple[str, ...] = ("md5", "sha256")
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# Pool of CHUNK_SIZE read buffers loaned to hash_file().  Reading with
+# readinto() into a recycled buffer avoids allocating (and zero-filling) a
+# fresh bytes object per chunk.  SimpleQueue is thread-safe, so concurrent
+# hash_file() calls each get their own buffer; the pool never grows past
+# the peak number of concurrent callers.
+_BUFFER_POOL: queue.SimpleQueue[bytearray] = queue.SimpleQueue()
+
+
+def _get_buffer() -> bytearray:
+    """Borrow a read buffer from the pool, allocating one if it is empty."""
+    try:
+        return _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(CHUNK_SIZE)
+
+
+def _put_buffer(buf: bytearray) -> None:
+    """Return a buffer obtained from :func:`_get_buffer` to the pool."""
+    _BUFFER_POOL.put(buf)
+
 
 def _make_hashset(digests: dict[str, str]) -> HashSet:
-    """Build a ``HashSet`` from a digest mapping, uppercasing all values."""
+    """Build a ``HashSet`` from a digest mapping, uppercasing all values.
+
+    This is the single point where digests are canonicalized to uppercase
+    hex: one C-level ``str.upper()`` per digest.  ``HashSet`` itself does no
+    validation, so downstream code can rely on the invariant without
+    re-scanning the strings.
+    """
     return HashSet(
         md5=digests["md5"].upper(),
         sha256=digests["sha256"].upper(),
@@ -97,8 +125,9 @@ def hash_file(
         path: Absolute path to the file.
         algorithms: Hash algorithm names to compute.  Defaults to
             ``("md5", "sha256")``.
-        cancel_event: Optional ``threading.Event`` checked every chunk.
-            When set, raises ``IndexerCancellationError``.
+        cancel_event: Optional ``threading.Event`` checked before the file
+            is opened and again every chunk.  When set, raises
+            ``IndexerCancellationError``.
 
     Returns:
         A :class:`~shruggie_indexer.models.schema.HashSet` with the computed
@@ -109,16 +138,44 @@ def hash_file(
     """
     from shruggie_indexer.exceptions import IndexerCancellationError
 
-    hashers = {alg: hashlib.new(alg) for alg in algorithms}
+    if cancel_event is not None and cancel_event.is_set():
+        raise IndexerCancellationError("Hashing cancelled")
 
-    with open(path, "rb") as fh:
-        while chunk := fh.read(CHUNK_SIZE):
-            if cancel_event is not None and cancel_event.is_set():
-                raise IndexerCancellationError("Hashing cancelled")
-            for h in hashers.values():
-                h.update(chunk)
+    hashers = [hashlib.new(alg) for alg in algorithms]
 
-    digests = {alg: h.hexdigest() for alg, h in hashers.items()}
+    buf = _get_buffer()
+    try:
+        with memoryview(buf) as view, open(path, "rb", buffering=0) as fh:
+            while n := fh.readinto(buf):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise IndexerCancellationError("Hashing cancelled")
+                chunk = view[:n]
+                for h in hashers:
+                    h.update(chunk)
+    finally:
+        _put_buffer(buf)
+
+    digests = {alg: h.hexdigest() for alg, h in zip(algorithms, hashers, strict=True)}
+    return _make_hashset(digests)
+
+
+def hash_bytes(
+    data: bytes,
+    algorithms: tuple[str, ...] = _DEFAULT_ALGORITHMS,
+) -> HashSet:
+    """Compute content hashes of an in-memory byte buffer.
+
+    Produces the same digests as :func:`hash_file` on a file holding
+    *data*, for callers that have already read the content.
+
+    Args:
+        data: The raw content to hash.
+        algorithms: Hash algorithm names to compute.
+
+    Returns:
+        A :class:`~shruggie_indexer.models.schema.HashSet`.
+    """
+    digests = {alg: hashlib.new(alg, data).hexdigest() for alg in algorithms}
     return _make_hashset(digests)
 
 
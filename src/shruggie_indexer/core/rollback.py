@@ -32,13 +32,19 @@ from __future__ import annotations
 
 import base64
 import ctypes
+import errno
+import hashlib
 import json
 import logging
+import math
+import mmap
 import os
 import shutil
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, BinaryIO, Protocol
 
 from shruggie_indexer.exceptions import IndexerConfigError, IndexerTargetError
 from shruggie_indexer.models.schema import (
@@ -58,7 +64,8 @@ from shruggie_indexer.models.schema import (
 
 if TYPE_CHECKING:
     import threading
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
+    from concurrent.futures import Future
     from pathlib import Path
 
     from shruggie_indexer.core.progress import ProgressEvent
@@ -81,6 +88,49 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Worker threads used to run restore and duplicate-restore copies in
+# parallel.  Copies are I/O-bound, so this deliberately exceeds the core
+# count to keep the storage queue full.
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Windows and macOS volumes fold case by default; a name missing from an
+# exact-match directory listing may still resolve there.
+_CASE_INSENSITIVE_FS = sys.platform in ("win32", "darwin")
+
+# Cancellation is polled before every real copy or sidecar write, each of
+# which already costs several syscalls.  Loops with cheap iterations
+# (directory creation, dry runs) poll once per this many items instead.
+_CANCEL_CHECK_INTERVAL = 64
+
+# RollbackResult keeps at most this many error messages, so a failure storm
+# (a full disk, a vanished source tree) cannot grow the report without bound.
+_MAX_RESULT_ERRORS = 1024
+
+# Windows needs O_BINARY on os.open() to avoid newline translation.
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# In-kernel copy support for _copy_file().  The errnos are those with which
+# copy_file_range reports "not possible here" (cross-device on older
+# kernels, unsupported filesystem, seccomp-filtered syscall).
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_COPY_FILE_RANGE_CHUNK = 1 << 30
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM},
+)
+
+
+# ---------------------------------------------------------------------------
+# orjson / json fallback
+# ---------------------------------------------------------------------------
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _HAS_ORJSON = False
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -144,6 +194,26 @@ class RollbackPlan:
     stats: RollbackStats
     warnings: list[str]
 
+    def by_type(self) -> dict[str, list[RollbackAction]]:
+        """Bucket actions by ``action_type`` in a single pass over ``actions``.
+
+        Only actionable (non-skipped) actions are bucketed by type; every
+        skipped action goes under the ``"skipped"`` key instead.  All four
+        action types and ``"skipped"`` are always present, possibly empty.
+        Each call builds fresh lists, so callers may sort or mutate them.
+        """
+        buckets: dict[str, list[RollbackAction]] = {
+            "mkdir": [],
+            "restore": [],
+            "duplicate_restore": [],
+            "sidecar_restore": [],
+            "skipped": [],
+        }
+        for action in self.actions:
+            key = "skipped" if action.skip_reason else action.action_type
+            buckets.setdefault(key, []).append(action)
+        return buckets
+
 
 @dataclass
 class RollbackResult:
@@ -156,6 +226,17 @@ class RollbackResult:
     skipped: int = 0
     failed: int = 0
     errors: list[str] = field(default_factory=list)
+    """Failure messages, capped at ``_MAX_RESULT_ERRORS`` entries."""
+
+    errors_truncated: int = 0
+    """Failures beyond the cap, counted but not kept in :attr:`errors`."""
+
+    def record_error(self, message: str) -> None:
+        """Append *message* to :attr:`errors`, or count it once the list is full."""
+        if len(self.errors) < _MAX_RESULT_ERRORS:
+            self.errors.append(message)
+        else:
+            self.errors_truncated += 1
 
 
 # ---------------------------------------------------------------------------
@@ -248,27 +329,54 @@ class LocalSourceResolver:
        meta2 sidecars in subdirectories.
 
     Returns ``None`` if neither match succeeds.
+
+    Each search directory is listed once with :func:`os.scandir` and the
+    listing is kept for the resolver's lifetime, so name lookups cost no
+    syscalls.  Create a fresh resolver after the source tree changes.
     """
 
     def __init__(self, *, verify_hash: bool = True) -> None:
         self._verify_hash = verify_hash
+        self._listings: dict[Path, dict[str, os.DirEntry[str]]] = {}
+
+    def _scan_source_dir(self, directory: Path) -> dict[str, os.DirEntry[str]]:
+        """Return the regular files in *directory* keyed by name (cached)."""
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = {}
+            try:
+                with os.scandir(directory) as it:
+                    for dirent in it:
+                        try:
+                            if dirent.is_file():
+                                listing[dirent.name] = dirent
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            self._listings[directory] = listing
+        return listing
 
     def _try_dir(self, entry: IndexEntry, directory: Path) -> Path | None:
         """Attempt to find the source file for *entry* in *directory*."""
+        listing = self._scan_source_dir(directory)
         # Strategy A: storage_name match (renamed file)
-        storage_path = directory / entry.attributes.storage_name
-        if storage_path.is_file():
-            if self._verify_hash and entry.hashes is not None:
-                self._check_hash(storage_path, entry)
-            return storage_path
-
         # Strategy B: original name match (non-renamed file)
-        if entry.name.text is not None:
-            original_path = directory / entry.name.text
-            if original_path.is_file():
-                if self._verify_hash and entry.hashes is not None:
-                    self._check_hash(original_path, entry)
-                return original_path
+        for name in (entry.attributes.storage_name, entry.name.text):
+            if name is None:
+                continue
+            dirent = listing.get(name)
+            if dirent is not None:
+                path = directory / name
+            elif _CASE_INSENSITIVE_FS and (directory / name).is_file():
+                # The listing is keyed by exact name; let the OS apply its
+                # own case folding for names that differ only in case.
+                path = directory / name
+            else:
+                continue
+            if self._verify_hash and entry.hashes is not None:
+                self._check_hash(path, entry)
+            return path
 
         return None
 
@@ -292,11 +400,16 @@ class LocalSourceResolver:
 
     @staticmethod
     def _check_hash(path: Path, entry: IndexEntry) -> None:
-        """Log a warning if the file hash doesn't match the sidecar."""
+        """Log a warning if the file hash doesn't match the sidecar.
+
+        The sidecar's recorded size is passed along, so a file whose size
+        differs is reported without reading any content.
+        """
         if entry.hashes is None:
             return
         algorithm = entry.id_algorithm
-        if not verify_file_hash(path, entry.hashes, algorithm):
+        expected_size = entry.size.bytes if entry.size is not None else None
+        if not verify_file_hash(path, entry.hashes, algorithm, expected_size=expected_size):
             expected = getattr(entry.hashes, algorithm, "?")
             logger.warning(
                 "Hash mismatch: %s — expected %s, got different value",
@@ -521,10 +634,20 @@ def _extract_duplicates(entries: list[IndexEntry]) -> list[IndexEntry]:
     return result
 
 
+def _parse_sidecar_json(path: str) -> Any:
+    """Read and decode a sidecar file's JSON."""
+    if _HAS_ORJSON and orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, encoding="utf-8") as f:
+        return json.loads(f.read())
+
+
 def load_sidecar(
     path: Path,
     *,
     recursive: bool = False,
+    cache: dict[tuple[str, int, int], Any] | None = None,
 ) -> list[IndexEntry]:
     """Load and parse an index output file into a flat list of IndexEntry objects.
 
@@ -545,6 +668,13 @@ def load_sidecar(
             aggregate output file, or directory containing those files.
         recursive: When ``True`` and *path* is a directory, search
             subdirectories for sidecars.
+        cache: Optional dict of decoded sidecar JSON, keyed on each file's
+            path, mtime and size.  Callers that load the same sidecars more
+            than once in a session (a dry run followed by the real rollback,
+            say) pass one dict to every call to skip re-parsing unchanged
+            files, and drop it when the session ends.  A rewritten file
+            misses the cache and is parsed afresh.  Cached objects are only
+            read, never mutated.  When ``None`` every load parses from disk.
 
     Returns:
         Flat list of :class:`IndexEntry` objects (files only).
@@ -554,16 +684,18 @@ def load_sidecar(
         IndexerConfigError: If ``schema_version`` is not 2, 3, or 4.
         IndexerTargetError: If *path* does not exist.
     """
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         msg = f"Path does not exist: {path}"
-        raise IndexerTargetError(msg)
+        raise IndexerTargetError(msg) from None
 
     # Shape 3: directory → discover and combine
-    if path.is_dir():
+    if stat.S_ISDIR(st.st_mode):
         files = discover_sidecar_files(path, recursive=recursive)
         combined: list[IndexEntry] = []
         for f in files:
-            sub_entries = load_sidecar(f, recursive=False)
+            sub_entries = load_sidecar(f, recursive=False, cache=cache)
             # Annotate each entry with the directory its sidecar came from
             # so LocalSourceResolver can find content files alongside the
             # sidecar during recursive rollback.
@@ -573,9 +705,16 @@ def load_sidecar(
         return combined
 
     # Shapes 1 & 2: single JSON file
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler
+    # covers both decoders.
     try:
-        raw = path.read_text(encoding="utf-8")
-        data = json.loads(raw)
+        if cache is None:
+            data = _parse_sidecar_json(str(path))
+        else:
+            key = (str(path), st.st_mtime_ns, st.st_size)
+            data = cache.get(key)
+            if data is None:
+                data = cache[key] = _parse_sidecar_json(str(path))
     except json.JSONDecodeError as exc:
         msg = f"Invalid JSON in {path}: {exc}"
         raise IndexerConfigError(msg) from exc
@@ -626,37 +765,69 @@ def load_meta2(
 # ---------------------------------------------------------------------------
 
 
+# HashSet fields verify_file_hash() can check.
+_VERIFY_ALGORITHMS = frozenset({"md5", "sha256", "sha512"})
+
+# Files at least this large are hashed through a read-only memory map in a
+# single update() instead of through file_digest()'s chunked reads.
+_MMAP_VERIFY_THRESHOLD = 2 * 1024 * 1024
+
+
 def verify_file_hash(
     path: Path,
     expected: HashSet,
     algorithm: str = "md5",
+    *,
+    expected_size: int | None = None,
 ) -> bool:
     """Verify a file's content hash against expected values.
 
-    Computes the hash of the file at *path* and compares against the
-    expected :class:`HashSet`.  Uses only the specified *algorithm* for
-    efficiency (avoids computing all hashes).
+    Computes only the requested *algorithm* over the file at *path* with
+    :func:`hashlib.file_digest`, which hashes straight from the file
+    descriptor, and compares it against the expected :class:`HashSet`.
 
     Args:
         path: File to hash.
         expected: Expected hash values.
         algorithm: Hash algorithm to use (default ``"md5"``).
+        expected_size: Expected size in bytes, if known.  A file of any
+            other size is rejected from its ``fstat`` alone, without
+            reading content.
 
     Returns:
-        ``True`` if the hash matches, ``False`` otherwise.
+        ``True`` if the hash matches, ``False`` otherwise (including when
+        *expected* has no value for *algorithm*).
     """
-    from shruggie_indexer.core.hashing import hash_file
-
     expected_value = getattr(expected, algorithm, None)
-    if expected_value is None:
+    if expected_value is None or algorithm not in _VERIFY_ALGORITHMS:
         return False
 
-    # hash_file requires at minimum md5+sha256 (see _make_hashset).
-    # Always use the default algorithms to avoid KeyError.
-    computed = hash_file(path)
-    actual_value = getattr(computed, algorithm, None)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if expected_size is not None and size != expected_size:
+            return False
+        actual_value = _digest_file(f, algorithm, size)
+
+    return actual_value.upper() == expected_value.upper()
+
 
-    return actual_value is not None and actual_value.upper() == expected_value.upper()
+def _digest_file(f: BinaryIO, algorithm: str, size: int) -> str:
+    """Return the hex digest of open file *f* (*size* bytes) under *algorithm*.
+
+    Large files are mapped read-only and hashed in one call, so content
+    is read straight from the page cache with no copy into a Python
+    buffer.  Smaller files, and files that cannot be mapped, go through
+    :func:`hashlib.file_digest`.
+    """
+    if size >= _MMAP_VERIFY_THRESHOLD:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            pass
+        else:
+            with mapped:
+                return hashlib.new(algorithm, mapped).hexdigest()
+    return hashlib.file_digest(f, algorithm).hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -1183,7 +1354,12 @@ def _check_conflict(
     if (
         verify
         and entry.hashes is not None
-        and verify_file_hash(target_path, entry.hashes, entry.id_algorithm)
+        and verify_file_hash(
+            target_path,
+            entry.hashes,
+            entry.id_algorithm,
+            expected_size=entry.size.bytes if entry.size is not None else None,
+        )
     ):
         logger.debug("Skipped (already exists, same hash): %s", target_path)
         stats.skipped_already_exists += 1
@@ -1287,6 +1463,10 @@ def _decode_sidecar_data(meta: MetadataEntry) -> tuple[bytes | str, bool]:
     if fmt == "base64":
         return base64.b64decode(data), True
     if fmt == "lines":
+        if isinstance(data, list) and _encodes_as_plain_utf8(enc):
+            # Nothing for _apply_text_encoding to rewrite: encode each line
+            # and join the bytes, without building the joined str first.
+            return b"\n".join(str(line).encode("utf-8") for line in data), True
         text = "\n".join(str(line) for line in data) if isinstance(data, list) else str(data)
         return _apply_text_encoding(text, enc), True
 
@@ -1309,7 +1489,7 @@ def _restore_json(data: Any, attrs: MetadataAttributes) -> str:
             if "\t" in json_indent:
                 # json.dumps does not natively support tab indentation.
                 # Serialize with a placeholder indent, then replace.
-                compact = json.dumps(data, indent=2, ensure_ascii=False)
+                compact = _dumps_json(data, pretty=True)
                 lines = compact.split("\n")
                 result_lines = []
                 for line in lines:
@@ -1318,20 +1498,87 @@ def _restore_json(data: Any, attrs: MetadataAttributes) -> str:
                     n_levels = n_spaces // 2
                     result_lines.append(json_indent * n_levels + stripped)
                 return "\n".join(result_lines)
-            else:
+            elif json_indent != "  ":
                 # Space-based indent: pass the indent width directly.
                 return json.dumps(
                     data,
                     indent=len(json_indent),
                     ensure_ascii=False,
                 )
-        # Legacy entry without json_indent: default to 2-space.
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        # 2-space indent, or a legacy entry without json_indent.
+        return _dumps_json(data, pretty=True)
 
     # Compact (default, backward-compatible).
+    return _dumps_json(data, pretty=False)
+
+
+def _dumps_json(data: Any, *, pretty: bool) -> str:
+    """Serialize *data* compactly, or pretty-printed with a 2-space indent.
+
+    Output is identical to ``json.dumps(..., ensure_ascii=False)`` with
+    ``separators=(",", ":")`` (compact) or ``indent=2`` (pretty).  orjson
+    is used when installed and *data* holds nothing it would render
+    differently (see :func:`_orjson_renders_exactly`).
+    """
+    if _HAS_ORJSON and orjson is not None and _orjson_renders_exactly(data):
+        try:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            return raw.decode("utf-8")
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
     return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
 
+def _orjson_renders_exactly(data: Any) -> bool:
+    """Return ``True`` if orjson serializes *data* exactly as :mod:`json` does.
+
+    The two differ for non-finite floats, floats below 1e-4 (orjson avoids
+    exponent notation there), integers outside the 64-bit range, and
+    non-string object keys.  Anything beyond plain JSON types is refused.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            stack.extend(value.values())
+        elif kind is list:
+            stack.extend(value)
+        elif kind is float:
+            if value and not 1e-4 <= abs(value) < math.inf:
+                return False
+        elif kind is int:
+            if not -(1 << 63) <= value < (1 << 64):
+                return False
+        elif kind is not str and kind is not bool and value is not None:
+            return False
+    return True
+
+
+# Detected charsets whose _apply_text_encoding() output is plain UTF-8
+# (ASCII text is UTF-8, and non-ASCII text falls back to UTF-8 anyway).
+_PLAIN_UTF8_ENCODINGS = frozenset({"utf-8", "utf8", "ascii"})
+
+
+def _encodes_as_plain_utf8(enc: EncodingObject | None) -> bool:
+    """Return ``True`` if :func:`_apply_text_encoding` would just UTF-8 encode."""
+    if enc is None:
+        return True
+    return (
+        enc.line_endings != "crlf"
+        and enc.bom is None
+        and (
+            enc.detected_encoding is None or enc.detected_encoding.lower() in _PLAIN_UTF8_ENCODINGS
+        )
+    )
+
+
 def _apply_text_encoding(
     text: str,
     enc: EncodingObject | None,
@@ -1406,17 +1653,13 @@ def execute_rollback(
     result = RollbackResult()
 
     # Sort actions by execution phase
-    mkdir_actions = [a for a in plan.actions if a.action_type == "mkdir" and not a.skip_reason]
-    restore_actions = [a for a in plan.actions if a.action_type == "restore" and not a.skip_reason]
-    dup_actions = [
-        a for a in plan.actions if a.action_type == "duplicate_restore" and not a.skip_reason
-    ]
-    sidecar_actions = [
-        a for a in plan.actions if a.action_type == "sidecar_restore" and not a.skip_reason
-    ]
-    skipped_actions = [a for a in plan.actions if a.skip_reason]
-
-    result.skipped = len(skipped_actions)
+    buckets = plan.by_type()
+    mkdir_actions = buckets["mkdir"]
+    restore_actions = buckets["restore"]
+    dup_actions = buckets["duplicate_restore"]
+    sidecar_actions = buckets["sidecar_restore"]
+
+    result.skipped = len(buckets["skipped"])
 
     total_actionable = (
         len(mkdir_actions) + len(restore_actions) + len(dup_actions) + len(sidecar_actions)
@@ -1426,8 +1669,8 @@ def execute_rollback(
     # Phase 1: create directories (deepest-first → sort by depth descending,
     # but we actually need shallowest-first for creation)
     mkdir_actions.sort(key=lambda a: len(a.target_path.parts))
-    for action in mkdir_actions:
-        if _check_cancelled(cancel_event, result):
+    for i, action in enumerate(mkdir_actions):
+        if i % _CANCEL_CHECK_INTERVAL == 0 and _check_cancelled(cancel_event, result):
             return result
         completed += 1
         _report_progress(
@@ -1449,39 +1692,62 @@ def execute_rollback(
         except OSError as exc:
             logger.error("Failed to create directory %s: %s", action.target_path, exc)
             result.failed += 1
-            result.errors.append(f"mkdir {action.target_path}: {exc}")
-
-    # Phase 2: restore canonical files
-    for action in restore_actions:
-        if _check_cancelled(cancel_event, result):
-            return result
-        completed += 1
-        _report_progress(
-            progress_callback,
-            "rollback",
-            total_actionable,
-            completed,
-            action.target_path,
+            result.record_error(f"mkdir {action.target_path}: {exc}")
+
+    # Target parents without a mkdir action (the target root itself, and
+    # every target in flat mode) are created once per directory here, so
+    # the per-file copy and sidecar steps never mkdir.
+    if not dry_run:
+        _ensure_parent_dirs(
+            (*restore_actions, *dup_actions, *sidecar_actions),
+            {action.target_path for action in mkdir_actions},
         )
-        _execute_file_copy(action, result, dry_run=dry_run)
 
-    # Phase 3: restore duplicates
-    for action in dup_actions:
+    # Phase 2: restore canonical files; Phase 3: restore duplicates.
+    # Duplicates start only after every canonical copy has finished.
+    for actions, is_duplicate in ((restore_actions, False), (dup_actions, True)):
+        if dry_run or len(actions) <= 1:
+            for i, action in enumerate(actions):
+                if (not dry_run or i % _CANCEL_CHECK_INTERVAL == 0) and _check_cancelled(
+                    cancel_event, result
+                ):
+                    return result
+                completed += 1
+                _report_progress(
+                    progress_callback,
+                    "rollback",
+                    total_actionable,
+                    completed,
+                    action.target_path,
+                )
+                _execute_file_copy(action, result, dry_run=dry_run, is_duplicate=is_duplicate)
+            continue
+
         if _check_cancelled(cancel_event, result):
             return result
-        completed += 1
-        _report_progress(
-            progress_callback,
-            "rollback",
-            total_actionable,
-            completed,
-            action.target_path,
-        )
-        _execute_file_copy(action, result, dry_run=dry_run, is_duplicate=True)
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as pool:
+            futures = {pool.submit(_copy_action, action): action for action in actions}
+            for future in as_completed(futures):
+                action = futures.pop(future)
+                completed += 1
+                _report_progress(
+                    progress_callback,
+                    "rollback",
+                    total_actionable,
+                    completed,
+                    action.target_path,
+                )
+                _record_copy(action, result, future.exception(), is_duplicate=is_duplicate)
+                if _check_cancelled(cancel_event, result):
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    _record_finished_copies(futures, result, is_duplicate=is_duplicate)
+                    return result
 
     # Phase 4: restore sidecars
-    for action in sidecar_actions:
-        if _check_cancelled(cancel_event, result):
+    for i, action in enumerate(sidecar_actions):
+        if (not dry_run or i % _CANCEL_CHECK_INTERVAL == 0) and _check_cancelled(
+            cancel_event, result
+        ):
             return result
         completed += 1
         _report_progress(
@@ -1506,6 +1772,19 @@ def execute_rollback(
     return result
 
 
+def _ensure_parent_dirs(actions: Iterable[RollbackAction], ready: set[Path]) -> None:
+    """Create each distinct target parent of *actions* not already in *ready*.
+
+    Failures are only logged: the affected copies then fail on their own
+    and are reported per file.
+    """
+    for parent in {action.target_path.parent for action in actions} - ready:
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            logger.debug("Failed to create directory %s: %s", parent, exc)
+
+
 def _check_cancelled(
     cancel_event: threading.Event | None,
     result: RollbackResult,
@@ -1571,28 +1850,73 @@ def _execute_file_copy(
         return
 
     try:
-        # Ensure parent exists
-        action.target_path.parent.mkdir(parents=True, exist_ok=True)
+        _copy_action(action)
+    except OSError as exc:
+        _record_copy(action, result, exc, is_duplicate=is_duplicate)
+    else:
+        _record_copy(action, result, None, is_duplicate=is_duplicate)
 
-        # Copy file
-        shutil.copy2(str(action.source_path), str(action.target_path))
 
-        # Restore timestamps
-        _restore_timestamps(action.target_path, action.entry.timestamps)
+def _copy_action(action: RollbackAction) -> None:
+    """Perform the filesystem work for one restore or duplicate-restore action.
 
-        if is_duplicate:
-            canonical_name = _canonical_storage_name(action.entry)
-            logger.info(
-                "Duplicate restored: %s → %s (copy of %s)",
-                name_text,
-                action.target_path,
-                canonical_name,
-            )
-            result.duplicates_restored += 1
-        else:
-            logger.info("Restored: %s → %s", name_text, action.target_path)
-            result.restored += 1
-    except OSError as exc:
+    Safe to run on a worker thread: it touches only the action's own target
+    and leaves all logging and :class:`RollbackResult` bookkeeping to
+    :func:`_record_copy` on the calling thread.
+
+    The target's parent directory must already exist; :func:`execute_rollback`
+    creates every parent before the copy phases start.
+
+    Raises:
+        OSError: If the copy fails.
+    """
+    # Copy file
+    _copy_file(action.source_path, action.target_path)  # type: ignore[arg-type]
+
+    # Restore timestamps
+    _restore_timestamps(action.target_path, action.entry.timestamps)
+
+
+def _record_finished_copies(
+    futures: dict[Future[None], RollbackAction],
+    result: RollbackResult,
+    *,
+    is_duplicate: bool,
+) -> None:
+    """Record the copies that ran despite a cancellation.
+
+    After ``shutdown(cancel_futures=True)`` the copies that were already
+    running have finished and written their targets, so each is recorded
+    like any other copy.  Futures cancelled before they started are
+    skipped.  A non-``OSError`` failure is re-raised once every finished
+    copy has been recorded.
+    """
+    unexpected: BaseException | None = None
+    for future, action in futures.items():
+        if future.cancelled() or not future.done():
+            continue
+        try:
+            _record_copy(action, result, future.exception(), is_duplicate=is_duplicate)
+        except BaseException as exc:
+            if unexpected is None:
+                unexpected = exc
+    if unexpected is not None:
+        raise unexpected
+
+
+def _record_copy(
+    action: RollbackAction,
+    result: RollbackResult,
+    exc: BaseException | None,
+    *,
+    is_duplicate: bool = False,
+) -> None:
+    """Log the outcome of a file copy and update *result* accordingly."""
+    name_text = action.entry.name.text or action.entry.attributes.storage_name
+
+    if exc is not None:
+        if not isinstance(exc, OSError):
+            raise exc
         logger.error(
             "Failed to restore %s → %s: %s",
             name_text,
@@ -1600,7 +1924,80 @@ def _execute_file_copy(
             exc,
         )
         result.failed += 1
-        result.errors.append(f"restore {name_text} → {action.target_path}: {exc}")
+        result.record_error(f"restore {name_text} → {action.target_path}: {exc}")
+        return
+
+    if is_duplicate:
+        canonical_name = _canonical_storage_name(action.entry)
+        logger.info(
+            "Duplicate restored: %s → %s (copy of %s)",
+            name_text,
+            action.target_path,
+            canonical_name,
+        )
+        result.duplicates_restored += 1
+    else:
+        logger.info("Restored: %s → %s", name_text, action.target_path)
+        result.restored += 1
+
+
+def _copy_file(source: Path, target: Path) -> None:
+    """Copy *source* to *target*, including permission bits.
+
+    The single copy primitive behind restore and duplicate-restore actions.
+    Where ``os.copy_file_range`` exists (Linux) the content is copied
+    in-kernel — a reflink on filesystems that support it — followed by a
+    plain ``chmod``; ``shutil.copy2``'s ``copystat`` step is skipped because
+    timestamps are set separately by :func:`_restore_timestamps` from the
+    sidecar values.  Elsewhere, or when the kernel refuses the call before
+    any data is copied, falls back to ``shutil``.
+    """
+    if not _HAS_COPY_FILE_RANGE:
+        shutil.copy2(str(source), str(target))
+        return
+    if not _copy_file_range(source, target):
+        shutil.copyfile(str(source), str(target))
+        shutil.copymode(str(source), str(target))
+
+
+def _copy_file_range(source: Path, target: Path) -> bool:
+    """Copy file content and permission bits with ``os.copy_file_range``.
+
+    Both files are opened with raw ``os.open`` descriptors, and the mode is
+    copied with ``fstat``/``fchmod`` on those descriptors, so neither path is
+    resolved again after opening.
+
+    Returns ``False`` — with *target* created but possibly empty — when the
+    kernel or filesystem cannot service the call and nothing was copied yet,
+    so the caller can retry with a userspace copy.  Errors after a partial
+    copy propagate.
+    """
+    in_fd = os.open(source, os.O_RDONLY)
+    try:
+        out_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            copied = 0
+            while True:
+                try:
+                    n = os.copy_file_range(in_fd, out_fd, _COPY_FILE_RANGE_CHUNK)
+                except OSError as exc:
+                    if copied == 0 and exc.errno in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                        return False
+                    raise
+                if n == 0:
+                    break
+                copied += n
+            st = os.fstat(in_fd)
+            # Some pseudo/network filesystems report EOF immediately
+            # instead of failing; only trust that for empty sources.
+            if copied == 0 and st.st_size != 0:
+                return False
+            os.fchmod(out_fd, stat.S_IMODE(st.st_mode))
+            return True
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
 
 
 def _execute_sidecar_write(
@@ -1613,7 +2010,7 @@ def _execute_sidecar_write(
     payload = action.legacy_payload
     if payload is None:
         result.failed += 1
-        result.errors.append(f"legacy sidecar restore {action.target_path}: missing payload")
+        result.record_error(f"legacy sidecar restore {action.target_path}: missing payload")
         return
 
     sidecar_name = (
@@ -1632,15 +2029,10 @@ def _execute_sidecar_write(
         return
 
     try:
-        action.target_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if payload.is_binary:
-            action.target_path.write_bytes(payload.data)  # type: ignore[arg-type]
-        else:
-            action.target_path.write_text(
-                str(payload.data),
-                encoding="utf-8",
-            )
+        data = payload.data
+        if not payload.is_binary or isinstance(data, str):
+            data = str(data).encode("utf-8")
+        _write_file_bytes(action.target_path, data)
 
         # Restore timestamps if the metadata entry has them
         if payload.metadata_entry.timestamps:
@@ -1656,7 +2048,23 @@ def _execute_sidecar_write(
             exc,
         )
         result.failed += 1
-        result.errors.append(f"sidecar {sidecar_name} → {action.target_path}: {exc}")
+        result.record_error(f"sidecar {sidecar_name} → {action.target_path}: {exc}")
+
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Create or truncate *path* and write *data* through raw fd syscalls.
+
+    Bypasses the ``open()`` buffered-I/O wrappers: the payload is already a
+    single in-memory ``bytes`` object, so it is handed to ``os.write`` via a
+    ``memoryview`` (looping only on short writes) without another copy.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 def _set_windows_creation_time(path: Path, ctime_seconds: float) -> bool:
@@ -1728,11 +2136,12 @@ def _set_windows_creation_time(path: Path, ctime_seconds: float) -> bool:
 def _restore_timestamps(path: Path, timestamps: TimestampsObject) -> None:
     """Set atime/mtime from sidecar timestamps.  Attempt ctime on Windows."""
     try:
-        # Sidecar timestamps are millisecond Unix timestamps; os.utime
-        # expects seconds.
-        atime = timestamps.accessed.unix / 1000
-        mtime = timestamps.modified.unix / 1000
-        os.utime(path, (atime, mtime))
+        # Sidecar timestamps are millisecond Unix timestamps.  Scale them
+        # to nanoseconds in integer arithmetic so the restored times are
+        # exact, rather than whatever a float seconds value rounds to.
+        atime_ns = timestamps.accessed.unix * 1_000_000
+        mtime_ns = timestamps.modified.unix * 1_000_000
+        os.utime(path, ns=(atime_ns, mtime_ns))
     except OSError as exc:
         logger.error("Failed to set timestamps on %s: %s", path, exc)
         return
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
 import logging
+import re
 import tomllib
 from collections import defaultdict
 from dataclasses import dataclass
@@ -15,6 +17,8 @@ from shruggie_indexer.exceptions import IndexerConfigError
 from shruggie_indexer.models.schema import IndexEntry, PredicateResult, RelationshipAnnotation
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from shruggie_indexer.config.types import IndexerConfig, SidecarRuleConfig
 
 __all__ = [
@@ -138,8 +142,15 @@ def _final_stem(filename: str) -> str:
     return PurePosixPath(filename).stem
 
 
+@functools.lru_cache(maxsize=4096)
+def _compile_pattern(pattern: str) -> Callable[[str], re.Match[str] | None]:
+    # Lowercased once per distinct pattern; fnmatchcase() would redo the
+    # lowering and its own cache lookup on every call.
+    return re.compile(fnmatch.translate(pattern.lower())).match
+
+
 def _matches_pattern(pattern: str, filename: str) -> bool:
-    return fnmatch.fnmatchcase(filename.lower(), pattern.lower())
+    return _compile_pattern(pattern)(filename.lower()) is not None
 
 
 def _resolve_pattern(pattern: str, stem: str | None) -> str:
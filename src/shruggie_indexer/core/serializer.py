@@ -17,10 +17,13 @@ See spec section 6.9 for full behavioral guidance.
 
 from __future__ import annotations
 
+import codecs
+import contextlib
 import json
 import logging
+import os
 import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, TextIO
 
 from shruggie_indexer.core.paths import build_sidecar_path
 
@@ -56,7 +59,18 @@ except ImportError:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-# Canonical key order matching IndexEntry.to_dict() output.
+# Windows needs O_BINARY on os.open() to avoid newline translation.
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Outputs at least this large (aggregate indexes, directory sidecars with
+# many children) have their full extent reserved up front, so the
+# filesystem can lay the file out contiguously instead of growing it write
+# by write.  Per-file sidecars stay well below this and skip the syscall.
+_PREALLOCATE_THRESHOLD = 1024 * 1024
+_HAS_POSIX_FALLOCATE = hasattr(os, "posix_fallocate")
+
+# Canonical top-level key order.  IndexEntry.to_dict() emits its keys in
+# this order directly; the serializer relies on that rather than re-ordering.
 _TOP_LEVEL_KEY_ORDER: tuple[str, ...] = (
     "schema_version",
     "id",
@@ -78,44 +92,36 @@ _TOP_LEVEL_KEY_ORDER: tuple[str, ...] = (
 )
 
 
-def _clean_none_sha512(obj: Any) -> Any:
-    """Recursively remove ``sha512`` keys whose value is ``None``.
+def _prepare_dict(entry: IndexEntry) -> dict[str, Any]:
+    """Convert an ``IndexEntry`` to a JSON-ready dict.
 
-    The v2 schema specifies that ``sha512`` is omitted (not emitted as
-    ``null``) when not computed.  ``HashSet.to_dict()`` already handles this,
-    but this function acts as a safety net for any dict produced outside
-    ``to_dict()`` (e.g. via ``dataclasses.asdict()``).
+    ``IndexEntry.to_dict()`` already emits keys in
+    :data:`_TOP_LEVEL_KEY_ORDER` and omits ``sha512`` when it was not
+    computed (``HashSet.to_dict()``), so the dict is used as-is with no
+    re-ordering or cleaning pass.  Embedded sidecar ``data`` is therefore
+    emitted verbatim, including any ``sha512: null`` of its own.
     """
-    if isinstance(obj, dict):
-        return {
-            k: _clean_none_sha512(v) for k, v in obj.items() if not (k == "sha512" and v is None)
-        }
-    if isinstance(obj, list):
-        return [_clean_none_sha512(item) for item in obj]
-    return obj
+    return entry.to_dict()
 
 
-def _order_dict(d: dict[str, Any]) -> dict[str, Any]:
-    """Re-order a top-level entry dict so ``schema_version`` comes first.
+def _utf8_stdout_buffer(stream: TextIO) -> BinaryIO | None:
+    """Return *stream*'s binary buffer if UTF-8 bytes can bypass its encoder.
 
-    Keys present in :data:`_TOP_LEVEL_KEY_ORDER` are placed first in order;
-    any remaining keys follow in their original order.
+    That holds when the text layer would encode to UTF-8 and write ``\n``
+    unchanged (no newline translation, i.e. not Windows).  Streams without
+    a ``buffer`` (``StringIO``, some IDE consoles) return ``None`` and are
+    written as text.
     """
-    ordered: dict[str, Any] = {}
-    for key in _TOP_LEVEL_KEY_ORDER:
-        if key in d:
-            ordered[key] = d[key]
-    for key in d:
-        if key not in ordered:
-            ordered[key] = d[key]
-    return ordered
-
-
-def _prepare_dict(entry: IndexEntry) -> dict[str, Any]:
-    """Convert an ``IndexEntry`` to a JSON-ready, cleaned, and ordered dict."""
-    raw = entry.to_dict()
-    cleaned = _clean_none_sha512(raw)
-    return _order_dict(cleaned)
+    buffer = getattr(stream, "buffer", None)
+    encoding = getattr(stream, "encoding", None)
+    if buffer is None or encoding is None or os.linesep != "\n":
+        return None
+    try:
+        if codecs.lookup(encoding).name != "utf-8":
+            return None
+    except LookupError:
+        return None
+    return buffer
 
 
 # ---------------------------------------------------------------------------
@@ -143,17 +149,63 @@ def serialize_entry(
     Returns:
         UTF-8 JSON string.
     """
+    return _dumps(entry, compact=compact).decode("utf-8")
+
+
+def _dumps(
+    entry: IndexEntry,
+    *,
+    compact: bool = False,
+    newline: bool = False,
+) -> bytes:
+    """Serialize an ``IndexEntry`` to UTF-8 JSON bytes.
+
+    The bytes form of :func:`serialize_entry`, used by the file writers so
+    that orjson's output reaches disk without a decode/encode round trip.
+    When *newline* is true a trailing ``\n`` is appended.
+    """
     prepared = _prepare_dict(entry)
 
     if _HAS_ORJSON and orjson is not None:
         opts = orjson.OPT_NON_STR_KEYS
         if not compact:
             opts |= orjson.OPT_INDENT_2
-        return orjson.dumps(prepared, option=opts).decode("utf-8")
+        if newline:
+            opts |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(prepared, option=opts)
 
     if compact:
-        return json.dumps(prepared, ensure_ascii=False, separators=(",", ":"))
-    return json.dumps(prepared, ensure_ascii=False, indent=2)
+        text = json.dumps(prepared, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(prepared, ensure_ascii=False, indent=2)
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def _write_json_bytes(path: Path, data: bytes) -> None:
+    """Write serialized JSON *data* to *path*.
+
+    Newlines are translated to ``os.linesep``, as ``Path.write_text`` does,
+    so files are byte-identical to the earlier text-mode output.  JSON
+    strings never contain a raw newline byte, so the translation only
+    touches line breaks.
+    """
+    if os.linesep != "\n":
+        data = data.replace(b"\n", os.linesep.encode("ascii"))
+    # Raw descriptor I/O: the payload is a single in-memory buffer, so the
+    # buffered file object that write_bytes() builds around it is overhead.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        if len(data) >= _PREALLOCATE_THRESHOLD and _HAS_POSIX_FALLOCATE:
+            # Unsupported filesystems just allocate as the write proceeds.
+            with contextlib.suppress(OSError):
+                os.posix_fallocate(fd, 0, len(data))
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 def write_output(
@@ -170,15 +222,21 @@ def write_output(
         entry: The completed entry tree.
         config: Resolved configuration with output routing flags.
     """
-    json_str = serialize_entry(entry)
+    data = _dumps(entry, newline=True)
 
     if config.output_stdout:
-        sys.stdout.write(json_str)
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        stdout = sys.stdout
+        buffer = _utf8_stdout_buffer(stdout)
+        if buffer is not None:
+            stdout.flush()
+            buffer.write(data)
+            buffer.flush()
+        else:
+            stdout.write(data.decode("utf-8"))
+            stdout.flush()
 
     if config.output_file is not None:
-        config.output_file.write_text(json_str + "\n", encoding="utf-8")
+        _write_json_bytes(config.output_file, data)
         logger.info("Output written to %s", config.output_file)
 
 
@@ -198,6 +256,5 @@ def write_inplace(
         item_type: ``"file"`` or ``"directory"``.
     """
     sidecar_path = build_sidecar_path(item_path, item_type)
-    json_str = serialize_entry(entry)
-    sidecar_path.write_text(json_str + "\n", encoding="utf-8")
+    _write_json_bytes(sidecar_path, _dumps(entry, newline=True))
     logger.debug("Inplace sidecar written to %s", sidecar_path)
@@ -30,11 +30,13 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import mmap
+import os
 import re
 from typing import TYPE_CHECKING, Any
 
 from shruggie_indexer.config.defaults import DEFAULT_METADATA_IDENTIFY_STRINGS
-from shruggie_indexer.core.hashing import hash_file, hash_string, select_id
+from shruggie_indexer.core.hashing import hash_bytes, hash_file, hash_string, select_id
 from shruggie_indexer.models.schema import (
     EncodingObject,
     MetadataAttributes,
@@ -54,6 +56,10 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Binary sidecars at least this large are Base64-encoded from a memory map
+# instead of from a full read into memory.
+_MMAP_BASE64_THRESHOLD = 64 * 1024
+
 
 _LEGACY_METADATA_IDENTIFY: dict[str, tuple[re.Pattern[str], ...]] = {
     type_name: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
@@ -136,33 +142,65 @@ def _read_text_with_encoding(
 # Format-specific readers
 # ---------------------------------------------------------------------------
 
+# Text-family sidecars are read into memory once (see _read_sidecar_bytes);
+# the readers below, encoding detection, and content hashing all work from
+# that buffer instead of each reopening the file.
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode sidecar bytes exactly as ``Path.read_text(encoding="utf-8")``.
+
+    Strict UTF-8 (a BOM is kept) with universal-newline translation.
+    """
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
-def _read_json(path: Path) -> Any:
-    """Read and parse a JSON file.
+
+def _read_json(raw: bytes) -> Any:
+    """Parse sidecar bytes as JSON.
 
     Returns the parsed JSON value, or raises on failure.
     """
-    text = path.read_text(encoding="utf-8")
-    return json.loads(text)
+    return json.loads(_decode_text(raw))
 
 
-def _read_text(path: Path) -> str:
-    """Read a file as UTF-8 text."""
-    return path.read_text(encoding="utf-8")
+def _read_text(raw: bytes) -> str:
+    """Decode sidecar bytes as UTF-8 text."""
+    return _decode_text(raw)
 
 
-def _read_lines(path: Path) -> list[str]:
-    """Read a file and return non-empty lines."""
-    text = path.read_text(encoding="utf-8")
-    return [line for line in text.splitlines() if line.strip()]
+def _read_lines(raw: bytes) -> list[str]:
+    """Decode sidecar bytes and return non-empty lines."""
+    return [line for line in _decode_text(raw).splitlines() if line.strip()]
 
 
-def _read_binary_base64(path: Path) -> str:
-    """Read a file as binary and encode to Base64 ASCII string."""
-    return base64.b64encode(path.read_bytes()).decode("ascii")
+def _encode_base64(raw: bytes) -> str:
+    """Encode sidecar bytes to a Base64 ASCII string."""
+    return base64.b64encode(raw).decode("ascii")
 
 
-def _read_url_as_text(path: Path) -> tuple[Any, str, list[str]]:
+def _read_binary_base64(path: Path) -> str:
+    """Read a file as binary and encode to Base64 ASCII string.
+
+    Files of at least ``_MMAP_BASE64_THRESHOLD`` bytes are encoded straight
+    from a read-only memory map, so the raw content is never copied into a
+    ``bytes`` object alongside its (larger) encoding.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_BASE64_THRESHOLD:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+            else:
+                with mapped:
+                    return base64.b64encode(mapped).decode("ascii")
+        return base64.b64encode(f.read()).decode("ascii")
+
+
+def _read_url_as_text(path: Path, raw: bytes) -> tuple[Any, str, list[str]]:
     """Read a ``.url`` file through the text cascade.
 
     Stores the full file content verbatim (including the
@@ -170,9 +208,9 @@ def _read_url_as_text(path: Path) -> tuple[Any, str, list[str]]:
     This preserves Windows shortcut functionality on rollback.
     """
     try:
-        data = _read_text(path)
+        data = _read_text(raw)
         return data, "text", []
-    except (OSError, UnicodeDecodeError) as exc:
+    except UnicodeDecodeError as exc:
         logger.warning("Failed to read .url sidecar %s: %s", path, exc)
         return None, "error", []
 
@@ -234,9 +272,40 @@ _FALLBACK_CHAIN_TYPES: frozenset[str] = frozenset(
     }
 )
 
+# Types whose content is always stored as Base64.  These are encoded
+# straight from the file (see _read_binary_base64) rather than read into
+# memory up front, since screenshots and thumbnails can be large.
+_BINARY_TYPES: frozenset[str] = frozenset({"screenshot", "thumbnail", "torrent"})
+
+# Matches detect_file_encoding()'s default charset sample size, so that
+# detecting on an in-memory buffer sees the same bytes.
+_ENCODING_SAMPLE_SIZE = 65_536
+
+
+def _reads_from_path(path: Path, sidecar_type: str) -> bool:
+    """Return ``True`` for sidecars read straight from disk as Base64."""
+    return sidecar_type in _BINARY_TYPES or (
+        sidecar_type == "link" and path.suffix.lower() == ".lnk"
+    )
+
+
+def _read_sidecar_bytes(path: Path, sidecar_type: str) -> bytes | None:
+    """Read a text-family sidecar's content in a single read.
+
+    Returns ``None`` for Base64-only sidecars (see :func:`_reads_from_path`)
+    and when the file cannot be read.
+    """
+    if _reads_from_path(path, sidecar_type):
+        return None
+    try:
+        return path.read_bytes()
+    except OSError as exc:
+        logger.warning("Failed to read sidecar %s: %s", path, exc)
+        return None
+
 
 def _detect_text_encoding(
-    path: Path,
+    raw: bytes,
     fmt: str,
     config: IndexerConfig,
 ) -> EncodingObject | None:
@@ -251,10 +320,10 @@ def _detect_text_encoding(
     if not config.detect_encoding:
         return None
 
-    from shruggie_indexer.core.encoding import detect_file_encoding
+    from shruggie_indexer.core.encoding import detect_bytes_encoding
 
-    return detect_file_encoding(
-        path,
+    return detect_bytes_encoding(
+        raw[:_ENCODING_SAMPLE_SIZE],
         detect_charset_enabled=config.detect_charset,
     )
 
@@ -263,6 +332,7 @@ def _read_with_fallback(
     path: Path,
     sidecar_type: str,
     config: IndexerConfig,
+    raw: bytes | None,
 ) -> tuple[Any, str, list[str], dict[str, Any] | None, EncodingObject | None]:
     """Read a sidecar file using the type-appropriate strategy.
 
@@ -280,56 +350,66 @@ def _read_with_fallback(
         path: Absolute path to the sidecar file.
         sidecar_type: The detected sidecar type.
         config: Active configuration.
+        raw: The sidecar's content from :func:`_read_sidecar_bytes`.
 
     Returns:
         A 5-tuple of ``(data, format_name, transforms, extra_attrs, encoding)``.
     """
+    # --- Base64-only types, read from the file itself ---
+    if sidecar_type in _BINARY_TYPES:
+        data, fmt, transforms = _read_type_binary(path)
+        return data, fmt, transforms, None, None
+
+    if sidecar_type == "link" and path.suffix.lower() == ".lnk":
+        data, fmt, transforms, extra = _read_type_lnk(path)
+        return data, fmt, transforms, extra, None
+
+    if raw is None:
+        return None, "error", [], None, None
+
     metadata_attributes = getattr(config, "metadata_attributes", {})
     type_attrs = metadata_attributes.get(sidecar_type)
 
     # --- Fallback chain types: JSON → text → binary ---
     if sidecar_type in _FALLBACK_CHAIN_TYPES:
-        data, fmt, transforms = _read_fallback_chain(path, type_attrs)
-        extra = _detect_json_style_extra(path, fmt)
-        enc = _detect_text_encoding(path, fmt, config)
+        data, fmt, transforms = _read_fallback_chain(path, raw, type_attrs)
+        extra = _detect_json_style_extra(raw, fmt)
+        enc = _detect_text_encoding(raw, fmt, config)
         return data, fmt, transforms, extra, enc
 
     # --- Type-specific readers ---
     if sidecar_type == "json_metadata":
-        data, fmt, transforms = _read_type_json_metadata(path)
-        extra = _detect_json_style_extra(path, fmt)
-        enc = _detect_text_encoding(path, fmt, config)
+        data, fmt, transforms = _read_type_json_metadata(path, raw)
+        extra = _detect_json_style_extra(raw, fmt)
+        enc = _detect_text_encoding(raw, fmt, config)
         return data, fmt, transforms, extra, enc
 
     if sidecar_type == "hash":
-        data, fmt, transforms = _read_type_hash(path)
-        enc = _detect_text_encoding(path, fmt, config)
+        data, fmt, transforms = _read_type_hash(path, raw)
+        enc = _detect_text_encoding(raw, fmt, config)
         return data, fmt, transforms, None, enc
 
     if sidecar_type == "link":
-        data, fmt, transforms, extra = _read_type_link(path)
-        enc = _detect_text_encoding(path, fmt, config)
-        return data, fmt, transforms, extra, enc
+        data, fmt, transforms = _read_type_link(path, raw)
+        enc = _detect_text_encoding(raw, fmt, config)
+        return data, fmt, transforms, None, enc
 
     if sidecar_type == "desktop_ini":
-        data, fmt, transforms = _read_type_desktop_ini(path)
-        enc = _detect_text_encoding(path, fmt, config)
+        data, fmt, transforms = _read_type_desktop_ini(raw)
+        enc = _detect_text_encoding(raw, fmt, config)
         return data, fmt, transforms, None, enc
 
-    if sidecar_type in ("screenshot", "thumbnail", "torrent"):
-        data, fmt, transforms = _read_type_binary(path)
-        return data, fmt, transforms, None, None
-
     # Unknown type — try fallback chain.
     logger.debug("Unknown sidecar type %r — using fallback chain", sidecar_type)
-    data, fmt, transforms = _read_fallback_chain(path, type_attrs)
-    extra = _detect_json_style_extra(path, fmt)
-    enc = _detect_text_encoding(path, fmt, config)
+    data, fmt, transforms = _read_fallback_chain(path, raw, type_attrs)
+    extra = _detect_json_style_extra(raw, fmt)
+    enc = _detect_text_encoding(raw, fmt, config)
     return data, fmt, transforms, extra, enc
 
 
 def _read_fallback_chain(
     path: Path,
+    raw: bytes,
     type_attrs: Any | None,
 ) -> tuple[Any, str, list[str]]:
     """Execute the JSON → text → binary fallback chain.
@@ -344,33 +424,29 @@ def _read_fallback_chain(
     # Step 1: JSON
     if expect_json:
         try:
-            data = _read_json(path)
+            data = _read_json(raw)
             return data, "json", ["json_compact"]
-        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        except (json.JSONDecodeError, UnicodeDecodeError):
             pass
 
     # Step 2: Text
     if expect_text:
         try:
-            data = _read_text(path)
+            data = _read_text(raw)
             return data, "text", []
-        except (OSError, UnicodeDecodeError):
+        except UnicodeDecodeError:
             pass
 
     # Step 3: Binary
     if expect_binary:
-        try:
-            data = _read_binary_base64(path)
-            return data, "base64", ["base64_encode"]
-        except OSError:
-            pass
+        return _encode_base64(raw), "base64", ["base64_encode"]
 
     # All failed.
     logger.warning("All read strategies failed for sidecar: %s", path)
     return None, "error", []
 
 
-def _detect_json_indent(path: Path) -> tuple[str, str | None]:
+def _detect_json_indent(raw: bytes) -> tuple[str, str | None]:
     """Detect JSON formatting style and indent string.
 
     Returns (json_style, json_indent) where:
@@ -384,12 +460,12 @@ def _detect_json_indent(path: Path) -> tuple[str, str | None]:
     no indented lines, it is compact.
     """
     try:
-        raw = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+        text = _decode_text(raw)
+    except UnicodeDecodeError:
         return "compact", None
 
     # Find first indented line.
-    for line in raw.split("\n")[1:]:  # Skip first line (opening brace).
+    for line in text.split("\n")[1:]:  # Skip first line (opening brace).
         if line and line[0] in (" ", "\t"):
             # Extract the indent: all leading whitespace.
             indent = ""
@@ -404,7 +480,7 @@ def _detect_json_indent(path: Path) -> tuple[str, str | None]:
 
 
 def _detect_json_style_extra(
-    path: Path,
+    raw: bytes,
     fmt: str,
 ) -> dict[str, Any] | None:
     """Return extra attributes dict with ``json_style`` and ``json_indent``.
@@ -413,83 +489,69 @@ def _detect_json_style_extra(
     """
     if fmt != "json":
         return None
-    style, indent = _detect_json_indent(path)
+    style, indent = _detect_json_indent(raw)
     result: dict[str, Any] = {"json_style": style}
     if indent is not None:
         result["json_indent"] = indent
     return result
 
 
-def _read_type_json_metadata(path: Path) -> tuple[Any, str, list[str]]:
+def _read_type_json_metadata(path: Path, raw: bytes) -> tuple[Any, str, list[str]]:
     """Read a json_metadata sidecar (JSON only, no fallback)."""
     try:
-        data = _read_json(path)
+        data = _read_json(raw)
         return data, "json", ["json_compact"]
-    except (json.JSONDecodeError, OSError, UnicodeDecodeError) as exc:
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         logger.warning("Failed to parse JSON metadata sidecar %s: %s", path, exc)
         return None, "error", []
 
 
-def _read_type_hash(path: Path) -> tuple[Any, str, list[str]]:
+def _read_type_hash(path: Path, raw: bytes) -> tuple[Any, str, list[str]]:
     """Read a hash sidecar (non-empty lines)."""
     try:
-        lines = _read_lines(path)
+        lines = _read_lines(raw)
         return lines, "lines", []
-    except (OSError, UnicodeDecodeError) as exc:
+    except UnicodeDecodeError as exc:
         logger.warning("Failed to read hash sidecar %s: %s", path, exc)
         return None, "error", []
 
 
-def _read_type_link(path: Path) -> tuple[Any, str, list[str], dict[str, Any] | None]:
-    """Read a link sidecar.
-
-    ``.url`` files use the text cascade (full content preserved).
-    ``.lnk`` files use base64 encoding with optional metadata extraction.
-    Other link files use text → binary fallback.
+def _read_type_lnk(path: Path) -> tuple[Any, str, list[str], dict[str, Any]]:
+    """Read a ``.lnk`` link sidecar (base64 + optional metadata).
 
     Returns ``(data, format, transforms, extra_attrs)`` where
-    ``extra_attrs`` is a dict of additional ``MetadataAttributes`` fields
-    (e.g. ``link_metadata``, overridden ``type``) or ``None``.
+    ``extra_attrs`` overrides the ``type`` and may carry
+    ``link_metadata``.
     """
-    suffix = path.suffix.lower()
+    data, fmt, transforms, link_meta = _read_lnk_with_metadata(path)
+    extra: dict[str, Any] = {"type_override": "shortcut"}
+    if link_meta is not None:
+        extra["link_metadata"] = link_meta
+    return data, fmt, transforms, extra
 
-    if suffix == ".url":
-        data, fmt, transforms = _read_url_as_text(path)
-        return data, fmt, transforms, None
 
-    if suffix == ".lnk":
-        data, fmt, transforms, link_meta = _read_lnk_with_metadata(path)
-        extra: dict[str, Any] = {"type_override": "shortcut"}
-        if link_meta is not None:
-            extra["link_metadata"] = link_meta
-        return data, fmt, transforms, extra
+def _read_type_link(path: Path, raw: bytes) -> tuple[Any, str, list[str]]:
+    """Read a non-``.lnk`` link sidecar.
+
+    ``.url`` files use the text cascade (full content preserved).
+    Other link files use text → binary fallback.
+    """
+    if path.suffix.lower() == ".url":
+        return _read_url_as_text(path, raw)
 
     # Generic link files — try text, then binary.
     try:
-        data = _read_text(path)
-        return data, "text", [], None
+        return _read_text(raw), "text", []
     except (UnicodeDecodeError, ValueError):
-        pass
-    try:
-        data = _read_binary_base64(path)
-        return data, "base64", ["base64_encode"], None
-    except OSError as exc:
-        logger.warning("Failed to read link sidecar %s: %s", path, exc)
-        return None, "error", [], None
+        return _encode_base64(raw), "base64", ["base64_encode"]
 
 
-def _read_type_desktop_ini(path: Path) -> tuple[Any, str, list[str]]:
+def _read_type_desktop_ini(raw: bytes) -> tuple[Any, str, list[str]]:
     """Read a desktop.ini sidecar (text, binary fallback)."""
     try:
-        data = _read_text(path)
-        return data, "text", []
-    except (OSError, UnicodeDecodeError):
-        try:
-            data = _read_binary_base64(path)
-            return data, "base64", ["base64_encode"]
-        except OSError as exc:
-            logger.warning("Failed to read desktop.ini sidecar %s: %s", path, exc)
-            return None, "error", []
+        return _read_text(raw), "text", []
+    except UnicodeDecodeError:
+        return _encode_base64(raw), "base64", ["base64_encode"]
 
 
 def _read_type_binary(path: Path) -> tuple[Any, str, list[str]]:
@@ -548,6 +610,7 @@ def _build_metadata_entry(
     *,
     extra_attrs: dict[str, Any] | None = None,
     encoding: EncodingObject | None = None,
+    raw: bytes | None = None,
 ) -> MetadataEntry:
     """Construct a complete ``MetadataEntry`` from a parsed sidecar.
 
@@ -564,6 +627,8 @@ def _build_metadata_entry(
             fields.  Supported keys: ``json_style``, ``link_metadata``,
             ``type_override`` (overrides the ``type`` field on the
             constructed attributes).
+        raw: The sidecar's content, when already read; hashed in memory
+            instead of re-reading the file.
 
     Returns:
         A fully populated ``MetadataEntry``.
@@ -573,11 +638,14 @@ def _build_metadata_entry(
     if config.compute_sha512:
         algorithms = ("md5", "sha256", "sha512")
 
-    try:
-        file_hashes = hash_file(sidecar_path, algorithms=algorithms)
-    except OSError:
-        # If we can't hash the file, use name hashes.
-        file_hashes = hash_string(sidecar_path.name, algorithms=algorithms)
+    if raw is not None:
+        file_hashes = hash_bytes(raw, algorithms=algorithms)
+    else:
+        try:
+            file_hashes = hash_file(sidecar_path, algorithms=algorithms)
+        except OSError:
+            # If we can't hash the file, use name hashes.
+            file_hashes = hash_string(sidecar_path.name, algorithms=algorithms)
 
     # Identity: "y" + digest selected by configured algorithm.
     entry_id = select_id(file_hashes, config.id_algorithm, "y")
@@ -673,11 +741,6 @@ def discover_and_parse(
     item_path_resolved = item_path.resolve() if item_path.exists() else item_path
 
     for sibling_path in siblings:
-        # Skip the item itself.
-        sibling_resolved = sibling_path.resolve() if sibling_path.exists() else sibling_path
-        if sibling_resolved == item_path_resolved:
-            continue
-
         sibling_name = sibling_path.name
 
         # Check exclusion patterns first.
@@ -696,6 +759,13 @@ def discover_and_parse(
         if sidecar_type is None:
             continue
 
+        # Skip the item itself.  Checked only for sidecar candidates: the
+        # exists()/resolve() pair costs several syscalls, and most siblings
+        # are rejected by the name checks above.
+        sibling_resolved = sibling_path.resolve() if sibling_path.exists() else sibling_path
+        if sibling_resolved == item_path_resolved:
+            continue
+
         logger.debug(
             "Sidecar discovered: %s (type=%s) for item %s",
             sibling_name,
@@ -706,11 +776,14 @@ def discover_and_parse(
         if sidecar_entry_cache is not None and sibling_path in sidecar_entry_cache:
             entry = sidecar_entry_cache[sibling_path]
         else:
-            # Read the sidecar content using the type-specific strategy.
+            # Read the sidecar once, then parse it using the type-specific
+            # strategy.
+            raw = _read_sidecar_bytes(sibling_path, sidecar_type)
             data, fmt, transforms, extra_attrs, enc = _read_with_fallback(
                 sibling_path,
                 sidecar_type,
                 config,
+                raw,
             )
 
             # Build the MetadataEntry.
@@ -724,6 +797,7 @@ def discover_and_parse(
                 config=config,
                 extra_attrs=extra_attrs,
                 encoding=enc,
+                raw=raw,
             )
             if sidecar_entry_cache is not None:
                 sidecar_entry_cache[sibling_path] = entry
@@ -16,12 +16,12 @@ round-trip parsing, and ``Date2UnixTime`` is eliminated entirely.
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
+import os
+import time
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    import os
 
 from shruggie_indexer.models.schema import TimestampPair, TimestampsObject
 
@@ -34,36 +34,51 @@ logger = logging.getLogger(__name__)
 # Track whether we've already logged the st_birthtime fallback warning.
 _birthtime_fallback_logged: bool = False
 
+# Whether this platform's os.stat_result has st_birthtime (Windows, macOS,
+# the BSDs).  It is a property of the platform, not of individual files,
+# so it is probed once here instead of per stat result.
+_HAS_BIRTHTIME = hasattr(os.stat_result, "st_birthtime")
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
+def _creation_from_birthtime(stat_result: os.stat_result) -> tuple[float, str]:
+    """Return ``(st_birthtime, "birthtime")``."""
+    return stat_result.st_birthtime, "birthtime"  # type: ignore[attr-defined]
+
+
+def _creation_from_ctime(stat_result: os.stat_result) -> tuple[float, str]:
+    """Return ``(st_ctime, "ctime_fallback")``, logging the fallback once."""
+    global _birthtime_fallback_logged
+
+    if not _birthtime_fallback_logged:
+        logger.debug(
+            "st_birthtime unavailable on this platform; "
+            "using st_ctime as creation time approximation"
+        )
+        _birthtime_fallback_logged = True
+    return stat_result.st_ctime, "ctime_fallback"
+
+
+_creation_time_and_source = _creation_from_birthtime if _HAS_BIRTHTIME else _creation_from_ctime
+
+
 def _get_creation_time(stat_result: os.stat_result) -> float:
     """Return the best available creation timestamp.
 
-    Attempts ``st_birthtime`` first (available on Windows, macOS, and
-    Linux kernel 4.11+ with Python 3.12+).  Falls back to ``st_ctime``
-    (which is the inode change time on Linux/macOS, but the creation time
-    on Windows).
+    Uses ``st_birthtime`` where the platform provides it (Windows, macOS,
+    and the BSDs).  Elsewhere falls back to ``st_ctime``, which is the inode
+    change time on Linux but the creation time on Windows.
 
     See §15.5 — Creation Time Portability.
     """
-    global _birthtime_fallback_logged
-
-    try:
-        return stat_result.st_birthtime  # type: ignore[attr-defined]
-    except AttributeError:
-        if not _birthtime_fallback_logged:
-            logger.debug(
-                "st_birthtime unavailable on this platform; "
-                "using st_ctime as creation time approximation"
-            )
-            _birthtime_fallback_logged = True
-        return stat_result.st_ctime
+    return _creation_time_and_source(stat_result)[0]
 
 
+@functools.lru_cache(maxsize=4096)
 def _stat_to_iso(timestamp_float: float) -> str:
     """Convert a stat timestamp float to an ISO 8601 string.
 
@@ -74,9 +89,45 @@ def _stat_to_iso(timestamp_float: float) -> str:
     ``datetime`` provides 6 digits (microseconds).  This is an acceptable
     deviation — the 7th digit is always zero in practice for filesystem
     timestamps.
+
+    Memoized on the exact float: an item's three timestamps frequently
+    coincide, and so do the mtimes of files written together (extracted
+    archives, build outputs), so repeat values skip the formatting work.
+
+    Formatted from a ``time.localtime()`` struct instead of building an
+    aware ``datetime``; the microsecond rounding (half-even) and offset
+    rendering mirror ``datetime.fromtimestamp(...).astimezone().isoformat()``,
+    which remains the fallback outside years 1000-9999.
     """
-    dt = datetime.fromtimestamp(timestamp_float, tz=UTC).astimezone()
-    return dt.isoformat(timespec="microseconds")
+    frac, whole = math.modf(timestamp_float)
+    micros = round(frac * 1_000_000)
+    seconds = int(whole)
+    if micros >= 1_000_000:
+        seconds += 1
+        micros -= 1_000_000
+    elif micros < 0:
+        seconds -= 1
+        micros += 1_000_000
+    try:
+        t = time.localtime(seconds)
+    except (OverflowError, OSError, ValueError):
+        t = None
+    # strftime's %Y is not zero-padded everywhere, so four-digit years only.
+    if t is None or not 1000 <= t.tm_year <= 9999:
+        dt = datetime.fromtimestamp(timestamp_float, tz=UTC).astimezone()
+        return dt.isoformat(timespec="microseconds")
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', t)}.{micros:06d}{_format_utc_offset(t.tm_gmtoff)}"
+
+
+@functools.lru_cache(maxsize=64)
+def _format_utc_offset(offset_seconds: int) -> str:
+    """Render a UTC offset the way ``datetime.isoformat()`` does (``+HH:MM[:SS]``)."""
+    sign = "-" if offset_seconds < 0 else "+"
+    hours, rest = divmod(abs(offset_seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    if secs:
+        return f"{sign}{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{sign}{hours:02d}:{minutes:02d}"
 
 
 def _stat_to_unix_ms(timestamp_float: float) -> int:
@@ -111,7 +162,7 @@ def extract_timestamps(
     Returns:
         A fully populated ``TimestampsObject``.
     """
-    creation_time = _get_creation_time(stat_result)
+    creation_time, created_source = _creation_time_and_source(stat_result)
 
     accessed = TimestampPair(
         iso=_stat_to_iso(stat_result.st_atime),
@@ -126,14 +177,6 @@ def extract_timestamps(
         unix=_stat_to_unix_ms(stat_result.st_mtime),
     )
 
-    # Determine creation time provenance.
-    created_source: str | None = None
-    try:
-        _ = stat_result.st_birthtime  # type: ignore[attr-defined]
-        created_source = "birthtime"
-    except AttributeError:
-        created_source = "ctime_fallback"
-
     return TimestampsObject(
         accessed=accessed,
         created=created,
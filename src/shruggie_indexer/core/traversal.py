@@ -7,7 +7,10 @@ sorted lists of files and directories.
 This replaces the original's two near-identical traversal paths
 (``MakeDirectoryIndexRecursiveLogic`` / ``MakeDirectoryIndexLogic``) with a
 single ``list_children()`` function (DEV-03).  The caller controls recursion
-depth — this module does not recurse.
+depth — ``list_children()`` does not recurse.  ``scan_children()`` performs
+the same listing but returns names only, deferring ``Path`` construction.
+``walk_tree()`` is provided for callers that only need the listings of a
+whole tree; it runs the per-directory scans on a thread pool.
 
 The exclusion filter set covers Windows, macOS, and Linux filesystem artifacts
 via externalized configuration (DEV-10), replacing the original's hardcoded
@@ -26,26 +29,95 @@ See spec §6.1 for full behavioral guidance.
 from __future__ import annotations
 
 import fnmatch
+import functools
 import logging
 import os
-from typing import TYPE_CHECKING
+import re
+import stat
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, NamedTuple
 
 if TYPE_CHECKING:
-    import re
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Future
     from pathlib import Path
 
     from shruggie_indexer.config.types import IndexerConfig
 
 __all__ = [
+    "ChildEntry",
+    "ScanResult",
+    "iter_children",
     "list_children",
+    "scan_children",
+    "walk_tree",
 ]
 
 logger = logging.getLogger(__name__)
 
+# Directory enumeration is dominated by readdir/stat latency, which releases
+# the GIL, so the walker benefits from more threads than cores.
+_WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Constructs that stop a pattern from being joined into one alternation:
+# backreferences and conditionals depend on group numbering, which changes
+# when patterns are joined, and global inline flags such as ``(?i)`` are
+# only accepted at the very start of an expression.
+_UNJOINABLE_PATTERN_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+class ChildEntry(NamedTuple):
+    """One immediate child of a directory, as yielded by :func:`iter_children`."""
+
+    name: str
+    kind: Literal["file", "directory"]
+    path: str
+    """Full path as a string; no ``Path`` object is built."""
+
+
+@dataclass(slots=True)
+class ScanResult:
+    """Names of the children of one directory, as found by :func:`scan_children`.
+
+    Only the name strings are stored; ``Path`` objects are built on demand
+    by :attr:`files` and :attr:`directories`, so callers that only need
+    names never pay for them.
+    """
+
+    directory: Path
+    file_names: list[str]
+    """File names, sorted case-insensitively."""
+    dir_names: list[str]
+    """Directory names, sorted case-insensitively."""
+    linked_dir_names: frozenset[str] = frozenset()
+    """Entries of :attr:`dir_names` that are symlinks to directories."""
+
+    @property
+    def files(self) -> list[Path]:
+        """Absolute paths of the files, in :attr:`file_names` order."""
+        return self._paths(self.file_names)
+
+    @property
+    def directories(self) -> list[Path]:
+        """Absolute paths of the directories, in :attr:`dir_names` order."""
+        return self._paths(self.dir_names)
+
+    def _paths(self, names: list[str]) -> list[Path]:
+        # Calling the path class directly skips the joinpath() and
+        # with_segments() layers that ``directory / name`` goes through.
+        directory = self.directory
+        cls = type(directory)
+        return [cls(directory, n) for n in names]
+
 
 def list_children(
     directory: Path,
     config: IndexerConfig,
+    *,
+    cache_ttl: float = 0.0,
 ) -> tuple[list[Path], list[Path]]:
     """Enumerate immediate children of a directory.
 
@@ -61,6 +133,9 @@ def list_children(
     Args:
         directory: Absolute path to the directory to enumerate.
         config: The active :class:`~shruggie_indexer.config.types.IndexerConfig`.
+        cache_ttl: Seconds for which an unchanged directory's listing may
+            be reused; see :func:`scan_children`.  ``0`` (the default)
+            disables caching.
 
     Returns:
         A ``(files, directories)`` tuple.  Each list is sorted
@@ -71,16 +146,123 @@ def list_children(
         PermissionError: If the directory cannot be opened.
         OSError: If ``os.scandir()`` fails for the directory.
     """
-    files: list[Path] = []
-    directories: list[Path] = []
+    result = scan_children(directory, config, cache_ttl=cache_ttl)
+    return result.files, result.directories
+
+
+def scan_children(
+    directory: Path,
+    config: IndexerConfig,
+    *,
+    cache_ttl: float = 0.0,
+) -> ScanResult:
+    """Enumerate immediate children of a directory by name.
+
+    Applies the same scan, classification, exclusion filtering and ordering
+    as :func:`list_children`, but returns a :class:`ScanResult` holding only
+    the names, for callers that do not need ``Path`` objects.
 
-    excludes = config.filesystem_excludes
-    exclude_globs = config.filesystem_exclude_globs
+    With a positive *cache_ttl* the listing is memoized on the directory's
+    device, inode and modification time, so rescanning an unchanged
+    directory costs a single ``stat()``.  Entries are reused for at most
+    *cache_ttl* seconds, which bounds staleness on filesystems with coarse
+    mtime resolution.  Caching is off by default.
+
+    Raises:
+        PermissionError: If the directory cannot be opened.
+        OSError: If ``os.scandir()`` fails for the directory.
+    """
+    rules = _traversal_rules(config)
+    if cache_ttl <= 0:
+        return _scan(directory, rules)
+    st = os.stat(directory)
+    cached = _memoized_scan(
+        directory,
+        st.st_dev,
+        st.st_ino,
+        st.st_mtime_ns,
+        rules,
+        int(time.monotonic() // cache_ttl),
+    )
+    # The memoized result is shared; hand out copies of its mutable lists.
+    return ScanResult(
+        directory,
+        list(cached.file_names),
+        list(cached.dir_names),
+        cached.linked_dir_names,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _memoized_scan(
+    directory: Path,
+    st_dev: int,
+    st_ino: int,
+    st_mtime_ns: int,
+    rules: _TraversalRules,
+    ttl_window: int,
+) -> ScanResult:
+    """Scan *directory*, memoized on its stat identity and a TTL window.
+
+    Every argument after *directory* is part of the cache key only: a
+    changed directory (new mtime or inode) or a new TTL window misses.
+    """
+    return _scan(directory, rules)
+
+
+def _scan(directory: Path, rules: _TraversalRules) -> ScanResult:
+    """Scan *directory* using pre-resolved exclusion rules."""
+    # Classification and filtering work on the raw entry names; ``Path``
+    # objects are only built by ScanResult, for the survivors, on request.
+    file_names: list[str] = []
+    dir_names: list[str] = []
+    # Bound once: the loop below appends on every entry.
+    add_file = file_names.append
+    add_dir = dir_names.append
+    linked_dir_names: list[str] = []
+
+    for name, _path, is_dir, is_link in _iter_scan(directory, rules):
+        if not is_dir:
+            add_file(name)
+        else:
+            add_dir(name)
+            if is_link:
+                linked_dir_names.append(name)
+
+    # Sort lexicographically by name, case-insensitive.  ``sort(key=...)``
+    # computes each key once; casefold() also folds characters that lower()
+    # leaves distinct (e.g. "ß" sorts as "ss").
+    file_names.sort(key=str.casefold)
+    dir_names.sort(key=str.casefold)
+
+    return ScanResult(directory, file_names, dir_names, frozenset(linked_dir_names))
+
+
+def _iter_scan(
+    directory: Path,
+    rules: _TraversalRules,
+) -> Iterator[tuple[str, str, bool, bool]]:
+    """Yield ``(name, path, is_dir, is_link)`` for each surviving child.
+
+    Children are yielded in directory order as ``os.scandir()`` returns
+    them, after exclusion filtering and classification.
+    """
+    excludes = rules.excludes
+    exclude_glob_re = rules.exclude_glob_re
+    # ── Layer 1: Exclude indexer output artifacts (always active) ──────
+    # Files matching metadata_exclude_patterns (e.g. _meta.json,
+    # _meta2.json, _meta3.json, _directorymeta3.json) are unconditionally removed.
+    # These are output artifacts from prior indexer runs and must never
+    # be indexed as standalone items.  (Spec §7.5, Batch 6 Section 1.)
+    is_meta_artifact = rules.is_meta_artifact
+    meta_excluded = 0
 
     with os.scandir(directory) as scanner:
         for entry in scanner:
+            name = entry.name
+
             # --- Exclusion filtering ---
-            name_lower = entry.name.lower()
+            name_lower = name.lower()
 
             # O(1) set membership against lowercased exclusion names.
             if name_lower in excludes:
@@ -88,80 +270,205 @@ def list_children(
                 continue
 
             # Glob pattern matching for pattern-based exclusions.
-            if _matches_glob(name_lower, exclude_globs):
+            if exclude_glob_re is not None and exclude_glob_re.match(name_lower):
                 logger.debug("Excluded by glob filter: %s", entry.path)
                 continue
 
             # --- Classification ---
             try:
                 if entry.is_file(follow_symlinks=False):
-                    files.append(directory / entry.name)
+                    is_dir = is_link = False
                 elif entry.is_dir(follow_symlinks=False):
-                    directories.append(directory / entry.name)
+                    is_dir, is_link = True, False
                 elif entry.is_symlink():
                     # Symlink that is neither file nor directory when not
-                    # following links.  Classify by resolving the target type.
+                    # following links.  Classify by resolving the target
+                    # once and testing its mode; dangling links and
+                    # special targets are treated as files.
+                    is_link = True
                     try:
-                        if entry.is_file(follow_symlinks=True):
-                            files.append(directory / entry.name)
-                        elif entry.is_dir(follow_symlinks=True):
-                            directories.append(directory / entry.name)
-                        else:
-                            # Dangling or unresolvable symlink — treat as file.
-                            files.append(directory / entry.name)
+                        is_dir = stat.S_ISDIR(entry.stat(follow_symlinks=True).st_mode)
                     except OSError:
-                        # Dangling symlink — treat as file.
-                        files.append(directory / entry.name)
+                        is_dir = False
                 else:
                     # Special file (socket, device, etc.) — skip silently.
                     logger.debug("Skipping special file: %s", entry.path)
+                    continue
             except OSError as exc:
                 logger.warning(
                     "Cannot classify entry %s — skipping: %s",
                     entry.path,
                     exc,
                 )
+                continue
 
-    # ── Layer 1: Exclude indexer output artifacts (always active) ──────
-    # Files matching metadata_exclude_patterns (e.g. _meta.json,
-    # _meta2.json, _meta3.json, _directorymeta3.json) are unconditionally removed.
-    # These are output artifacts from prior indexer runs and must never
-    # be indexed as standalone items.  (Spec §7.5, Batch 6 Section 1.)
-    exclude_meta = config.metadata_exclude_patterns
-    if exclude_meta:
-        pre_count = len(files)
-        files = [f for f in files if not _matches_metadata_exclude(f.name, exclude_meta)]
-        excluded = pre_count - len(files)
-        if excluded:
-            logger.debug(
-                "Excluded %d file(s) by metadata_exclude_patterns in %s",
-                excluded,
-                directory,
-            )
-
-    # Sort lexicographically by name, case-insensitive.
-    files.sort(key=lambda p: p.name.lower())
-    directories.sort(key=lambda p: p.name.lower())
-
-    return files, directories
-
-
-def _matches_glob(name_lower: str, patterns: tuple[str, ...]) -> bool:
-    """Test a lowercased name against glob exclusion patterns.
-
-    Uses ``fnmatch.fnmatch()`` with lowercased patterns for case-insensitive
-    matching.
+            if not is_dir and is_meta_artifact is not None and is_meta_artifact(name):
+                meta_excluded += 1
+                continue
+
+            yield name, entry.path, is_dir, is_link
+
+    if meta_excluded:
+        logger.debug(
+            "Excluded %d file(s) by metadata_exclude_patterns in %s",
+            meta_excluded,
+            directory,
+        )
+
+
+def iter_children(
+    directory: Path,
+    config: IndexerConfig,
+    *,
+    sort: bool = True,
+) -> Iterator[ChildEntry]:
+    """Yield the immediate children of a directory without building Paths.
+
+    Applies the same classification and exclusion filtering as
+    :func:`list_children`.  With *sort* (the default) files are yielded
+    first, then directories, each in :func:`list_children` order.  With
+    ``sort=False`` children are streamed in directory order as they are
+    read, so a very large directory is never held in memory at once.
+
+    Raises:
+        PermissionError: If the directory cannot be opened.
+        OSError: If ``os.scandir()`` fails for the directory.
     """
-    return any(fnmatch.fnmatch(name_lower, pattern.lower()) for pattern in patterns)
+    rules = _traversal_rules(config)
+    if not sort:
+        for name, path, is_dir, _is_link in _iter_scan(directory, rules):
+            yield ChildEntry(name, "directory" if is_dir else "file", path)
+        return
+    result = _scan(directory, rules)
+    base = os.fspath(directory)
+    join = os.path.join
+    for name in result.file_names:
+        yield ChildEntry(name, "file", join(base, name))
+    for name in result.dir_names:
+        yield ChildEntry(name, "directory", join(base, name))
+
+
+def walk_tree(
+    root: Path,
+    config: IndexerConfig,
+    *,
+    max_workers: int | None = None,
+) -> Iterator[tuple[Path, list[Path], list[Path]]]:
+    """Enumerate every directory below *root* with parallel listings.
+
+    Yields one ``(directory, files, directories)`` tuple per directory,
+    where ``files`` and ``directories`` are exactly what
+    :func:`list_children` returns for it.  Listings are submitted to a
+    thread pool as soon as their parent has been listed, so on high-latency
+    filesystems several directories are read concurrently; results are
+    still yielded in breadth-first order, so the output is deterministic.
+
+    Like ``os.walk()``, symlinked directories are reported in their parent's
+    ``directories`` list but are not descended into.  Directories that
+    cannot be listed are logged and skipped.
 
+    Args:
+        root: Absolute path to the directory to walk.
+        config: The active :class:`~shruggie_indexer.config.types.IndexerConfig`.
+        max_workers: Thread pool size.  Defaults to four threads per CPU,
+            capped at 32.
+
+    Yields:
+        ``(directory, files, directories)`` tuples, starting with *root*.
+    """
+    rules = _traversal_rules(config)
+    pool = ThreadPoolExecutor(max_workers=max_workers or _WALK_WORKERS)
+    pending: deque[tuple[Path, Future[ScanResult]]] = deque()
+    try:
+        pending.append((root, pool.submit(_scan, root, rules)))
+        while pending:
+            directory, future = pending.popleft()
+            try:
+                result = future.result()
+            except OSError as exc:
+                logger.warning("Cannot list directory %s — skipping: %s", directory, exc)
+                continue
+            files = result.files
+            directories = result.directories
+            # The scan already knows which directories are links, so no
+            # per-child lstat() is needed to decide whether to descend.
+            linked = result.linked_dir_names
+            for name, child in zip(result.dir_names, directories, strict=True):
+                if name not in linked:
+                    pending.append((child, pool.submit(_scan, child, rules)))
+            yield directory, files, directories
+    finally:
+        # An abandoned generator should not keep listing the rest of the tree.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass(frozen=True, slots=True)
+class _TraversalRules:
+    """Exclusion rules resolved from an ``IndexerConfig`` for one scan.
+
+    Built once per :func:`scan_children` call, or once per
+    :func:`walk_tree` for all of its directories, so the scan loop reads
+    slots instead of looking up and compiling configuration per directory.
+    """
+
+    excludes: frozenset[str]
+    exclude_glob_re: re.Pattern[str] | None
+    is_meta_artifact: Callable[[str], object] | None
 
-def _matches_metadata_exclude(
-    filename: str,
+
+def _traversal_rules(config: IndexerConfig) -> _TraversalRules:
+    """Resolve the traversal exclusion rules of *config*."""
+    return _TraversalRules(
+        excludes=config.filesystem_excludes,
+        exclude_glob_re=_compile_exclude_globs(config.filesystem_exclude_globs),
+        is_meta_artifact=_compile_metadata_excludes(config.metadata_exclude_patterns),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_exclude_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile glob exclusion patterns into a single regular expression.
+
+    Each pattern is lowercased and translated with ``fnmatch.translate()``,
+    and the alternatives are joined so a name is tested with one regex match
+    instead of one ``fnmatch.fnmatch()`` call per pattern.  The result is
+    cached per pattern tuple, so ``list_children()`` compiles it once per
+    configuration rather than once per directory.  Returns ``None`` when
+    there are no patterns.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p.lower())})" for p in patterns))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_metadata_excludes(
     exclude_patterns: tuple[re.Pattern[str], ...],
-) -> bool:
-    """Check whether a filename matches any metadata exclusion pattern.
+) -> Callable[[str], object] | None:
+    """Build a single matcher for the metadata exclusion patterns.
 
     Layer 1 filter: removes indexer output artifacts (_meta.json,
     _meta2.json, _meta3.json, _directorymeta3.json, etc.) unconditionally.
+
+    When the patterns share their flags and use no named groups, group
+    references or global inline flags (which would clash, be renumbered or
+    be rejected mid-expression), they are joined into one regex so each
+    filename is searched once.  Otherwise the patterns are tried in turn.
+    Cached per pattern tuple, so the join happens once per configuration
+    rather than once per directory.  Returns ``None`` when there are no
+    patterns.
     """
-    return any(pattern.search(filename) for pattern in exclude_patterns)
+    if not exclude_patterns:
+        return None
+    flags = {p.flags for p in exclude_patterns}
+    if len(flags) == 1 and not any(
+        p.groupindex or _UNJOINABLE_PATTERN_RE.search(p.pattern) for p in exclude_patterns
+    ):
+        combined = "|".join(f"(?:{p.pattern})" for p in exclude_patterns)
+        try:
+            return re.compile(combined, flags.pop()).search
+        except re.error:
+            # Each pattern compiled on its own; fall back to matching them
+            # separately rather than failing every directory scan.
+            pass
+    return lambda filename: any(p.search(filename) for p in exclude_patterns)
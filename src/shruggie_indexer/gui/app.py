@@ -4271,6 +4271,8 @@ class ShruggiIndexerApp(ctk.CTk):
                 summary_parts.append("Errors:")
                 for err in rb_result.errors:
                     summary_parts.append(f"  - {err}")
+                if rb_result.errors_truncated:
+                    summary_parts.append(f"  ... and {rb_result.errors_truncated} more")
             summary_text = "\n".join(summary_parts)
 
             if rb_result.failed > 0:
@@ -4334,7 +4336,7 @@ class ShruggiIndexerApp(ctk.CTk):
         _is_root: bool = True,
         write_directory_meta: bool = True,
     ) -> None:
-        """Recursively write in-place sidecar files for an entry tree.
+        """Write in-place sidecar files for an entry tree.
 
         The root directory entry is skipped because its in-place sidecar
         (written inside the target) duplicates the aggregate output file
@@ -4344,21 +4346,20 @@ class ShruggiIndexerApp(ctk.CTk):
         directory sidecars (``_idxd.json``) are suppressed.  Per-file sidecars
         are unaffected.
         """
-        if entry.type == "file":
-            item_path = root_path / entry.file_system.relative
-            write_inplace(entry, item_path, "file")
-        elif entry.type == "directory":
-            if not _is_root and write_directory_meta:
-                dir_path = root_path / entry.file_system.relative
-                write_inplace(entry, dir_path, "directory")
-            if entry.items:
-                for child in entry.items:
-                    ShruggiIndexerApp._write_inplace_tree(
-                        child,
-                        root_path,
-                        _is_root=False,
-                        write_directory_meta=write_directory_meta,
-                    )
+        # Explicit stack (children pushed in reverse) keeps the recursive
+        # walk's depth-first order without its recursion limit.
+        stack: list[tuple[Any, bool]] = [(entry, _is_root)]
+        while stack:
+            node, is_root = stack.pop()
+            if node.type == "file":
+                item_path = root_path / node.file_system.relative
+                write_inplace(node, item_path, "file")
+            elif node.type == "directory":
+                if not is_root and write_directory_meta:
+                    dir_path = root_path / node.file_system.relative
+                    write_inplace(node, dir_path, "directory")
+                if node.items:
+                    stack.extend((child, False) for child in reversed(node.items))
 
     @staticmethod
     def _rename_tree(
@@ -9,6 +9,7 @@ See spec sections 5.2-5.10 and 9.4 for full behavioral guidance.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
@@ -35,7 +36,7 @@ __all__ = [
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class HashSet:
     """Cryptographic hash digests (§5.2.1).
 
@@ -60,7 +61,7 @@ class HashSet:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class NameObject:
     """Name with associated hash digests (§5.2.2).
 
@@ -74,10 +75,13 @@ class NameObject:
     hashes: HashSet | None
     """Hash digests of the UTF-8 bytes of *text*, or ``None``."""
 
-    def __post_init__(self) -> None:
-        """Enforce co-nullability invariant."""
-        if (self.text is None) != (self.hashes is None):
+    def __init__(self, text: str | None, hashes: HashSet | None) -> None:
+        # Hand-written rather than generated so the co-nullability check
+        # runs inline, without a separate __post_init__ call per name.
+        if (text is None) != (hashes is None):
             raise ValueError("NameObject.text and .hashes must be co-null")
+        self.text = text
+        self.hashes = hashes
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -86,7 +90,7 @@ class NameObject:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SizeObject:
     """File size in human-readable and machine-readable forms (§5.2.3).
 
@@ -103,7 +107,7 @@ class SizeObject:
         return {"text": self.text, "bytes": self.bytes}
 
 
-@dataclass
+@dataclass(slots=True)
 class TimestampPair:
     """Single timestamp in ISO 8601 and Unix millisecond forms (§5.2.4)."""
 
@@ -281,15 +285,17 @@ class MetadataAttributes:
     """
 
     def to_dict(self) -> dict[str, Any]:
+        # The list and dict are handed to the encoder as-is; to_dict() output
+        # is only ever serialized, so defensive copies would be wasted work.
         d: dict[str, Any] = {
             "type": self.type,
             "format": self.format,
-            "transforms": list(self.transforms),
+            "transforms": self.transforms,
         }
         if self.source_media_type is not None:
             d["source_media_type"] = self.source_media_type
         if self.link_metadata is not None:
-            d["link_metadata"] = dict(self.link_metadata)
+            d["link_metadata"] = self.link_metadata
         return d
 
 
@@ -310,7 +316,7 @@ class MetadataEntry:
     """Metadata content — JSON object, string, array, or ``None``."""
 
     def to_dict(self) -> dict[str, Any]:
-        d: dict[str, Any] = {
+        return {
             "id": self.id,
             "origin": self.origin,
             "name": self.name.to_dict(),
@@ -318,7 +324,6 @@ class MetadataEntry:
             "attributes": self.attributes.to_dict(),
             "data": self.data,
         }
-        return d
 
 
 @dataclass(frozen=True)
@@ -424,11 +429,26 @@ class IndexEntry:
     indexed_at: TimestampPair | None = None
     """Timestamp when this entry was constructed by the indexer."""
 
+    def __post_init__(self) -> None:
+        """Intern the low-cardinality string fields.
+
+        ``type``, ``id_algorithm``, ``extension`` and ``mime_type`` take a
+        handful of distinct values across an entire index, so every entry
+        shares one string object per value instead of holding its own copy.
+        """
+        self.type = sys.intern(self.type)
+        self.id_algorithm = sys.intern(self.id_algorithm)
+        if self.extension is not None:
+            self.extension = sys.intern(self.extension)
+        if self.mime_type is not None:
+            self.mime_type = sys.intern(self.mime_type)
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a JSON-ready dict.
 
-        Field ordering follows the canonical schema: ``schema_version`` is
-        placed first for readability.
+        Keys are emitted directly in the canonical schema order
+        (``schema_version`` first, ``encoding`` after ``attributes``), so the
+        result needs no re-ordering before it is written out.
         """
         d: dict[str, Any] = {
             "schema_version": self.schema_version,
@@ -443,19 +463,17 @@ class IndexEntry:
             "file_system": self.file_system.to_dict(),
             "timestamps": self.timestamps.to_dict(),
             "attributes": self.attributes.to_dict(),
-            "items": ([item.to_dict() for item in self.items] if self.items is not None else None),
-            "metadata": (
-                [m.to_dict() for m in self.metadata] if self.metadata is not None else None
-            ),
         }
-        if self.relationships is not None:
-            d["relationships"] = [rel.to_dict() for rel in self.relationships]
-        if self.duplicates:
-            d["duplicates"] = [dup.to_dict() for dup in self.duplicates]
         if self.schema_version >= 3 and self.encoding is not None:
             enc_dict = self.encoding.to_dict()
             if enc_dict:  # Only include if at least one field is populated
                 d["encoding"] = enc_dict
+        d["items"] = [item.to_dict() for item in self.items] if self.items is not None else None
+        d["metadata"] = [m.to_dict() for m in self.metadata] if self.metadata is not None else None
+        if self.relationships is not None:
+            d["relationships"] = [rel.to_dict() for rel in self.relationships]
+        if self.duplicates:
+            d["duplicates"] = [dup.to_dict() for dup in self.duplicates]
         if self.session_id is not None:
             d["session_id"] = self.session_id
         if self.indexed_at is not None:
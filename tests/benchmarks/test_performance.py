@@ -12,6 +12,7 @@ See §14.7 for the full specification.
 
 from __future__ import annotations
 
+import os
 import time
 from pathlib import Path
 
@@ -191,7 +192,8 @@ def test_bench_sidecar_discovery(tmp_path: Path, default_config: IndexerConfig)
         (root / f"{stem}.info.json").write_text('{"key": "val"}', encoding="utf-8")
         (root / f"{stem}.srt").write_text("1\n00:00:01 --> 00:00:02\nhi", encoding="utf-8")
 
-    siblings = list(root.iterdir())
+    with os.scandir(root) as it:
+        siblings = [Path(e.path) for e in it if e.is_file(follow_symlinks=False)]
     primaries = [p for p in siblings if p.suffix == ".mp4"]
 
     start = time.perf_counter()
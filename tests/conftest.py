@@ -6,10 +6,10 @@ full test specification.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pytest
 
 from shruggie_indexer.config.loader import load_config
@@ -19,36 +19,36 @@ from shruggie_indexer.config.types import IndexerConfig
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 
 
-@pytest.fixture()
-def sample_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def _shared_files_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide directory holding the read-only content fixtures below.
+
+    Tests receiving ``sample_file`` or ``empty_file`` must not modify the
+    file or write siblings next to it — copy it into ``tmp_path`` first when
+    a test needs a writable location.
+    """
+    return tmp_path_factory.mktemp("shared_files", numbered=False)
+
+
+@pytest.fixture(scope="session")
+def sample_file(_shared_files_dir: Path) -> Path:
     """Create a temporary file with known content for hashing tests.
 
-    Content: ``b"hello world"`` (11 bytes).
+    Content: ``b"hello world"`` (11 bytes).  Session-scoped and read-only.
     """
-    p = tmp_path / "sample.txt"
+    p = _shared_files_dir / "sample.txt"
     p.write_bytes(b"hello world")
     return p
 
 
-@pytest.fixture()
-def empty_file(tmp_path: Path) -> Path:
-    """Create a zero-byte temporary file."""
-    p = tmp_path / "empty.bin"
+@pytest.fixture(scope="session")
+def empty_file(_shared_files_dir: Path) -> Path:
+    """Create a zero-byte temporary file.  Session-scoped and read-only."""
+    p = _shared_files_dir / "empty.bin"
     p.write_bytes(b"")
     return p
 
 
-@pytest.fixture()
-def large_file(tmp_path: Path) -> Path:
-    """Create a file larger than the 64 KB chunk size.
-
-    Content: 128 KB of repeating ``b"A"`` bytes.
-    """
-    p = tmp_path / "large.bin"
-    p.write_bytes(b"A" * (128 * 1024))
-    return p
-
-
 @pytest.fixture()
 def sample_tree(tmp_path: Path) -> Path:
     """Create a small directory tree for traversal and path tests.
@@ -96,7 +96,7 @@ def mock_exiftool(monkeypatch: pytest.MonkeyPatch) -> None:
 def exiftool_response() -> dict[str, Any]:
     """Load the exe exiftool response fixture as a parsed dict."""
     fixture = FIXTURES_DIR / "exiftool_responses" / "exe_response.json"
-    data = json.loads(fixture.read_text(encoding="utf-8"))
+    data = orjson.loads(fixture.read_bytes())
     return data[0]
 
 
@@ -0,0 +1,27 @@
+"""Shared helpers for shruggie-indexer tests.
+
+Plain functions that test modules import directly; fixtures live in
+``conftest.py``.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from shruggie_indexer.config.loader import load_config
+from shruggie_indexer.config.types import IndexerConfig
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_config(items: frozenset[tuple[str, object]]) -> IndexerConfig:
+    return load_config(overrides=dict(items))  # type: ignore[arg-type]
+
+
+def cached_config(**overrides: object) -> IndexerConfig:
+    """Return the config for *overrides*, loading it once per override set.
+
+    ``IndexerConfig`` is frozen, so a single instance can safely be shared
+    by every test that asks for the same overrides.  Override values must
+    be hashable.
+    """
+    return _cached_config(frozenset(overrides.items()))
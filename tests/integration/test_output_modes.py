@@ -58,10 +58,13 @@ class TestOutputModes:
 
     def test_inplace_creates_sidecar(
         self,
-        sample_file: Path,
+        tmp_path: Path,
         mock_exiftool: None,
     ) -> None:
         """write_inplace creates a _idx.json sidecar alongside the file."""
+        # The shared sample_file fixture is read-only; write next to a copy.
+        sample_file = tmp_path / "sample.txt"
+        sample_file.write_bytes(b"hello world")
         config = _cfg()
         entry = index_path(sample_file, config)
 
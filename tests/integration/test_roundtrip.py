@@ -11,6 +11,7 @@ and rollback supports legacy v2/v3 sidecar formats.
 from __future__ import annotations
 
 import json
+import os
 import shutil
 from pathlib import Path
 
@@ -37,6 +38,15 @@ def _cfg(**overrides: object):
     return load_config(overrides=overrides)
 
 
+def _files_under(root: Path) -> list[Path]:
+    """List regular files below *root*.
+
+    ``os.walk`` classifies entries from scandir's cached dirent types, so
+    unlike ``rglob("*")`` followed by ``is_file()`` it needs no stat per path.
+    """
+    return [Path(dirpath, name) for dirpath, _dirs, names in os.walk(root) for name in names]
+
+
 def _write_inplace_tree(entry, root, write_fn, *, write_directory_meta=True):
     """Mirror the CLI's _write_inplace_tree helper for test use."""
     if entry.type == "file":
@@ -131,7 +141,7 @@ class TestIndexRenameRollbackRoundtrip:
             cleanup_duplicate_files(dedup_actions, run_dir, dry_run=False)
 
         # ── 4. Assert: content files have been hash-renamed ─────────
-        all_files = [f for f in run_dir.rglob("*") if f.is_file() and not f.name.endswith(".json")]
+        all_files = [f for f in _files_under(run_dir) if not f.name.endswith(".json")]
         renamed_files = [f for f in all_files if f.name.startswith("y")]
         assert len(renamed_files) > 0, "Expected hash-renamed files (y* prefix)"
 
@@ -152,7 +162,7 @@ class TestIndexRenameRollbackRoundtrip:
 
         # ── 7. Assert: duplicates have been removed ─────────────────
         # Only one of the two identical images should remain
-        png_files = [f for f in run_dir.rglob("*.png") if f.is_file()]
+        png_files = [f for f in _files_under(run_dir) if f.suffix == ".png"]
         assert len(png_files) == 1, f"Expected 1 PNG after dedup, got {len(png_files)}"
 
         # ── 8. Assert: v4 sidecar files use new suffix ──────────────
@@ -12,9 +12,9 @@ from pathlib import Path
 
 import pytest
 
-from shruggie_indexer.config.loader import load_config
 from shruggie_indexer.core.entry import index_path
 from shruggie_indexer.core.traversal import list_children
+from tests.helpers import cached_config
 
 # ── Fixture paths ───────────────────────────────────────────────────────
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
@@ -35,13 +35,13 @@ def sidecar_testbed(tmp_path: Path) -> Path:
 @pytest.fixture()
 def default_config():
     """Default config (relationship detection enabled)."""
-    return load_config()
+    return cached_config()
 
 
 @pytest.fixture()
 def no_sidecar_detection_config():
     """Config that disables relationship classification."""
-    return load_config(overrides={"no_sidecar_detection": True})
+    return cached_config(no_sidecar_detection=True)
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────
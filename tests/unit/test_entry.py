@@ -5,31 +5,25 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
 import sys
 import threading
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from shruggie_indexer.config.loader import load_config
-from shruggie_indexer.config.types import IndexerConfig
 from shruggie_indexer.core.entry import (
     build_directory_entry,
     build_file_entry,
+    cleanup_stale_metadata,
 )
 from shruggie_indexer.exceptions import IndexerCancellationError
 from shruggie_indexer.models.schema import IndexEntry
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def _cfg(**overrides: object) -> IndexerConfig:
-    return load_config(overrides=overrides)  # type: ignore[arg-type]
-
+from tests.helpers import cached_config as _cfg
 
 # ---------------------------------------------------------------------------
 # Tests
@@ -366,3 +360,32 @@ class TestIndexedAtTimestamp:
 
         assert entry.session_id is None
         assert entry.indexed_at is None
+
+
+class TestStaleMetadataCleanup:
+    """Tests for Stage 7 stale-metadata cleanup."""
+
+    def test_unstattable_entry_does_not_abort_directory(self, tmp_path: Path) -> None:
+        """An entry whose is_file() raises is skipped; its siblings are still removed."""
+        (tmp_path / "a.jpg_meta2.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "b.jpg_meta2.json").write_text("{}", encoding="utf-8")
+        real_scandir = os.scandir
+
+        class _Unstattable:
+            def __init__(self, entry: os.DirEntry[str]) -> None:
+                self.name = entry.name
+
+            def is_file(self) -> bool:
+                raise PermissionError("stat denied")
+
+        def fake_scandir(path: Any) -> Any:
+            with real_scandir(path) as it:
+                entries = [e if e.name.startswith("b") else _Unstattable(e) for e in it]
+            return contextlib.nullcontext(entries)
+
+        with patch("shruggie_indexer.core.entry.os.scandir", fake_scandir):
+            deleted = cleanup_stale_metadata(SimpleNamespace(type="file"), tmp_path, _cfg())
+
+        assert deleted == 1
+        assert (tmp_path / "a.jpg_meta2.json").exists()
+        assert not (tmp_path / "b.jpg_meta2.json").exists()
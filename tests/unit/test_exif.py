@@ -5,49 +5,137 @@
 
 from __future__ import annotations
 
-import json
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any, ClassVar
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from shruggie_indexer.config.loader import load_config
-from shruggie_indexer.config.types import IndexerConfig
 from shruggie_indexer.core.exif import (
     EXIFTOOL_EXCLUDED_KEYS,
     _base_key,
     _filter_keys,
     extract_exif,
 )
+from tests.helpers import cached_config as _cfg
 
 FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
 
+# These tests patch module-level probe state in core.exif; keep them on a
+# single xdist worker.
+pytestmark = pytest.mark.xdist_group("exif_module_state")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _cfg(**overrides: object) -> IndexerConfig:
-    return load_config(overrides=overrides)  # type: ignore[arg-type]
-
-
 def _load_fixture(name: str) -> list[dict[str, Any]]:
     fixture = FIXTURES_DIR / "exiftool_responses" / name
-    return json.loads(fixture.read_text(encoding="utf-8"))
+    return orjson.loads(fixture.read_bytes())
 
 
-def _reset_exif_module() -> None:
-    """Reset module-level state in exif so probing re-runs."""
+# Stdout of a successful exiftool run, serialized once at import.
+_EXE_RESPONSE_STDOUT = orjson.dumps(_load_fixture("exe_response.json")).decode()
+
+# Stdout payloads for the key-filtering tests, serialized once at import.
+_EXCLUDED_KEYS_STDOUT = orjson.dumps(
+    [
+        {
+            "ExifToolVersion": 12.76,
+            "FileName": "test.txt",
+            "Directory": "/tmp",
+            "File:MIMEType": "text/plain",
+            "Custom:Tag": "value",
+        }
+    ]
+).decode()
+
+_GROUP_PREFIXED_KEYS_STDOUT = orjson.dumps(
+    [
+        {
+            "SourceFile": "C:/Users/test/file.txt",
+            "ExifTool:ExifToolVersion": 12.76,
+            "ExifTool:Now": "2026:02:23 12:00:00-05:00",
+            "ExifTool:ProcessingTime": "0.005 s",
+            "System:FileName": "file.txt",
+            "System:Directory": "C:/Users/test",
+            "System:FileSize": "1234 bytes",
+            "System:FileModifyDate": "2026:02:23 12:00:00-05:00",
+            "System:FileAccessDate": "2026:02:23 12:00:00-05:00",
+            "System:FileCreateDate": "2026:02:23 12:00:00-05:00",
+            "System:FilePermissions": "rw-r--r--",
+            "System:FileAttributes": "Regular; Archive",
+            "File:FileType": "TXT",
+            "File:FileTypeExtension": "txt",
+            "File:MIMEType": "text/plain",
+            "File:Encoding": "utf-8",
+            "QuickTime:SomeTag": "preserved",
+            "Composite:Duration": 120.5,
+        }
+    ]
+).decode()
+
+
+# ExifTool response for an "Unknown file type" run (exit code 1) that still
+# carries valid system-level metadata.
+_7Z_EXIFTOOL_RESPONSE: list[dict[str, str | float]] = [
+    {
+        "SourceFile": "FeedsExport.7z",
+        "ExifTool:ExifToolVersion": 13.10,
+        "ExifTool:Now": "2026:02:23 19:35:11-05:00",
+        "ExifTool:Error": "Unknown file type",
+        "ExifTool:ProcessingTime": "0.366 s",
+        "System:FileSize": "728 MB",
+        "System:FileModifyDate": "2026:02:09 16:14:22-05:00",
+        "System:FileAccessDate": "2026:02:23 19:35:11-05:00",
+        "System:FileCreateDate": "2026:02:23 19:28:39-05:00",
+        "System:FileAttributes": "Regular; (none); Archive",
+        # MIMEType survives key filtering — validates metadata recovery.
+        "File:MIMEType": "application/x-7z-compressed",
+    }
+]
+
+
+# Module-level probe state in core.exif that tests may overwrite.
+_EXIF_STATE_NAMES = ("_exiftool_path", "_pyexiftool_available", "_backend", "_batch_helper")
+
+
+@pytest.fixture(autouse=True)
+def _restore_exif_state() -> Iterator[None]:
+    """Snapshot core.exif probe state before each test and restore it after."""
     import shruggie_indexer.core.exif as mod
 
-    sentinel = mod._NOT_PROBED
-    mod._exiftool_path = sentinel
-    mod._pyexiftool_available = sentinel
-    mod._backend = sentinel
-    mod._batch_helper = None
+    saved = tuple(getattr(mod, name) for name in _EXIF_STATE_NAMES)
+    yield
+    for name, value in zip(_EXIF_STATE_NAMES, saved, strict=True):
+        setattr(mod, name, value)
+
+
+@pytest.fixture()
+def mock_subprocess_run() -> Iterator[MagicMock]:
+    """Patch ``subprocess.run`` once per test; tests set its return/side effect."""
+    with patch("subprocess.run") as mock_run:
+        yield mock_run
+
+
+@pytest.fixture(scope="class")
+def subprocess_backend() -> Iterator[None]:
+    """Pin core.exif to the subprocess backend once for a whole test class."""
+    import shruggie_indexer.core.exif as mod
+
+    with pytest.MonkeyPatch.context() as class_mp:
+        class_mp.setattr(mod, "_exiftool_path", "exiftool")
+        class_mp.setattr(mod, "_pyexiftool_available", False)
+        class_mp.setattr(mod, "_backend", "subprocess")
+        class_mp.setattr(mod, "_batch_helper", None)
+        yield
 
 
 # ---------------------------------------------------------------------------
@@ -55,36 +143,64 @@ def _reset_exif_module() -> None:
 # ---------------------------------------------------------------------------
 
 
-class TestExtractExifSuccess:
-    """Test successful metadata extraction with mocked exiftool."""
+@pytest.mark.usefixtures("subprocess_backend")
+class TestSubprocessBackend:
+    """Subprocess backend outcomes with a stubbed ``subprocess.run``.
+
+    Every test here shares the same module state, set once per class by the
+    ``subprocess_backend`` fixture.
+    """
 
-    def test_successful_extraction_subprocess(
+    @pytest.mark.parametrize(
+        ("return_value", "side_effect", "expect_metadata"),
+        [
+            pytest.param(
+                SimpleNamespace(returncode=0, stdout=_EXE_RESPONSE_STDOUT, stderr=""),
+                None,
+                True,
+                id="success",
+            ),
+            pytest.param(
+                None,
+                subprocess.TimeoutExpired("exiftool", 30),
+                False,
+                id="timeout",
+            ),
+            pytest.param(
+                SimpleNamespace(returncode=0, stdout="this is not valid json{{", stderr=""),
+                None,
+                False,
+                id="malformed-json",
+            ),
+            pytest.param(
+                None,
+                OSError("no exiftool"),
+                False,
+                id="os-error",
+            ),
+        ],
+    )
+    def test_subprocess_backend(
         self,
         sample_file: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        mock_subprocess_run: MagicMock,
+        return_value: SimpleNamespace | None,
+        side_effect: BaseException | None,
+        expect_metadata: bool,
     ) -> None:
-        """Mocked subprocess backend returns filtered metadata."""
-        import shruggie_indexer.core.exif as exif_mod
-
-        fixture_data = _load_fixture("exe_response.json")
-        json_out = json.dumps(fixture_data)
+        """Valid output yields filtered metadata; failures yield None.
 
-        # Set module to subprocess backend.
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-        monkeypatch.setattr(exif_mod, "_batch_helper", None)
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json_out
-        mock_result.stderr = ""
+        Timeouts, malformed JSON, and OS errors must not raise.
+        """
+        mock_subprocess_run.return_value = return_value
+        mock_subprocess_run.side_effect = side_effect
+        config = _cfg(extract_exif=True)
+        result = extract_exif(sample_file, config)
 
-        with patch("subprocess.run", return_value=mock_result):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
+        if not expect_metadata:
+            assert result is None
+            return
 
-        assert result is not None
         assert isinstance(result, dict)
         # Excluded keys should be removed.
         for key in EXIFTOOL_EXCLUDED_KEYS:
@@ -92,36 +208,11 @@ class TestExtractExifSuccess:
         # Real keys should remain.
         assert "EXE:CompanyName" in result or "File:MIMEType" in result
 
-
-class TestExiftoolAbsent:
-    """Test graceful degradation when exiftool is not installed."""
-
-    def test_exiftool_absent_returns_none(
-        self,
-        sample_file: Path,
-        mock_exiftool: None,
-    ) -> None:
-        """When exiftool is disabled, extract_exif returns None."""
-        config = _cfg(extract_exif=True)
-        result = extract_exif(sample_file, config)
-        assert result is None
-
-
-class TestExtensionGate:
-    """Test extension exclusion filtering."""
-
     def test_excluded_extension_skipped(
         self,
         tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Files with excluded extensions are skipped without calling exiftool."""
-        import shruggie_indexer.core.exif as exif_mod
-
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-
         json_file = tmp_path / "data.json"
         json_file.write_text('{"key": "val"}', encoding="utf-8")
 
@@ -130,40 +221,17 @@ class TestExtensionGate:
         result = extract_exif(json_file, config)
         assert result is None
 
-
-class TestKeyFiltering:
-    """Test that excluded keys are removed from exiftool output."""
-
     def test_excluded_keys_removed(
         self,
         sample_file: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        mock_subprocess_run: MagicMock,
     ) -> None:
         """EXIFTOOL_EXCLUDED_KEYS entries are stripped from output."""
-        import shruggie_indexer.core.exif as exif_mod
-
-        data = [
-            {
-                "ExifToolVersion": 12.76,
-                "FileName": "test.txt",
-                "Directory": "/tmp",
-                "File:MIMEType": "text/plain",
-                "Custom:Tag": "value",
-            }
-        ]
-
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(data)
-        mock_result.stderr = ""
+        mock_result = SimpleNamespace(returncode=0, stdout=_EXCLUDED_KEYS_STDOUT, stderr="")
 
-        with patch("subprocess.run", return_value=mock_result):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
+        mock_subprocess_run.return_value = mock_result
+        config = _cfg(extract_exif=True)
+        result = extract_exif(sample_file, config)
 
         assert result is not None
         assert "ExifToolVersion" not in result
@@ -175,46 +243,14 @@ class TestKeyFiltering:
     def test_group_prefixed_keys_removed(
         self,
         sample_file: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        mock_subprocess_run: MagicMock,
     ) -> None:
         """Group-prefixed keys (e.g. System:FileName) are matched by base name."""
-        import shruggie_indexer.core.exif as exif_mod
+        mock_result = SimpleNamespace(returncode=0, stdout=_GROUP_PREFIXED_KEYS_STDOUT, stderr="")
 
-        data = [
-            {
-                "SourceFile": "C:/Users/test/file.txt",
-                "ExifTool:ExifToolVersion": 12.76,
-                "ExifTool:Now": "2026:02:23 12:00:00-05:00",
-                "ExifTool:ProcessingTime": "0.005 s",
-                "System:FileName": "file.txt",
-                "System:Directory": "C:/Users/test",
-                "System:FileSize": "1234 bytes",
-                "System:FileModifyDate": "2026:02:23 12:00:00-05:00",
-                "System:FileAccessDate": "2026:02:23 12:00:00-05:00",
-                "System:FileCreateDate": "2026:02:23 12:00:00-05:00",
-                "System:FilePermissions": "rw-r--r--",
-                "System:FileAttributes": "Regular; Archive",
-                "File:FileType": "TXT",
-                "File:FileTypeExtension": "txt",
-                "File:MIMEType": "text/plain",
-                "File:Encoding": "utf-8",
-                "QuickTime:SomeTag": "preserved",
-                "Composite:Duration": 120.5,
-            }
-        ]
-
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(data)
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
+        mock_subprocess_run.return_value = mock_result
+        config = _cfg(extract_exif=True)
+        result = extract_exif(sample_file, config)
 
         assert result is not None
         # All excluded keys (prefixed and unprefixed) must be absent.
@@ -238,6 +274,94 @@ class TestKeyFiltering:
         assert result["QuickTime:SomeTag"] == "preserved"
         assert result["Composite:Duration"] == 120.5
 
+    def test_custom_exclusion_applied_in_extract(
+        self,
+        sample_file: Path,
+        mock_subprocess_run: MagicMock,
+    ) -> None:
+        """Custom exclusion set is applied during extract_exif."""
+        data = [
+            {
+                "File:MIMEType": "text/plain",
+                "Copyright": "2026 Test",
+                "SourceFile": "/tmp/test.txt",
+            }
+        ]
+
+        mock_result = SimpleNamespace(returncode=0, stdout=orjson.dumps(data).decode(), stderr="")
+
+        # Use a custom set that only excludes SourceFile
+        config = load_config(
+            overrides={
+                "extract_exif": True,
+                "exiftool.exclude_keys": frozenset({"SourceFile"}),
+            },
+        )
+        mock_subprocess_run.return_value = mock_result
+        result = extract_exif(sample_file, config)
+
+        assert result is not None
+        # SourceFile excluded by custom set
+        assert "SourceFile" not in result
+        # Copyright NOT excluded (not in custom set)
+        assert "Copyright" in result
+        assert result["File:MIMEType"] == "text/plain"
+
+    def test_subprocess_recovers_metadata_on_nonzero_exit(
+        self,
+        sample_file: Path,
+        mock_subprocess_run: MagicMock,
+    ) -> None:
+        """Subprocess fallback recovers valid JSON on exit code 1."""
+        mock_result = SimpleNamespace(
+            returncode=1,
+            stdout=orjson.dumps(_7Z_EXIFTOOL_RESPONSE).decode(),
+            stderr="Warning: Unknown file type",
+        )
+
+        mock_subprocess_run.return_value = mock_result
+        config = _cfg(extract_exif=True)
+        result = extract_exif(sample_file, config)
+
+        # Must return filtered metadata, NOT None.
+        assert result is not None
+        assert isinstance(result, dict)
+        # Excluded keys removed
+        assert "SourceFile" not in result
+        assert "ExifTool:Error" not in result
+
+    def test_nonzero_exit_no_stdout_returns_none(
+        self,
+        sample_file: Path,
+        mock_subprocess_run: MagicMock,
+    ) -> None:
+        """Non-zero exit with no stdout data returns None (true failure)."""
+        mock_result = SimpleNamespace(returncode=1, stdout="", stderr="Fatal error")
+
+        mock_subprocess_run.return_value = mock_result
+        config = _cfg(extract_exif=True)
+        result = extract_exif(sample_file, config)
+
+        assert result is None
+
+
+class TestExiftoolAbsent:
+    """Test graceful degradation when exiftool is not installed."""
+
+    def test_exiftool_absent_returns_none(
+        self,
+        sample_file: Path,
+        mock_exiftool: None,
+    ) -> None:
+        """When exiftool is disabled, extract_exif returns None."""
+        config = _cfg(extract_exif=True)
+        result = extract_exif(sample_file, config)
+        assert result is None
+
+
+class TestKeyFiltering:
+    """Test that excluded keys are removed from exiftool output."""
+
     def test_expanded_exclusion_set_contains_required_keys(self) -> None:
         """EXIFTOOL_EXCLUDED_KEYS includes all required base key names."""
         required = {
@@ -398,48 +522,6 @@ class TestConfigurableExcludeKeys:
         config = load_config(config_file=config_file)
         assert config.exiftool_exclude_keys == frozenset({"SourceFile"})
 
-    def test_custom_exclusion_applied_in_extract(
-        self,
-        sample_file: Path,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """Custom exclusion set is applied during extract_exif."""
-        import shruggie_indexer.core.exif as exif_mod
-
-        data = [
-            {
-                "File:MIMEType": "text/plain",
-                "Copyright": "2026 Test",
-                "SourceFile": "/tmp/test.txt",
-            }
-        ]
-
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(data)
-        mock_result.stderr = ""
-
-        # Use a custom set that only excludes SourceFile
-        config = load_config(
-            overrides={
-                "extract_exif": True,
-                "exiftool.exclude_keys": frozenset({"SourceFile"}),
-            },
-        )
-        with patch("subprocess.run", return_value=mock_result):
-            result = extract_exif(sample_file, config)
-
-        assert result is not None
-        # SourceFile excluded by custom set
-        assert "SourceFile" not in result
-        # Copyright NOT excluded (not in custom set)
-        assert "Copyright" in result
-        assert result["File:MIMEType"] == "text/plain"
-
     def test_empty_exclusion_set_passes_all(self) -> None:
         """An empty exclusion set passes all keys through."""
         data = {
@@ -451,58 +533,6 @@ class TestConfigurableExcludeKeys:
         assert result == data
 
 
-class TestTimeoutHandling:
-    """Test subprocess timeout handling."""
-
-    def test_timeout_returns_none(
-        self,
-        sample_file: Path,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """subprocess.TimeoutExpired results in None, not an exception."""
-        import shruggie_indexer.core.exif as exif_mod
-
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-
-        with patch(
-            "subprocess.run",
-            side_effect=subprocess.TimeoutExpired("exiftool", 30),
-        ):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
-
-        assert result is None
-
-
-class TestMalformedJson:
-    """Test malformed JSON handling."""
-
-    def test_malformed_json_returns_none(
-        self,
-        sample_file: Path,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """Invalid JSON from exiftool results in None."""
-        import shruggie_indexer.core.exif as exif_mod
-
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "this is not valid json{{"
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
-
-        assert result is None
-
-
 class TestBackendReset:
     """Test that batch backend failures result in reset."""
 
@@ -510,6 +540,7 @@ class TestBackendReset:
         self,
         sample_file: Path,
         monkeypatch: pytest.MonkeyPatch,
+        mock_subprocess_run: MagicMock,
     ) -> None:
         """When pyexiftool helper raises, it is set to None for retry."""
         import shruggie_indexer.core.exif as exif_mod
@@ -524,9 +555,9 @@ class TestBackendReset:
         monkeypatch.setattr(exif_mod, "_batch_helper", mock_helper)
 
         # Also mock subprocess fallback to avoid actual subprocess call.
-        with patch("subprocess.run", side_effect=OSError("no exiftool")):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
+        mock_subprocess_run.side_effect = OSError("no exiftool")
+        config = _cfg(extract_exif=True)
+        result = extract_exif(sample_file, config)
 
         assert result is None
         # The helper should have been reset to None.
@@ -541,23 +572,6 @@ class TestNonZeroExitMetadataRecovery:
     captures this metadata instead of discarding it (§3.3).
     """
 
-    _7Z_EXIFTOOL_RESPONSE: ClassVar[list[dict[str, str | float]]] = [
-        {
-            "SourceFile": "FeedsExport.7z",
-            "ExifTool:ExifToolVersion": 13.10,
-            "ExifTool:Now": "2026:02:23 19:35:11-05:00",
-            "ExifTool:Error": "Unknown file type",
-            "ExifTool:ProcessingTime": "0.366 s",
-            "System:FileSize": "728 MB",
-            "System:FileModifyDate": "2026:02:09 16:14:22-05:00",
-            "System:FileAccessDate": "2026:02:23 19:35:11-05:00",
-            "System:FileCreateDate": "2026:02:23 19:28:39-05:00",
-            "System:FileAttributes": "Regular; (none); Archive",
-            # MIMEType survives key filtering — validates metadata recovery.
-            "File:MIMEType": "application/x-7z-compressed",
-        }
-    ]
-
     def test_batch_recovers_metadata_on_nonzero_exit(
         self,
         sample_file: Path,
@@ -567,7 +581,7 @@ class TestNonZeroExitMetadataRecovery:
         import shruggie_indexer.core.exif as exif_mod
 
         # Simulate ExifToolExecuteError with valid stdout
-        stdout_json = json.dumps(self._7Z_EXIFTOOL_RESPONSE)
+        stdout_json = orjson.dumps(_7Z_EXIFTOOL_RESPONSE).decode()
 
         class FakeExifToolExecuteError(Exception):
             def __init__(self_inner) -> None:
@@ -603,61 +617,11 @@ class TestNonZeroExitMetadataRecovery:
         # The batch helper must NOT be reset after a recoverable error.
         assert exif_mod._batch_helper is mock_helper
 
-    def test_subprocess_recovers_metadata_on_nonzero_exit(
-        self,
-        sample_file: Path,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """Subprocess fallback recovers valid JSON on exit code 1."""
-        import shruggie_indexer.core.exif as exif_mod
-
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = json.dumps(self._7Z_EXIFTOOL_RESPONSE)
-        mock_result.stderr = "Warning: Unknown file type"
-
-        with patch("subprocess.run", return_value=mock_result):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
-
-        # Must return filtered metadata, NOT None.
-        assert result is not None
-        assert isinstance(result, dict)
-        # Excluded keys removed
-        assert "SourceFile" not in result
-        assert "ExifTool:Error" not in result
-
-    def test_nonzero_exit_no_stdout_returns_none(
-        self,
-        sample_file: Path,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """Non-zero exit with no stdout data returns None (true failure)."""
-        import shruggie_indexer.core.exif as exif_mod
-
-        monkeypatch.setattr(exif_mod, "_exiftool_path", "exiftool")
-        monkeypatch.setattr(exif_mod, "_pyexiftool_available", False)
-        monkeypatch.setattr(exif_mod, "_backend", "subprocess")
-
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Fatal error"
-
-        with patch("subprocess.run", return_value=mock_result):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
-
-        assert result is None
-
     def test_batch_nonzero_no_stdout_resets_helper(
         self,
         sample_file: Path,
         monkeypatch: pytest.MonkeyPatch,
+        mock_subprocess_run: MagicMock,
     ) -> None:
         """Batch error with no recoverable stdout resets the helper."""
         import shruggie_indexer.core.exif as exif_mod
@@ -672,9 +636,9 @@ class TestNonZeroExitMetadataRecovery:
         monkeypatch.setattr(exif_mod, "_backend", "batch")
         monkeypatch.setattr(exif_mod, "_batch_helper", mock_helper)
 
-        with patch("subprocess.run", side_effect=OSError("no exiftool")):
-            config = _cfg(extract_exif=True)
-            result = extract_exif(sample_file, config)
+        mock_subprocess_run.side_effect = OSError("no exiftool")
+        config = _cfg(extract_exif=True)
+        result = extract_exif(sample_file, config)
 
         assert result is None
         assert exif_mod._batch_helper is None
@@ -6,7 +6,6 @@
 from __future__ import annotations
 
 import hashlib
-import re
 import threading
 from pathlib import Path
 
@@ -14,6 +13,7 @@ import pytest
 
 from shruggie_indexer.core.hashing import (
     NULL_HASHES,
+    hash_bytes,
     hash_directory_id,
     hash_file,
     hash_string,
@@ -41,7 +41,14 @@ _EMPTY_SHA512 = (
     "47D0D13C5D85F2B0FF8318D2877EEC2F63B931BD47417A81A538327AF927DA3E"
 )
 
-_UPPERCASE_HEX_RE = re.compile(r"^[0-9A-F]+$")
+_SELECT_ID_HASHES = HashSet(md5="ABCD1234" * 4, sha256="ABCD1234" * 8)
+
+_HEX_UPPER = frozenset("0123456789ABCDEF")
+
+
+def _is_upper_hex(s: str) -> bool:
+    """Return True if *s* is non-empty and contains only 0-9A-F."""
+    return bool(s) and all(c in _HEX_UPPER for c in s)
 
 
 # ---------------------------------------------------------------------------
@@ -90,12 +97,30 @@ class TestHashFile:
         result = hash_file(sample_file, algorithms=("md5", "sha256"))
         assert result.sha512 is None
 
-    def test_cancel_event_raises(self, large_file: Path) -> None:
-        """Pre-set cancel_event raises IndexerCancellationError."""
+    def test_cancel_event_raises(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Pre-set cancel_event raises before the file is ever opened."""
         cancel = threading.Event()
         cancel.set()
+        monkeypatch.setattr(
+            "builtins.open",
+            lambda *a, **kw: pytest.fail("open() called before cancel check"),
+        )
         with pytest.raises(IndexerCancellationError):
-            hash_file(large_file, cancel_event=cancel)
+            hash_file(tmp_path / "nonexistent.bin", cancel_event=cancel)
+
+    def test_multi_chunk_with_recycled_buffer(self, tmp_path: Path) -> None:
+        """Files spanning several chunks hash correctly, also on buffer reuse."""
+        from shruggie_indexer.core.hashing import CHUNK_SIZE
+
+        big = tmp_path / "big.bin"
+        data = bytes(range(256)) * ((2 * CHUNK_SIZE + 123) // 256 + 1)
+        big.write_bytes(data)
+        small = tmp_path / "small.bin"
+        small.write_bytes(b"tail")
+
+        assert hash_file(big).md5 == hashlib.md5(data).hexdigest().upper()
+        # The short read must not pick up stale bytes from the pooled buffer.
+        assert hash_file(small).md5 == hashlib.md5(b"tail").hexdigest().upper()
 
     def test_cancel_event_none_no_effect(self, sample_file: Path) -> None:
         """Default cancel_event=None does not interfere with hashing."""
@@ -103,6 +128,17 @@ class TestHashFile:
         assert result.md5 == _HELLO_MD5
 
 
+class TestHashBytes:
+    """Tests for hash_bytes()."""
+
+    def test_matches_hash_file(self, sample_file: Path) -> None:
+        """In-memory hashing gives the same HashSet as hashing the file."""
+        algorithms = ("md5", "sha256", "sha512")
+        assert hash_bytes(sample_file.read_bytes(), algorithms) == hash_file(
+            sample_file, algorithms
+        )
+
+
 class TestHashString:
     """Tests for hash_string()."""
 
@@ -165,25 +201,19 @@ class TestNullHashes:
 class TestSelectId:
     """Tests for select_id() — identity prefix convention."""
 
-    def test_id_prefix_file(self) -> None:
-        """File identity starts with 'y'."""
-        hs = HashSet(md5="ABCD1234" * 4, sha256="ABCD1234" * 8)
-        result = select_id(hs, "md5", "y")
-        assert result.startswith("y")
-        assert result == "y" + hs.md5
-
-    def test_id_prefix_directory(self) -> None:
-        """Directory identity starts with 'x'."""
-        hs = HashSet(md5="ABCD1234" * 4, sha256="ABCD1234" * 8)
-        result = select_id(hs, "sha256", "x")
-        assert result.startswith("x")
-        assert result == "x" + hs.sha256
-
-    def test_id_prefix_generated_metadata(self) -> None:
-        """Generated metadata identity starts with 'z'."""
-        hs = HashSet(md5="ABCD1234" * 4, sha256="ABCD1234" * 8)
-        result = select_id(hs, "md5", "z")
-        assert result.startswith("z")
+    @pytest.mark.parametrize(
+        ("algorithm", "prefix"),
+        [
+            pytest.param("md5", "y", id="file"),
+            pytest.param("sha256", "x", id="directory"),
+            pytest.param("md5", "z", id="generated-metadata"),
+        ],
+    )
+    def test_id_prefix(self, algorithm: str, prefix: str) -> None:
+        """Identity is the prefix followed by the selected digest."""
+        result = select_id(_SELECT_ID_HASHES, algorithm, prefix)
+        assert result.startswith(prefix)
+        assert result == prefix + getattr(_SELECT_ID_HASHES, algorithm)
 
 
 class TestUppercaseHex:
@@ -192,9 +222,9 @@ class TestUppercaseHex:
     def test_hashset_uppercase(self, sample_file: Path) -> None:
         """All hex strings contain only 0-9A-F, never lowercase a-f."""
         result = hash_file(sample_file)
-        assert _UPPERCASE_HEX_RE.match(result.md5)
-        assert _UPPERCASE_HEX_RE.match(result.sha256)
+        assert _is_upper_hex(result.md5)
+        assert _is_upper_hex(result.sha256)
 
         result_str = hash_string("test")
-        assert _UPPERCASE_HEX_RE.match(result_str.md5)
-        assert _UPPERCASE_HEX_RE.match(result_str.sha256)
+        assert _is_upper_hex(result_str.md5)
+        assert _is_upper_hex(result_str.sha256)
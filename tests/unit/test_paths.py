@@ -58,40 +58,35 @@ class TestResolvePath:
 
 
 class TestExtractComponents:
-    """Tests for extract_components()."""
+    """Tests for extract_components().
 
-    def test_extract_components(self, tmp_path: Path) -> None:
+    ``extract_components`` only inspects the path string, so these tests use
+    synthetic paths rather than touching the filesystem.
+    """
+
+    def test_extract_components(self) -> None:
         """Full component extraction from a typical path."""
-        p = tmp_path / "photos" / "sunset.jpg"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text("img", encoding="utf-8")
-        resolved = resolve_path(p)
-        result = extract_components(resolved)
+        p = Path("/fake/photos/sunset.jpg")
+        result = extract_components(p)
         assert result.name == "sunset.jpg"
         assert result.stem == "sunset"
         assert result.suffix == "jpg"
         assert result.parent_name == "photos"
-        assert result.parent_path == resolved.parent
+        assert result.parent_path == p.parent
 
-    def test_extension_lowercasing(self, tmp_path: Path) -> None:
+    def test_extension_lowercasing(self) -> None:
         """FILE.JPG -> suffix 'jpg'."""
-        p = tmp_path / "FILE.JPG"
-        p.write_text("img", encoding="utf-8")
-        result = extract_components(resolve_path(p))
+        result = extract_components(Path("/fake/FILE.JPG"))
         assert result.suffix == "jpg"
 
-    def test_no_extension(self, tmp_path: Path) -> None:
+    def test_no_extension(self) -> None:
         """A file named 'Makefile' -> suffix None."""
-        p = tmp_path / "Makefile"
-        p.write_text("all:", encoding="utf-8")
-        result = extract_components(resolve_path(p))
+        result = extract_components(Path("/fake/Makefile"))
         assert result.suffix is None
 
-    def test_multi_dot_extension(self, tmp_path: Path) -> None:
+    def test_multi_dot_extension(self) -> None:
         """'archive.tar.gz' -> suffix 'gz' (only the final extension)."""
-        p = tmp_path / "archive.tar.gz"
-        p.write_bytes(b"\x00")
-        result = extract_components(resolve_path(p))
+        result = extract_components(Path("/fake/archive.tar.gz"))
         assert result.suffix == "gz"
 
     def test_root_level_parent(self) -> None:
@@ -5,9 +5,14 @@
 
 from __future__ import annotations
 
+import logging
+import os
 from pathlib import Path
 from typing import Any
 
+import pytest
+
+import shruggie_indexer.core.rename as rename_mod
 from shruggie_indexer.core.rename import rename_item
 from shruggie_indexer.models.schema import (
     AttributesObject,
@@ -25,33 +30,41 @@ from shruggie_indexer.models.schema import (
 # ---------------------------------------------------------------------------
 
 
-def _make_hashset() -> HashSet:
-    return HashSet(
-        md5="D41D8CD98F00B204E9800998ECF8427E",
-        sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
-    )
+_SHARED_HASHSET = HashSet(
+    md5="D41D8CD98F00B204E9800998ECF8427E",
+    sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
+)
+
+_DEFAULT_STORAGE_NAME = "yD41D8CD98F00B204E9800998ECF8427E.txt"
+
+_PAIR = TimestampPair(iso="2024-01-01T00:00:00.000000+00:00", unix=1704067200000)
+
+# Shared, never-mutated sub-objects for every entry built by _make_entry().
+_DEFAULT_ENTRY_KWARGS: dict[str, Any] = {
+    "schema_version": 2,
+    "id": "yD41D8CD98F00B204E9800998ECF8427E",
+    "id_algorithm": "md5",
+    "type": "file",
+    "name": NameObject(text="original.txt", hashes=_SHARED_HASHSET),
+    "extension": "txt",
+    "size": SizeObject(text="11 B", bytes=11),
+    "hashes": _SHARED_HASHSET,
+    "file_system": FileSystemObject(relative="original.txt", parent=None),
+    "timestamps": TimestampsObject(created=_PAIR, modified=_PAIR, accessed=_PAIR),
+    "attributes": AttributesObject(is_link=False, storage_name=_DEFAULT_STORAGE_NAME),
+}
 
 
 def _make_entry(
-    storage_name: str = "yD41D8CD98F00B204E9800998ECF8427E.txt",
+    storage_name: str = _DEFAULT_STORAGE_NAME,
     **overrides: Any,
 ) -> IndexEntry:
-    pair = TimestampPair(iso="2024-01-01T00:00:00.000000+00:00", unix=1704067200000)
-    defaults: dict[str, Any] = {
-        "schema_version": 2,
-        "id": "yD41D8CD98F00B204E9800998ECF8427E",
-        "id_algorithm": "md5",
-        "type": "file",
-        "name": NameObject(text="original.txt", hashes=_make_hashset()),
-        "extension": "txt",
-        "size": SizeObject(text="11 B", bytes=11),
-        "hashes": _make_hashset(),
-        "file_system": FileSystemObject(relative="original.txt", parent=None),
-        "timestamps": TimestampsObject(created=pair, modified=pair, accessed=pair),
-        "attributes": AttributesObject(is_link=False, storage_name=storage_name),
-    }
-    defaults.update(overrides)
-    return IndexEntry(**defaults)
+    if storage_name != _DEFAULT_STORAGE_NAME:
+        if "attributes" in overrides:
+            msg = "pass either storage_name or attributes, not both"
+            raise TypeError(msg)
+        overrides["attributes"] = AttributesObject(is_link=False, storage_name=storage_name)
+    return IndexEntry(**{**_DEFAULT_ENTRY_KWARGS, **overrides})
 
 
 # ---------------------------------------------------------------------------
@@ -59,63 +72,84 @@ def _make_entry(
 # ---------------------------------------------------------------------------
 
 
-class TestSuccessfulRename:
-    """Tests for successful rename operations."""
-
-    def test_rename_moves_file(self, tmp_path: Path) -> None:
-        """rename_item moves the file to its storage_name."""
-        original = tmp_path / "original.txt"
-        original.write_text("content", encoding="utf-8")
-
-        entry = _make_entry()
-        new_path = rename_item(original, entry)
-
-        expected = tmp_path / "yD41D8CD98F00B204E9800998ECF8427E.txt"
-        assert new_path == expected
-        assert expected.exists()
-        assert not original.exists()
-        assert expected.read_text(encoding="utf-8") == "content"
-
+class TestRenameModes:
+    """Tests for live and dry-run rename operations."""
 
-class TestDryRun:
-    """Tests for dry-run mode."""
-
-    def test_dry_run_no_filesystem_change(self, tmp_path: Path) -> None:
-        """In dry-run mode, the file is NOT moved."""
+    @pytest.mark.parametrize(
+        ("dry_run", "expect_original", "expect_target"),
+        [
+            pytest.param(False, False, True, id="rename"),
+            pytest.param(True, True, False, id="dry-run"),
+        ],
+    )
+    def test_rename_dry_run_modes(
+        self,
+        tmp_path: Path,
+        dry_run: bool,
+        expect_original: bool,
+        expect_target: bool,
+    ) -> None:
+        """rename_item moves the file to its storage_name unless dry_run is set.
+
+        Both modes return the storage path; only a live rename touches disk.
+        """
         original = tmp_path / "original.txt"
         original.write_text("content", encoding="utf-8")
 
-        entry = _make_entry()
-        new_path = rename_item(original, entry, dry_run=True)
+        new_path = rename_item(original, _make_entry(), dry_run=dry_run)
 
-        expected = tmp_path / "yD41D8CD98F00B204E9800998ECF8427E.txt"
-        assert new_path == expected
-        # Original should still exist.
-        assert original.exists()
-        # Target should NOT exist.
-        assert not expected.exists()
+        assert new_path == tmp_path / "yD41D8CD98F00B204E9800998ECF8427E.txt"
+        assert original.exists() is expect_original
+        assert new_path.exists() is expect_target
+        if expect_target:
+            assert new_path.read_text(encoding="utf-8") == "content"
 
 
 class TestCollisionDetection:
     """Tests for collision detection."""
 
-    def test_collision_skips_with_warning(self, tmp_path: Path) -> None:
-        """Renaming skips when a different file already occupies the target path."""
-        original = tmp_path / "original.txt"
-        original.write_text("original content", encoding="utf-8")
-
-        # Create a different file at the target location.
-        target = tmp_path / "yD41D8CD98F00B204E9800998ECF8427E.txt"
-        target.write_text("different content", encoding="utf-8")
-
-        entry = _make_entry()
-        result = rename_item(original, entry)
-
-        # Original file is untouched, target is untouched.
+    def test_collision_skips_with_warning(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Renaming skips when a different file already occupies the target path.
+
+        The collision check only consults ``exists()`` and ``os.stat()``, so
+        both are stubbed for the two test paths and no files are created.
+        Every other path is passed through to the real implementations.
+        """
+        original = Path("/fake/original.txt")
+        target = original.parent / "yD41D8CD98F00B204E9800998ECF8427E.txt"
+        inodes = {str(original): 1, str(target): 2}
+        real_stat = os.stat
+        real_exists = Path.exists
+        real_rename = Path.rename
+
+        def fake_stat(path: Any, *args: Any, **kwargs: Any) -> os.stat_result:
+            inode = inodes.get(os.fspath(path)) if isinstance(path, (str, Path)) else None
+            if inode is None:
+                return real_stat(path, *args, **kwargs)
+            return os.stat_result((0o100644, inode, 1, 1, 0, 0, 0, 0, 0, 0))
+
+        def fake_exists(self: Path, *args: Any, **kwargs: Any) -> bool:
+            return str(self) in inodes or real_exists(self, *args, **kwargs)
+
+        def fail_rename(self: Path, new_path: Any) -> Path:
+            if str(self) in inodes:
+                pytest.fail("rename attempted despite collision")
+            return real_rename(self, new_path)
+
+        monkeypatch.setattr(Path, "exists", fake_exists)
+        monkeypatch.setattr(rename_mod.os, "stat", fake_stat)
+        monkeypatch.setattr(Path, "rename", fail_rename)
+
+        with caplog.at_level(logging.ERROR, logger=rename_mod.__name__):
+            result = rename_item(original, _make_entry())
+
+        # The original path is returned and nothing was moved.
         assert result == original
-        assert original.exists()
-        assert original.read_text(encoding="utf-8") == "original content"
-        assert target.read_text(encoding="utf-8") == "different content"
+        assert "rename collision" in caplog.text
 
 
 class TestStorageNameDerivation:
@@ -10,16 +10,21 @@ hash verification.
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import os
 import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from shruggie_indexer.core import rollback
 from shruggie_indexer.core.rollback import (
     LocalSourceResolver,
+    RollbackPlan,
     discover_meta2_files,
     execute_rollback,
     load_meta2,
@@ -29,6 +34,7 @@ from shruggie_indexer.core.rollback import (
 from shruggie_indexer.exceptions import IndexerConfigError, IndexerTargetError
 from shruggie_indexer.models.schema import (
     AttributesObject,
+    EncodingObject,
     FileSystemObject,
     HashSet,
     IndexEntry,
@@ -44,6 +50,9 @@ from shruggie_indexer.models.schema import (
 # Paths
 # ---------------------------------------------------------------------------
 
+# Read-only: tests never write under FIXTURES, so pytest-xdist is free to
+# spread this module's tests across workers.  rollback's id()-keyed
+# annotation tables are per-process and so never shared between workers.
 FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "rollback-testbed"
 
 
@@ -52,11 +61,33 @@ FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "rollback-testb
 # ---------------------------------------------------------------------------
 
 
-def _make_hashset(md5: str = "D41D8CD98F00B204E9800998ECF8427E") -> HashSet:
-    return HashSet(
-        md5=md5,
-        sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
-    )
+_EMPTY_SHA256 = "E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855"
+
+# MD5 digests the tests refer to most often.
+_MD5_EMPTY = "D41D8CD98F00B204E9800998ECF8427E"  # zero-length content
+_MD5_README = "0654CDF77702945DA87A8B4E72E98EEE"  # non-renamed/readme.txt
+_MD5_FLASH = "0EA30B0C7E392876DAAA2D55EF6AEA3E"  # flashplayer.exe under renamed/
+
+# Pre-built HashSets for the digests above.  Rollback code replaces hash
+# objects rather than mutating them, so entries can safely share these.
+_HASH_BY_MD5: dict[str, HashSet] = {
+    md5: HashSet(md5=md5, sha256=_EMPTY_SHA256) for md5 in (_MD5_EMPTY, _MD5_README, _MD5_FLASH)
+}
+
+
+# Recorded sizes for the fixture files above, so that verifying resolvers
+# see consistent sidecars; other digests fall back to _PROTO_SIZE.
+_SIZE_BY_MD5: dict[str, SizeObject] = {
+    _MD5_README: SizeObject(text="46 B", bytes=46),
+    _MD5_FLASH: SizeObject(text="61 B", bytes=61),
+}
+
+
+def _make_hashset(md5: str = _MD5_EMPTY) -> HashSet:
+    hs = _HASH_BY_MD5.get(md5)
+    if hs is None:
+        hs = HashSet(md5=md5, sha256=_EMPTY_SHA256)
+    return hs
 
 
 def _make_ts(
@@ -71,11 +102,31 @@ def _make_ts(
     )
 
 
+# Shared, never-mutated defaults for _make_file_entry().  Per-entry fields
+# (name, hashes, file_system, attributes, ...) are always replaced, so the
+# prototype's own sub-objects are never handed out for in-place mutation.
+_PROTO_SIZE = SizeObject(text="100 B", bytes=100)
+_PROTO_TS = _make_ts()
+_PROTO_ENTRY = IndexEntry(
+    schema_version=2,
+    id="yD41D8CD98F00B204E9800998ECF8427E",
+    id_algorithm="md5",
+    type="file",
+    name=NameObject(text="file.txt", hashes=_make_hashset()),
+    extension="txt",
+    size=_PROTO_SIZE,
+    hashes=_make_hashset(),
+    file_system=FileSystemObject(relative="file.txt", parent=None),
+    timestamps=_PROTO_TS,
+    attributes=AttributesObject(is_link=False, storage_name=None),
+)
+
+
 def _make_file_entry(
     name: str = "file.txt",
     storage_name: str | None = None,
     relative: str = "file.txt",
-    md5: str = "D41D8CD98F00B204E9800998ECF8427E",
+    md5: str = _MD5_EMPTY,
     session_id: str | None = None,
     metadata: list[MetadataEntry] | None = None,
     duplicates: list[IndexEntry] | None = None,
@@ -83,17 +134,16 @@ def _make_file_entry(
 ) -> IndexEntry:
     if storage_name is None:
         storage_name = f"y{md5}.{name.rsplit('.', 1)[-1]}"
-    return IndexEntry(
+    hashes = _make_hashset(md5)
+    return dataclasses.replace(
+        _PROTO_ENTRY,
         schema_version=schema_version,
         id=f"y{md5}",
-        id_algorithm="md5",
-        type="file",
-        name=NameObject(text=name, hashes=_make_hashset(md5)),
+        name=NameObject(text=name, hashes=hashes),
         extension=name.rsplit(".", 1)[-1] if "." in name else None,
-        size=SizeObject(text="100 B", bytes=100),
-        hashes=_make_hashset(md5),
+        size=_SIZE_BY_MD5.get(md5, _PROTO_SIZE),
+        hashes=hashes,
         file_system=FileSystemObject(relative=relative, parent=None),
-        timestamps=_make_ts(),
         attributes=AttributesObject(is_link=False, storage_name=storage_name),
         session_id=session_id,
         metadata=metadata,
@@ -123,11 +173,121 @@ def _make_sidecar_metadata(
     )
     entry.file_system = FileSystemObject(relative=relative, parent=None)
     entry.size = SizeObject(text="50 B", bytes=50)
-    entry.timestamps = _make_ts()
+    entry.timestamps = _PROTO_TS
     entry.encoding = None
     return entry
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _cache_fixture_hashes() -> Iterator[None]:
+    """Hash each FIXTURES file at most once per module.
+
+    Planning and resolving re-verify the same testbed files (``readme.txt``
+    in particular) from several tests.  Results are keyed on the path,
+    ``st_mtime_ns``, ``st_size``, algorithm, expected digest and expected
+    size, and only cached for files under FIXTURES, which are read-only;
+    anything in ``tmp_path`` is always hashed live.  TestVerifyFileHash
+    imports the real function directly and is unaffected.
+    """
+    real_verify = rollback.verify_file_hash
+    cache: dict[tuple[str, int, int, str, str | None, int | None], bool] = {}
+
+    def _cached_verify(
+        path: Path,
+        expected: HashSet,
+        algorithm: str = "md5",
+        *,
+        expected_size: int | None = None,
+    ) -> bool:
+        if not path.is_relative_to(FIXTURES):
+            return real_verify(path, expected, algorithm, expected_size=expected_size)
+        st = path.stat()
+        key = (
+            str(path),
+            st.st_mtime_ns,
+            st.st_size,
+            algorithm,
+            getattr(expected, algorithm, None),
+            expected_size,
+        )
+        if key not in cache:
+            cache[key] = real_verify(path, expected, algorithm, expected_size=expected_size)
+        return cache[key]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(rollback, "verify_file_hash", _cached_verify)
+        yield
+
+
+@pytest.fixture(scope="module")
+def empty_target(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared empty target directory for planning-only tests.
+
+    plan_rollback() never writes into *target_dir*; tests that need existing
+    files in the target (conflict detection) use their own ``tmp_path``.
+    """
+    return tmp_path_factory.mktemp("rb_empty")
+
+
+# Every suffix discover_sidecar_files() matches.
+_SIDECAR_SUFFIXES = (
+    "_meta.json",
+    "_meta2.json",
+    "_meta3.json",
+    "_directorymeta.json",
+    "_directorymeta2.json",
+    "_directorymeta3.json",
+    "_idx.json",
+    "_idxd.json",
+)
+
+
+@pytest.fixture(scope="session")
+def fixture_index() -> dict[str, list[Path]]:
+    """Every file under FIXTURES keyed by file name, from one scandir walk."""
+    out: dict[str, list[Path]] = {}
+    stack = [FIXTURES]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(Path(e.path))
+                else:
+                    out.setdefault(e.name, []).append(Path(e.path))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Cached fixture loads
+# ---------------------------------------------------------------------------
+#
+# These parse each fixture once per module.  They are for read-only
+# inspection only: plan_rollback() strips legacy prefixes in place and purges
+# the id()-keyed duplicate/origin annotations of any entry outside its batch,
+# so tests that plan a rollback must call load_meta2() themselves.  A deep
+# copy would not help — the annotations do not follow copied objects.
+
+
+@pytest.fixture(scope="module")
+def renamed_entries() -> list[IndexEntry]:
+    """Entries from the ``renamed/`` fixture directory (non-recursive)."""
+    return load_meta2(FIXTURES / "renamed")
+
+
+@pytest.fixture(scope="module")
+def dedup_entries() -> list[IndexEntry]:
+    """Canonical + duplicate entries from the ``deduplicated/`` sidecar."""
+    return load_meta2(
+        FIXTURES / "deduplicated" / "y2FFA202F241801EF7FF9C7212EBBC693.jpg_meta2.json",
+    )
+
+
+@pytest.fixture(scope="module")
+def mixed_session_entries() -> list[IndexEntry]:
+    """Entries from the ``mixed-sessions/`` fixture directory (recursive)."""
+    return load_meta2(FIXTURES / "mixed-sessions", recursive=True)
+
+
 # ===========================================================================
 # TestLoadMeta2
 # ===========================================================================
@@ -148,6 +308,39 @@ class TestLoadMeta2:
         assert entry.file_system.relative == "testdir/flashplayer.exe"
         assert entry.schema_version == 2
 
+    def test_rewritten_sidecar_is_reparsed(self, tmp_path: Path) -> None:
+        """A sidecar rewritten between loads yields the new content."""
+        src = FIXTURES / "renamed" / "y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe_meta2.json"
+        data = json.loads(src.read_text(encoding="utf-8"))
+        path = tmp_path / src.name
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert load_meta2(path)[0].name.text == "flashplayer.exe"
+
+        data["name"]["text"] = "flashplayer-renamed.exe"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert load_meta2(path)[0].name.text == "flashplayer-renamed.exe"
+
+    def test_shared_cache_skips_reparse_until_rewritten(self, tmp_path: Path) -> None:
+        """A caller-supplied cache reuses parsed JSON until the file changes."""
+        src = FIXTURES / "renamed" / "y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe_meta2.json"
+        data = json.loads(src.read_text(encoding="utf-8"))
+        path = tmp_path / src.name
+        path.write_text(json.dumps(data), encoding="utf-8")
+        cache: dict[tuple[str, int, int], object] = {}
+
+        parse = rollback._parse_sidecar_json
+        with patch.object(rollback, "_parse_sidecar_json", wraps=parse) as spy:
+            first = rollback.load_sidecar(path, cache=cache)
+            second = rollback.load_sidecar(path, cache=cache)
+            assert spy.call_count == 1
+            assert first[0] is not second[0]
+
+            data["name"]["text"] = "flashplayer-renamed.exe"
+            path.write_text(json.dumps(data), encoding="utf-8")
+            third = rollback.load_sidecar(path, cache=cache)
+            assert third[0].name.text == "flashplayer-renamed.exe"
+            assert spy.call_count == 2
+
     def test_aggregate_tree_flattening(self) -> None:
         """Load an aggregate directory meta2 and flatten to file entries."""
         path = FIXTURES / "aggregate" / "photos_directorymeta2.json"
@@ -159,16 +352,14 @@ class TestLoadMeta2:
         for e in entries:
             assert e.type == "file"
 
-    def test_directory_discovery_non_recursive(self) -> None:
+    def test_directory_discovery_non_recursive(self, renamed_entries: list[IndexEntry]) -> None:
         """Discover sidecars in a directory (non-recursive)."""
-        entries = load_meta2(FIXTURES / "renamed")
-        assert len(entries) == 2
+        assert len(renamed_entries) == 2
 
-    def test_directory_discovery_recursive(self) -> None:
+    def test_directory_discovery_recursive(self, mixed_session_entries: list[IndexEntry]) -> None:
         """Recursive discovery finds sidecars in subdirectories."""
         # The mixed-sessions directory has 3 sidecars
-        entries = load_meta2(FIXTURES / "mixed-sessions", recursive=True)
-        assert len(entries) == 3
+        assert len(mixed_session_entries) == 3
 
     def test_v1_rejection(self) -> None:
         """v1 sidecar (no schema_version) raises IndexerConfigError."""
@@ -188,22 +379,18 @@ class TestLoadMeta2:
         with pytest.raises(IndexerTargetError, match="does not exist"):
             load_meta2(path)
 
-    def test_duplicate_extraction(self) -> None:
+    def test_duplicate_extraction(self, dedup_entries: list[IndexEntry]) -> None:
         """Duplicates from duplicates[] are extracted with annotations."""
-        path = FIXTURES / "deduplicated" / "y2FFA202F241801EF7FF9C7212EBBC693.jpg_meta2.json"
-        entries = load_meta2(path)
         # Should have canonical + 1 duplicate = 2 entries
-        assert len(entries) == 2
-        canonical = entries[0]
+        assert len(dedup_entries) == 2
+        canonical = dedup_entries[0]
         assert canonical.name.text == "photo.jpg"
-        duplicate = entries[1]
+        duplicate = dedup_entries[1]
         assert duplicate.name.text == "photo_copy.jpg"
 
-    def test_sidecar_metadata_preserved(self) -> None:
+    def test_sidecar_metadata_preserved(self, dedup_entries: list[IndexEntry]) -> None:
         """Metadata entries (including sidecar origin) are preserved."""
-        path = FIXTURES / "deduplicated" / "y2FFA202F241801EF7FF9C7212EBBC693.jpg_meta2.json"
-        entries = load_meta2(path)
-        canonical = entries[0]
+        canonical = dedup_entries[0]
         assert canonical.metadata is not None
         assert len(canonical.metadata) == 1
         meta = canonical.metadata[0]
@@ -258,11 +445,19 @@ class TestDiscoverMeta2Files:
         # Should be sorted
         assert files == sorted(files)
 
-    def test_recursive(self) -> None:
+    def test_recursive(self, fixture_index: dict[str, list[Path]]) -> None:
         """Recursive discovers files in subdirectories."""
-        # Running recursive on the entire rollback-testbed should find all meta2 files
+        # Running recursive on the entire rollback-testbed should find every
+        # sidecar in the tree — compare against the pre-walked index.
+        expected = sorted(
+            p
+            for name, paths in fixture_index.items()
+            if name.endswith(_SIDECAR_SUFFIXES)
+            for p in paths
+        )
         files = discover_meta2_files(FIXTURES, recursive=True)
         assert len(files) >= 7  # at least the known fixtures
+        assert files == expected
 
     def test_empty_directory(self, tmp_path: Path) -> None:
         """Empty directory returns empty list."""
@@ -275,67 +470,79 @@ class TestDiscoverMeta2Files:
 # ===========================================================================
 
 
+# The fixture tree is read-only, so one resolver (and its cached directory
+# listings) per mode serves every test.
+@pytest.fixture(scope="class")
+def resolver_noverify() -> LocalSourceResolver:
+    return LocalSourceResolver(verify_hash=False)
+
+
+@pytest.fixture(scope="class")
+def resolver_verify() -> LocalSourceResolver:
+    return LocalSourceResolver(verify_hash=True)
+
+
 class TestLocalSourceResolver:
     """LocalSourceResolver: file location strategies."""
 
-    def test_storage_name_match(self) -> None:
+    def test_storage_name_match(self, resolver_noverify: LocalSourceResolver) -> None:
         """Finds file by storage_name (renamed file)."""
-        resolver = LocalSourceResolver(verify_hash=False)
         entry = _make_file_entry(
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
-        result = resolver.resolve(entry, FIXTURES / "renamed")
+        result = resolver_noverify.resolve(entry, FIXTURES / "renamed")
         assert result is not None
         assert result.name == "y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe"
 
-    def test_original_name_match(self) -> None:
+    def test_original_name_match(self, resolver_noverify: LocalSourceResolver) -> None:
         """Finds file by original name (non-renamed file)."""
-        resolver = LocalSourceResolver(verify_hash=False)
         entry = _make_file_entry(
             name="readme.txt",
             storage_name="ySOMETHINGELSE.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
         )
-        result = resolver.resolve(entry, FIXTURES / "non-renamed")
+        result = resolver_noverify.resolve(entry, FIXTURES / "non-renamed")
         assert result is not None
         assert result.name == "readme.txt"
 
-    def test_not_found(self) -> None:
+    def test_not_found(self, resolver_noverify: LocalSourceResolver) -> None:
         """Returns None when file cannot be found."""
-        resolver = LocalSourceResolver(verify_hash=False)
         entry = _make_file_entry(
             name="doesnotexist.txt",
             storage_name="yNONEXISTENT.txt",
         )
-        result = resolver.resolve(entry, FIXTURES / "renamed")
+        result = resolver_noverify.resolve(entry, FIXTURES / "renamed")
         assert result is None
 
-    def test_none_search_dir(self) -> None:
+    def test_none_search_dir(self, resolver_noverify: LocalSourceResolver) -> None:
         """Returns None when search_dir is None."""
-        resolver = LocalSourceResolver(verify_hash=False)
         entry = _make_file_entry()
-        result = resolver.resolve(entry, None)
+        result = resolver_noverify.resolve(entry, None)
         assert result is None
 
-    def test_hash_verification_pass(self) -> None:
+    def test_hash_verification_pass(
+        self, resolver_verify: LocalSourceResolver, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """Hash verification passes for matching content."""
-        resolver = LocalSourceResolver(verify_hash=True)
         entry = _make_file_entry(
             name="readme.txt",
             storage_name="yNONEXISTENT.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
         )
+        import logging
+
         # The file exists and hash should match
-        result = resolver.resolve(entry, FIXTURES / "non-renamed")
+        with caplog.at_level(logging.WARNING, logger="shruggie_indexer.core.rollback"):
+            result = resolver_verify.resolve(entry, FIXTURES / "non-renamed")
         assert result is not None
+        assert not any("Hash mismatch" in msg for _, _, msg in caplog.record_tuples)
 
     def test_hash_verification_mismatch_logs_warning(
-        self, caplog: pytest.LogCaptureFixture
+        self, resolver_verify: LocalSourceResolver, caplog: pytest.LogCaptureFixture
     ) -> None:
         """Hash verification mismatch logs a warning but still returns path."""
-        resolver = LocalSourceResolver(verify_hash=True)
         entry = _make_file_entry(
             name="readme.txt",
             storage_name="yNONEXISTENT.txt",
@@ -344,9 +551,43 @@ class TestLocalSourceResolver:
         import logging
 
         with caplog.at_level(logging.WARNING, logger="shruggie_indexer.core.rollback"):
-            result = resolver.resolve(entry, FIXTURES / "non-renamed")
+            result = resolver_verify.resolve(entry, FIXTURES / "non-renamed")
         assert result is not None  # Still returns the path
-        assert any("Hash mismatch" in r.message for r in caplog.records)
+        assert any("Hash mismatch" in msg for _, _, msg in caplog.record_tuples)
+
+    def test_size_mismatch_skips_hashing(self, caplog: pytest.LogCaptureFixture) -> None:
+        """A size that differs from the sidecar is a mismatch without reading content."""
+        entry = dataclasses.replace(
+            _make_file_entry(name="readme.txt", md5=_MD5_README),
+            size=SizeObject(text="1 B", bytes=1),
+        )
+        import logging
+
+        resolver = LocalSourceResolver(verify_hash=True)
+        with (
+            patch.object(rollback, "_digest_file") as digest,
+            caplog.at_level(logging.WARNING, logger="shruggie_indexer.core.rollback"),
+        ):
+            result = resolver.resolve(entry, FIXTURES / "non-renamed")
+        assert result is not None
+        digest.assert_not_called()
+        assert any("Hash mismatch" in msg for _, _, msg in caplog.record_tuples)
+
+    def test_directory_listed_once(self) -> None:
+        """Repeated lookups in one directory reuse a single scandir() listing."""
+        resolver = LocalSourceResolver(verify_hash=False)
+        entries = [
+            _make_file_entry(
+                name="flashplayer.exe",
+                storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
+            ),
+            _make_file_entry(name="missing.txt", storage_name="yMISSING.txt"),
+        ]
+        with patch.object(rollback.os, "scandir", wraps=os.scandir) as scandir:
+            results = [resolver.resolve(e, FIXTURES / "renamed") for e in entries]
+        assert results[0] is not None
+        assert results[1] is None
+        assert scandir.call_count == 1
 
 
 # ===========================================================================
@@ -357,43 +598,43 @@ class TestLocalSourceResolver:
 class TestPlanRollback:
     """plan_rollback() for various scenarios."""
 
-    def test_renamed_file_structured(self, tmp_path: Path) -> None:
+    def test_renamed_file_structured(self, empty_target: Path) -> None:
         """Renamed file restores to structured path."""
         entry = _make_file_entry(
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="testdir/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "renamed",
             verify=False,
         )
-        restores = [a for a in plan.actions if a.action_type == "restore" and not a.skip_reason]
+        restores = plan.by_type()["restore"]
         assert len(restores) == 1
-        assert restores[0].target_path == tmp_path / "testdir" / "flashplayer.exe"
+        assert restores[0].target_path == empty_target / "testdir" / "flashplayer.exe"
         assert plan.stats.files_to_restore == 1
 
-    def test_non_renamed_file(self, tmp_path: Path) -> None:
+    def test_non_renamed_file(self, empty_target: Path) -> None:
         """Non-renamed file found by original name."""
         entry = _make_file_entry(
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
         )
         plan = plan_rollback(
             [entry],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "non-renamed",
             verify=False,
         )
-        restores = [a for a in plan.actions if a.action_type == "restore" and not a.skip_reason]
+        restores = plan.by_type()["restore"]
         assert len(restores) == 1
 
-    def test_source_not_found(self, tmp_path: Path) -> None:
+    def test_source_not_found(self, empty_target: Path) -> None:
         """Missing source file produces skipped action."""
         entry = _make_file_entry(
             name="ghost.txt",
@@ -402,26 +643,26 @@ class TestPlanRollback:
         )
         plan = plan_rollback(
             [entry],
-            target_dir=tmp_path,
-            source_dir=tmp_path,
+            target_dir=empty_target,
+            source_dir=empty_target,
             verify=False,
         )
-        skipped = [a for a in plan.actions if a.skip_reason]
+        skipped = plan.by_type()["skipped"]
         assert len(skipped) == 1
         assert skipped[0].skip_reason == "Source file not found"
         assert plan.stats.skipped_unresolvable == 1
 
-    def test_path_traversal_rejected(self, tmp_path: Path) -> None:
+    def test_path_traversal_rejected(self, empty_target: Path) -> None:
         """Path with .. segments is rejected."""
         entry = _make_file_entry(
             name="evil.txt",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="../../../etc/evil.txt",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "renamed",
             verify=False,
         )
@@ -438,7 +679,7 @@ class TestPlanRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
         )
         plan = plan_rollback(
             [entry],
@@ -446,7 +687,7 @@ class TestPlanRollback:
             source_dir=FIXTURES / "non-renamed",
             verify=True,
         )
-        skipped = [a for a in plan.actions if a.skip_reason]
+        skipped = plan.by_type()["skipped"]
         assert len(skipped) == 1
         assert "Already exists (same content)" in skipped[0].skip_reason
         assert plan.stats.skipped_already_exists == 1
@@ -460,7 +701,7 @@ class TestPlanRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
         )
         plan = plan_rollback(
             [entry],
@@ -469,7 +710,7 @@ class TestPlanRollback:
             verify=True,
             force=False,
         )
-        skipped = [a for a in plan.actions if a.skip_reason]
+        skipped = plan.by_type()["skipped"]
         assert len(skipped) == 1
         assert "Already exists (different content)" in skipped[0].skip_reason
         assert plan.stats.skipped_conflict == 1
@@ -483,7 +724,7 @@ class TestPlanRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
         )
         plan = plan_rollback(
             [entry],
@@ -492,10 +733,10 @@ class TestPlanRollback:
             verify=True,
             force=True,
         )
-        restores = [a for a in plan.actions if a.action_type == "restore" and not a.skip_reason]
+        restores = plan.by_type()["restore"]
         assert len(restores) == 1
 
-    def test_skip_duplicates_flag(self, tmp_path: Path) -> None:
+    def test_skip_duplicates_flag(self, empty_target: Path) -> None:
         """skip_duplicates=True excludes duplicate entries."""
         entries = load_meta2(
             FIXTURES / "deduplicated" / "y2FFA202F241801EF7FF9C7212EBBC693.jpg_meta2.json",
@@ -504,7 +745,7 @@ class TestPlanRollback:
 
         plan = plan_rollback(
             entries,
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "deduplicated",
             verify=False,
             skip_duplicates=True,
@@ -512,19 +753,19 @@ class TestPlanRollback:
         dup_actions = [a for a in plan.actions if a.action_type == "duplicate_restore"]
         assert len(dup_actions) == 0
 
-    def test_sidecar_restoration_planned(self, tmp_path: Path) -> None:
+    def test_sidecar_restoration_planned(self, empty_target: Path) -> None:
         """Sidecar metadata with origin=sidecar creates sidecar_restore action."""
         meta = _make_sidecar_metadata()
         entry = _make_file_entry(
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
             [entry],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "non-renamed",
             verify=False,
         )
@@ -532,19 +773,19 @@ class TestPlanRollback:
         assert len(sidecar_actions) == 1
         assert sidecar_actions[0].legacy_payload is not None
 
-    def test_no_sidecar_restoration_when_disabled(self, tmp_path: Path) -> None:
+    def test_no_sidecar_restoration_when_disabled(self, empty_target: Path) -> None:
         """restore_sidecars=False suppresses sidecar restoration."""
         meta = _make_sidecar_metadata()
         entry = _make_file_entry(
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
             [entry],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "non-renamed",
             verify=False,
             restore_sidecars=False,
@@ -552,37 +793,37 @@ class TestPlanRollback:
         sidecar_actions = [a for a in plan.actions if a.action_type == "sidecar_restore"]
         assert len(sidecar_actions) == 0
 
-    def test_v4_entries_do_not_plan_legacy_sidecar_restoration(self, tmp_path: Path) -> None:
+    def test_v4_entries_do_not_plan_legacy_sidecar_restoration(self, empty_target: Path) -> None:
         """Schema v4 entries never enter the legacy sidecar reconstruction path."""
         meta = _make_sidecar_metadata()
         entry = _make_file_entry(
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
             schema_version=4,
         )
         plan = plan_rollback(
             [entry],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "non-renamed",
             verify=False,
         )
         sidecar_actions = [a for a in plan.actions if a.action_type == "sidecar_restore"]
         assert sidecar_actions == []
 
-    def test_directory_actions_created(self, tmp_path: Path) -> None:
+    def test_directory_actions_created(self, empty_target: Path) -> None:
         """Structured mode creates mkdir actions for subdirectories."""
         entry = _make_file_entry(
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="testdir/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "renamed",
             verify=False,
         )
@@ -596,63 +837,55 @@ class TestPlanRollback:
 # ===========================================================================
 
 
+@pytest.fixture(scope="class")
+def flat_plan(empty_target: Path) -> RollbackPlan:
+    """Flat-mode plan for one deeply nested renamed file, planned once."""
+    entry = _make_file_entry(
+        name="flashplayer.exe",
+        storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
+        relative="deeply/nested/path/flashplayer.exe",
+        md5=_MD5_FLASH,
+    )
+    return plan_rollback(
+        [entry],
+        target_dir=empty_target,
+        source_dir=FIXTURES / "renamed",
+        verify=False,
+        flat=True,
+    )
+
+
 class TestPlanRollbackFlat:
     """Flat mode planning."""
 
-    def test_flat_target_path(self, tmp_path: Path) -> None:
+    def test_flat_target_path(self, flat_plan: RollbackPlan, empty_target: Path) -> None:
         """Flat mode uses name.text directly in target_dir."""
-        entry = _make_file_entry(
-            name="flashplayer.exe",
-            storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
-            relative="deeply/nested/path/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
-        )
-        plan = plan_rollback(
-            [entry],
-            target_dir=tmp_path,
-            source_dir=FIXTURES / "renamed",
-            verify=False,
-            flat=True,
-        )
-        restores = [a for a in plan.actions if a.action_type == "restore" and not a.skip_reason]
+        restores = flat_plan.by_type()["restore"]
         assert len(restores) == 1
-        assert restores[0].target_path == tmp_path / "flashplayer.exe"
+        assert restores[0].target_path == empty_target / "flashplayer.exe"
 
-    def test_flat_no_mkdir(self, tmp_path: Path) -> None:
+    def test_flat_no_mkdir(self, flat_plan: RollbackPlan) -> None:
         """Flat mode does not create mkdir actions."""
-        entry = _make_file_entry(
-            name="flashplayer.exe",
-            storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
-            relative="deeply/nested/path/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
-        )
-        plan = plan_rollback(
-            [entry],
-            target_dir=tmp_path,
-            source_dir=FIXTURES / "renamed",
-            verify=False,
-            flat=True,
-        )
-        mkdir_actions = [a for a in plan.actions if a.action_type == "mkdir"]
+        mkdir_actions = [a for a in flat_plan.actions if a.action_type == "mkdir"]
         assert len(mkdir_actions) == 0
 
-    def test_flat_collision(self, tmp_path: Path) -> None:
+    def test_flat_collision(self, empty_target: Path) -> None:
         """Flat mode collision: same name.text from different entries."""
         entry1 = _make_file_entry(
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="dir1/readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
         )
         entry2 = _make_file_entry(
             name="readme.txt",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="dir2/readme.txt",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry1, entry2],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "non-renamed",
             verify=False,
             flat=True,
@@ -670,7 +903,7 @@ class TestPlanRollbackFlat:
 class TestPlanRollbackMixedSessions:
     """Mixed-session warnings."""
 
-    def test_mixed_sessions_warning_structured(self, tmp_path: Path) -> None:
+    def test_mixed_sessions_warning_structured(self, empty_target: Path) -> None:
         """Structured mode with mixed session_ids emits warning."""
         entry1 = _make_file_entry(
             name="beach.jpg",
@@ -688,14 +921,14 @@ class TestPlanRollbackMixedSessions:
         )
         plan = plan_rollback(
             [entry1, entry2],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "mixed-sessions",
             verify=False,
         )
         assert len(plan.warnings) == 1
         assert "distinct indexing sessions" in plan.warnings[0]
 
-    def test_no_warning_in_flat_mode(self, tmp_path: Path) -> None:
+    def test_no_warning_in_flat_mode(self, empty_target: Path) -> None:
         """Flat mode with mixed sessions does NOT emit warning."""
         entry1 = _make_file_entry(
             name="beach.jpg",
@@ -713,20 +946,20 @@ class TestPlanRollbackMixedSessions:
         )
         plan = plan_rollback(
             [entry1, entry2],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "mixed-sessions",
             verify=False,
             flat=True,
         )
         assert len(plan.warnings) == 0
 
-    def test_no_warning_single_session(self, tmp_path: Path) -> None:
+    def test_no_warning_single_session(self, empty_target: Path) -> None:
         """Single session does not emit warning."""
         entry1 = _make_file_entry(
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="testdir/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
             session_id="same-session-id",
         )
         entry2 = _make_file_entry(
@@ -738,7 +971,7 @@ class TestPlanRollbackMixedSessions:
         )
         plan = plan_rollback(
             [entry1, entry2],
-            target_dir=tmp_path,
+            target_dir=empty_target,
             source_dir=FIXTURES / "renamed",
             verify=False,
         )
@@ -754,12 +987,9 @@ class TestTargetDefault:
     """Core engine always receives explicit target_dir."""
 
     def test_target_dir_is_required(self) -> None:
-        """plan_rollback() signature requires target_dir (not optional)."""
-        import inspect
-
-        sig = inspect.signature(plan_rollback)
-        param = sig.parameters["target_dir"]
-        assert param.default is inspect.Parameter.empty
+        """plan_rollback() requires target_dir (not optional)."""
+        with pytest.raises(TypeError, match="target_dir"):
+            plan_rollback([])  # type: ignore[call-arg]
 
 
 # ===========================================================================
@@ -776,7 +1006,7 @@ class TestExecuteRollback:
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="testdir/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry],
@@ -796,7 +1026,7 @@ class TestExecuteRollback:
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="testdir/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry],
@@ -813,9 +1043,8 @@ class TestExecuteRollback:
 
         # Verify timestamps BEFORE read_bytes (reading updates atime)
         stat = restored.stat()
-        expected_mtime = 1691106464000 / 1000  # Convert ms → s
-        expected_atime = 1771165698109 / 1000
-        assert abs(stat.st_mtime - expected_mtime) < 2
+        expected_atime = 1771165698109 / 1000  # Convert ms → s
+        assert stat.st_mtime_ns // 1_000_000 == 1691106464000  # Exact to the ms
         assert abs(stat.st_atime - expected_atime) < 2
 
         assert (
@@ -829,7 +1058,7 @@ class TestExecuteRollback:
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="deep/nested/dir/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry],
@@ -870,7 +1099,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -900,7 +1129,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -932,7 +1161,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -957,7 +1186,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -984,7 +1213,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -1015,7 +1244,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -1041,7 +1270,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -1072,7 +1301,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -1103,7 +1332,7 @@ class TestExecuteRollback:
             name="readme.txt",
             storage_name="y0654CDF77702945DA87A8B4E72E98EEE.txt",
             relative="readme.txt",
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             metadata=[meta],
         )
         plan = plan_rollback(
@@ -1124,7 +1353,7 @@ class TestExecuteRollback:
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         entry2 = _make_file_entry(
             name="testfile.txt",
@@ -1145,13 +1374,73 @@ class TestExecuteRollback:
         # Should have stopped early — total restored + failed < total planned
         assert result.restored + result.failed < 2
 
+    def test_cancel_during_parallel_copy_counts_every_written_file(self, tmp_path: Path) -> None:
+        """Copies still running when a cancel is seen are recorded, not lost."""
+        entries = [
+            _make_file_entry(
+                name="flashplayer.exe",
+                storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
+                relative=f"d{i:02d}/flashplayer.exe",
+                md5=f"{i:032X}",  # Distinct digests, so nothing is deduplicated.
+            )
+            for i in range(3 * rollback._COPY_WORKERS)
+        ]
+        plan = plan_rollback(
+            entries,
+            target_dir=tmp_path,
+            source_dir=FIXTURES / "renamed",
+            verify=False,
+        )
+        cancel = threading.Event()
+
+        def _copy(src: Path, dst: Path) -> None:
+            dst.write_bytes(src.read_bytes())
+            cancel.set()
+            time.sleep(0.01)  # Keep the other workers' copies in flight.
+
+        with patch("shruggie_indexer.core.rollback._copy_file", side_effect=_copy):
+            result = execute_rollback(plan, cancel_event=cancel)
+
+        written = list(tmp_path.glob("d*/flashplayer.exe"))
+        assert 0 < len(written) < len(entries)
+        assert result.restored == len(written)
+        assert result.failed == 0
+
+    def test_dry_run_cancellation_polled_per_batch(self, empty_target: Path) -> None:
+        """Cheap dry-run iterations poll the cancel event once per batch."""
+        n_dirs = rollback._CANCEL_CHECK_INTERVAL + 6
+        entries = [
+            _make_file_entry(
+                name="flashplayer.exe",
+                storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
+                relative=f"d{i:03d}/flashplayer.exe",
+                md5=f"{i:032X}",  # Distinct digests, so nothing is deduplicated.
+            )
+            for i in range(n_dirs)
+        ]
+        plan = plan_rollback(
+            entries,
+            target_dir=empty_target,
+            source_dir=FIXTURES / "renamed",
+            verify=False,
+        )
+        assert plan.stats.directories_to_create == n_dirs
+        cancel = threading.Event()
+
+        result = execute_rollback(
+            plan, dry_run=True, cancel_event=cancel, progress_callback=lambda _e: cancel.set()
+        )
+        # Set during the first item, noticed at the next batch boundary.
+        assert result.directories_created == rollback._CANCEL_CHECK_INTERVAL
+        assert result.restored == 0
+
     def test_error_handling_copy_failure(self, tmp_path: Path) -> None:
         """Copy failure is caught and recorded."""
         entry = _make_file_entry(
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry],
@@ -1160,12 +1449,61 @@ class TestExecuteRollback:
             verify=False,
         )
 
-        # Mock shutil.copy2 to raise
-        with patch("shruggie_indexer.core.rollback.shutil.copy2", side_effect=OSError("disk full")):
+        # Mock the copy primitive to raise
+        with patch("shruggie_indexer.core.rollback._copy_file", side_effect=OSError("disk full")):
             result = execute_rollback(plan)
         assert result.failed == 1
         assert len(result.errors) == 1
         assert "disk full" in result.errors[0]
+        assert result.errors_truncated == 0
+
+    def test_error_list_is_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Messages past the cap are counted, not stored."""
+        from shruggie_indexer.core.rollback import RollbackResult
+
+        monkeypatch.setattr(rollback, "_MAX_RESULT_ERRORS", 3)
+        result = RollbackResult()
+        for i in range(5):
+            result.record_error(f"error {i}")
+        assert result.errors == ["error 0", "error 1", "error 2"]
+        assert result.errors_truncated == 2
+
+    def test_parallel_copies_account_each_outcome(self, tmp_path: Path) -> None:
+        """Multi-file phases run on the worker pool; each outcome is counted once."""
+        entry1 = _make_file_entry(
+            name="flashplayer.exe",
+            storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
+            relative="flashplayer.exe",
+            md5=_MD5_FLASH,
+        )
+        entry2 = _make_file_entry(
+            name="testfile.txt",
+            storage_name="y1EC051B0043B6D653CC431DE3F2EE2F1.txt",
+            relative="testfile.txt",
+            md5="1EC051B0043B6D653CC431DE3F2EE2F1",
+        )
+        plan = plan_rollback(
+            [entry1, entry2],
+            target_dir=tmp_path,
+            source_dir=FIXTURES / "renamed",
+            verify=False,
+        )
+
+        import shutil
+
+        def _copy(src: Path, dst: Path) -> None:
+            if dst.suffix == ".exe":
+                raise OSError("disk full")
+            shutil.copyfile(src, dst)
+
+        with patch("shruggie_indexer.core.rollback._copy_file", side_effect=_copy):
+            result = execute_rollback(plan)
+        assert result.restored == 1
+        assert result.failed == 1
+        assert len(result.errors) == 1
+        assert "flashplayer.exe" in result.errors[0]
+        assert (tmp_path / "testfile.txt").exists()
+        assert not (tmp_path / "flashplayer.exe").exists()
 
     def test_flat_mode_execution(self, tmp_path: Path) -> None:
         """Flat mode places files directly in target directory."""
@@ -1173,7 +1511,7 @@ class TestExecuteRollback:
             name="flashplayer.exe",
             storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
             relative="deeply/nested/flashplayer.exe",
-            md5="0EA30B0C7E392876DAAA2D55EF6AEA3E",
+            md5=_MD5_FLASH,
         )
         plan = plan_rollback(
             [entry],
@@ -1188,6 +1526,38 @@ class TestExecuteRollback:
         assert (tmp_path / "flashplayer.exe").exists()
         assert not (tmp_path / "deeply").exists()
 
+    def test_missing_target_root_created_once(self, tmp_path: Path) -> None:
+        """A target root with no mkdir action is created once, before any copy."""
+        entries = [
+            _make_file_entry(
+                name="flashplayer.exe",
+                storage_name="y0EA30B0C7E392876DAAA2D55EF6AEA3E.exe",
+                md5=_MD5_FLASH,
+            ),
+            _make_file_entry(
+                name="testfile.txt",
+                storage_name="y1EC051B0043B6D653CC431DE3F2EE2F1.txt",
+                md5="1EC051B0043B6D653CC431DE3F2EE2F1",
+            ),
+        ]
+        target = tmp_path / "new" / "root"
+        plan = plan_rollback(
+            entries,
+            target_dir=target,
+            source_dir=FIXTURES / "renamed",
+            verify=False,
+            flat=True,
+        )
+        with patch.object(type(target), "mkdir", autospec=True, side_effect=Path.mkdir) as mkdir:
+            result = execute_rollback(plan)
+        assert result.restored == 2
+        assert result.failed == 0
+        # Ignore pathlib's own recursive calls (parents=False for the retry).
+        requested = [c.args[0] for c in mkdir.call_args_list if c.kwargs.get("parents")]
+        assert requested.count(target) == 1
+        assert (target / "flashplayer.exe").is_file()
+        assert (target / "testfile.txt").is_file()
+
 
 # ===========================================================================
 # TestVerifyFileHash
@@ -1201,11 +1571,20 @@ class TestVerifyFileHash:
         """Correct hash returns True."""
         path = FIXTURES / "non-renamed" / "readme.txt"
         expected = HashSet(
-            md5="0654CDF77702945DA87A8B4E72E98EEE",
+            md5=_MD5_README,
             sha256="0CB544DD1D4A81D757E5BDBFE8474C2303377608B091A672A57D38FEE2A27440",
         )
         assert verify_file_hash(path, expected, "md5") is True
 
+    def test_matching_sha256(self) -> None:
+        """Non-default algorithms are computed and compared case-insensitively."""
+        path = FIXTURES / "non-renamed" / "readme.txt"
+        expected = HashSet(
+            md5="FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF",
+            sha256="0cb544dd1d4a81d757e5bdbfe8474c2303377608b091a672a57d38fee2a27440",
+        )
+        assert verify_file_hash(path, expected, "sha256") is True
+
     def test_non_matching_hash(self) -> None:
         """Wrong hash returns False."""
         path = FIXTURES / "non-renamed" / "readme.txt"
@@ -1218,10 +1597,34 @@ class TestVerifyFileHash:
     def test_missing_algorithm(self) -> None:
         """Missing algorithm in HashSet returns False."""
         path = FIXTURES / "non-renamed" / "readme.txt"
-        expected = HashSet(md5="0654CDF77702945DA87A8B4E72E98EEE", sha256="X")
+        expected = HashSet(md5=_MD5_README, sha256="X")
         # sha512 is None by default → requesting sha512 should return False
         assert verify_file_hash(path, expected, "sha512") is False
 
+    def test_expected_size_mismatch_rejects_without_hashing(self) -> None:
+        """A size mismatch returns False before any content is hashed."""
+        path = FIXTURES / "non-renamed" / "readme.txt"
+        expected = _make_hashset(_MD5_README)
+        with patch.object(rollback, "_digest_file") as digest:
+            assert verify_file_hash(path, expected, "md5", expected_size=1) is False
+        digest.assert_not_called()
+        assert verify_file_hash(path, expected, "md5", expected_size=46) is True
+
+    def test_large_file_memory_mapped(self, tmp_path: Path) -> None:
+        """Files above the mmap threshold hash the same as chunked reads."""
+        import hashlib
+
+        content = os.urandom(rollback._MMAP_VERIFY_THRESHOLD + 12345)
+        path = tmp_path / "large.bin"
+        path.write_bytes(content)
+        expected = HashSet(
+            md5=hashlib.md5(content).hexdigest().upper(),
+            sha256=hashlib.sha256(content).hexdigest().upper(),
+        )
+        assert verify_file_hash(path, expected, "md5") is True
+        assert verify_file_hash(path, expected, "sha256") is True
+        assert verify_file_hash(path, _make_hashset(), "md5") is False
+
 
 # ===========================================================================
 # TestOriginDirAnnotation
@@ -1367,6 +1770,56 @@ class TestPlanRollbackLogging:
         assert "restore_sidecars=False" in msg
 
 
+# ===========================================================================
+# TestCopyFile
+# ===========================================================================
+
+
+class TestCopyFile:
+    """_copy_file(): in-kernel copy with userspace fallback."""
+
+    def test_copies_content_and_mode(self, tmp_path: Path) -> None:
+        from shruggie_indexer.core.rollback import _copy_file
+
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"payload" * 1000)
+        src.chmod(0o640)
+        dst = tmp_path / "dst.bin"
+        _copy_file(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+        if os.name != "nt":
+            assert dst.stat().st_mode & 0o777 == 0o640
+
+    def test_empty_source(self, tmp_path: Path) -> None:
+        from shruggie_indexer.core.rollback import _copy_file
+
+        src = tmp_path / "empty"
+        src.write_bytes(b"")
+        dst = tmp_path / "copy"
+        _copy_file(src, dst)
+        assert dst.read_bytes() == b""
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs copy_file_range")
+    def test_falls_back_when_kernel_refuses(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import errno
+
+        from shruggie_indexer.core.rollback import _copy_file
+
+        def _refuse(*args: object) -> int:
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(os, "copy_file_range", _refuse)
+        src = tmp_path / "src.txt"
+        src.write_text("fallback content", encoding="utf-8")
+        src.chmod(0o640)
+        dst = tmp_path / "dst.txt"
+        _copy_file(src, dst)
+        assert dst.read_text(encoding="utf-8") == "fallback content"
+        assert dst.stat().st_mode & 0o777 == 0o640
+
+
 # ===========================================================================
 # TestSetWindowsCreationTime
 # ===========================================================================
@@ -1647,9 +2100,7 @@ class TestContentHashCollisionDetection:
         )
 
         # The stale entry should be gone — no restore action for data/FeedsExport.7z
-        target_paths = {
-            a.target_path for a in plan.actions if a.action_type == "restore" and not a.skip_reason
-        }
+        target_paths = {a.target_path for a in plan.by_type()["restore"]}
         assert target_dir / "FeedsExport.7z" in target_paths
         assert target_dir / "data" / "FeedsExport.7z" not in target_paths
 
@@ -1754,9 +2205,7 @@ class TestContentHashCollisionDetection:
             verify=False,
         )
 
-        restore_targets = {
-            a.target_path for a in plan.actions if a.action_type == "restore" and not a.skip_reason
-        }
+        restore_targets = {a.target_path for a in plan.by_type()["restore"]}
         assert target_dir / "images" / "slippers.gif" in restore_targets
         assert target_dir / "images" / "slippers.png" in restore_targets
 
@@ -1966,9 +2415,7 @@ class TestLegacyPrefixDetection:
             verify=False,
         )
 
-        target_paths = {
-            a.target_path for a in plan.actions if a.action_type == "restore" and not a.skip_reason
-        }
+        target_paths = {a.target_path for a in plan.by_type()["restore"]}
         # Should be under target_dir directly, NOT target_dir/data/
         assert target_dir / "images" / "slippers.gif" in target_paths
         assert target_dir / "123.nfo" in target_paths
@@ -2146,6 +2593,26 @@ class TestJsonIndentRestoration:
         result = _restore_json({"key": "value"}, attrs)
         assert result == '{"key":"value"}'
 
+    @pytest.mark.parametrize("pretty", [False, True])
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"a": [], "b": {}, "c": [1, 2.5, None, True], "d": "caf\u00e9 \u2028"},
+            {"tiny": 1.5e-05, "huge": 1e16, "zero": -0.0},
+            {"big": 2**70, "nan": float("nan")},
+        ],
+        ids=["plain", "floats", "out-of-range"],
+    )
+    def test_output_matches_stdlib_json(self, data: object, pretty: bool) -> None:
+        """Serialized text is identical to json.dumps whichever encoder runs."""
+        from shruggie_indexer.core.rollback import _dumps_json
+
+        if pretty:
+            expected = json.dumps(data, indent=2, ensure_ascii=False)
+        else:
+            expected = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        assert _dumps_json(data, pretty=pretty) == expected
+
 
 class TestLegacyV2SidecarRestoration:
     """Tests for backward compatibility with v2-era sidecar entries."""
@@ -2192,6 +2659,34 @@ class TestLegacyV2SidecarRestoration:
         text = data.decode("utf-8")
         assert '  "title"' in text
 
+    @pytest.mark.parametrize(
+        "enc",
+        [
+            None,
+            EncodingObject(line_endings="lf", detected_encoding="ascii"),
+            EncodingObject(line_endings="crlf", detected_encoding="utf-8"),
+            EncodingObject(bom="utf-8", detected_encoding="utf-8"),
+            EncodingObject(detected_encoding="utf-16-le"),
+        ],
+        ids=["none", "ascii-lf", "crlf", "bom", "utf-16"],
+    )
+    def test_lines_sidecar_matches_text_encoding(self, enc: EncodingObject | None) -> None:
+        """format=lines bytes equal the joined text run through _apply_text_encoding."""
+        from shruggie_indexer.core.rollback import _apply_text_encoding, _decode_sidecar_data
+
+        lines = ["1", "00:00:00,000 --> 00:00:02,000", "H\u00e9llo", ""]
+        meta = MetadataEntry(
+            id="yABCDEF0123456789ABCDEF0123456789",
+            origin="sidecar",
+            name=NameObject(text="video.srt", hashes=_make_hashset()),
+            hashes=_make_hashset(),
+            attributes=MetadataAttributes(type="subtitles", format="lines", transforms=[]),
+            data=lines,
+        )
+        meta.encoding = enc
+        data, _is_binary = _decode_sidecar_data(meta)
+        assert data == _apply_text_encoding("\n".join(lines), enc)
+
 
 class TestFullRoundTrip:
     """End-to-end round-trip test: encode → restore → compare bytes."""
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import Any
 
 import pytest
@@ -26,6 +27,8 @@ from shruggie_indexer.models.schema import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+_UPPER_HEX_CHARS = frozenset("0123456789ABCDEF")
+
 
 def _make_hashset() -> HashSet:
     return HashSet(
@@ -95,6 +98,32 @@ class TestIndexEntryConstruction:
                 attributes=AttributesObject(is_link=False, storage_name="y123.jpg"),
             )
 
+    def test_low_cardinality_strings_interned(self) -> None:
+        """Equal type/id_algorithm/extension/mime_type values share one object."""
+        # Build the values at runtime so they start out as distinct objects.
+        a = _make_index_entry(
+            type="".join(["fi", "le"]),
+            id_algorithm="".join(["md", "5"]),
+            extension="".join(["jp", "g"]),
+            mime_type="".join(["image/", "jpeg"]),
+        )
+        b = _make_index_entry(
+            type="".join(["fil", "e"]),
+            id_algorithm="".join(["m", "d5"]),
+            extension="".join(["j", "pg"]),
+            mime_type="".join(["image/j", "peg"]),
+        )
+        assert a.type is b.type
+        assert a.id_algorithm is b.id_algorithm
+        assert a.extension is b.extension
+        assert a.mime_type is b.mime_type
+
+    def test_none_extension_and_mime_type_kept(self) -> None:
+        """Optional interned fields stay None when absent."""
+        entry = _make_index_entry(extension=None)
+        assert entry.extension is None
+        assert entry.mime_type is None
+
 
 class TestHashSetUppercase:
     """Tests for the uppercase hex invariant."""
@@ -106,8 +135,8 @@ class TestHashSetUppercase:
         for producing uppercase hex, and the dataclass stores what it receives.
         """
         hs = HashSet(md5="ABCDEF0123456789" * 2, sha256="ABCDEF0123456789" * 4)
-        assert all(c in "0123456789ABCDEF" for c in hs.md5)
-        assert all(c in "0123456789ABCDEF" for c in hs.sha256)
+        assert set(hs.md5) <= _UPPER_HEX_CHARS
+        assert set(hs.sha256) <= _UPPER_HEX_CHARS
 
 
 class TestToDict:
@@ -133,6 +162,19 @@ class TestToDict:
         assert keys[0] == "schema_version"
         assert d["schema_version"] == 4
 
+    def test_keys_in_canonical_order(self) -> None:
+        """to_dict() emits keys in the serializer's canonical order."""
+        from shruggie_indexer.core.serializer import _TOP_LEVEL_KEY_ORDER
+        from shruggie_indexer.models.schema import EncodingObject
+
+        entry = _make_index_entry(
+            encoding=EncodingObject(line_endings="lf"),
+            relationships=[],
+            duplicates=[_make_index_entry()],
+        )
+        keys = [k for k in entry.to_dict() if k in _TOP_LEVEL_KEY_ORDER]
+        assert keys == [k for k in _TOP_LEVEL_KEY_ORDER if k in keys]
+
 
 class TestRelationshipSerialization:
     """Tests for v4 relationship annotation structures."""
@@ -183,3 +225,16 @@ class TestNameObjectCoNull:
             NameObject(text="a", hashes=None)
         with pytest.raises(ValueError, match="co-null"):
             NameObject(text=None, hashes=_make_hashset())
+
+    def test_name_object_replace_revalidates(self) -> None:
+        """dataclasses.replace() goes through the validating __init__."""
+        name = NameObject(text="a", hashes=_make_hashset())
+        assert dataclasses.replace(name, text="b") == NameObject(text="b", hashes=_make_hashset())
+        with pytest.raises(ValueError, match="co-null"):
+            dataclasses.replace(name, hashes=None)
+
+    def test_per_entry_value_objects_are_slotted(self) -> None:
+        """Small per-entry objects carry no instance __dict__."""
+        pair = TimestampPair(iso="2024-01-01T00:00:00Z", unix=0)
+        for obj in (_make_hashset(), _make_name_object(), SizeObject(text="0 B", bytes=0), pair):
+            assert not hasattr(obj, "__dict__")
@@ -5,14 +5,17 @@
 
 from __future__ import annotations
 
-import json
-from io import StringIO
+import dataclasses
+import os
+import sys
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
-from shruggie_indexer.config.loader import load_config
-from shruggie_indexer.config.types import IndexerConfig
+import orjson
+import pytest
+
 from shruggie_indexer.core.serializer import (
     serialize_entry,
     write_inplace,
@@ -23,11 +26,14 @@ from shruggie_indexer.models.schema import (
     FileSystemObject,
     HashSet,
     IndexEntry,
+    MetadataAttributes,
+    MetadataEntry,
     NameObject,
     SizeObject,
     TimestampPair,
     TimestampsObject,
 )
+from tests.helpers import cached_config as _cfg
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -42,30 +48,34 @@ def _make_hashset(*, sha512: str | None = None) -> HashSet:
     )
 
 
+_PAIR = TimestampPair(iso="2024-01-01T00:00:00.000000+00:00", unix=1704067200000)
+
+# Shared hash set for fixtures.  HashSet is a mutable dataclass, so tests
+# must treat it as read-only.
+_HASHSET = _make_hashset()
+
+# Baseline entry for _make_entry.  Tests only read entries (never mutate
+# the nested objects), so the sub-objects can be shared between them.
+_BASE_ENTRY = IndexEntry(
+    schema_version=4,
+    id="yD41D8CD98F00B204E9800998ECF8427E",
+    id_algorithm="md5",
+    type="file",
+    name=NameObject(text="test.txt", hashes=_HASHSET),
+    extension="txt",
+    size=SizeObject(text="0 B", bytes=0),
+    hashes=_HASHSET,
+    file_system=FileSystemObject(relative="test.txt", parent=None),
+    timestamps=TimestampsObject(created=_PAIR, modified=_PAIR, accessed=_PAIR),
+    attributes=AttributesObject(
+        is_link=False,
+        storage_name="yD41D8CD98F00B204E9800998ECF8427E.txt",
+    ),
+)
+
+
 def _make_entry(**overrides: Any) -> IndexEntry:
-    pair = TimestampPair(iso="2024-01-01T00:00:00.000000+00:00", unix=1704067200000)
-    defaults: dict[str, Any] = {
-        "schema_version": 4,
-        "id": "yD41D8CD98F00B204E9800998ECF8427E",
-        "id_algorithm": "md5",
-        "type": "file",
-        "name": NameObject(text="test.txt", hashes=_make_hashset()),
-        "extension": "txt",
-        "size": SizeObject(text="0 B", bytes=0),
-        "hashes": _make_hashset(),
-        "file_system": FileSystemObject(relative="test.txt", parent=None),
-        "timestamps": TimestampsObject(created=pair, modified=pair, accessed=pair),
-        "attributes": AttributesObject(
-            is_link=False,
-            storage_name="yD41D8CD98F00B204E9800998ECF8427E.txt",
-        ),
-    }
-    defaults.update(overrides)
-    return IndexEntry(**defaults)
-
-
-def _cfg(**overrides: object) -> IndexerConfig:
-    return load_config(overrides=overrides)  # type: ignore[arg-type]
+    return dataclasses.replace(_BASE_ENTRY, **overrides)
 
 
 # ---------------------------------------------------------------------------
@@ -77,10 +87,10 @@ class TestJsonRoundTrip:
     """Tests for JSON serialization round-trip fidelity."""
 
     def test_round_trip(self) -> None:
-        """serialize_entry → json.loads matches entry.to_dict() semantics."""
+        """serialize_entry → orjson.loads matches entry.to_dict() semantics."""
         entry = _make_entry()
         json_str = serialize_entry(entry)
-        parsed = json.loads(json_str)
+        parsed = orjson.loads(json_str)
 
         assert parsed["schema_version"] == 4
         assert parsed["id"] == entry.id
@@ -96,11 +106,28 @@ class TestSchemaVersionFirstKey:
         """The first key in the serialized JSON is 'schema_version'."""
         entry = _make_entry()
         json_str = serialize_entry(entry)
-        # Parse ordered (json preserves insertion order in CPython 3.7+).
-        parsed = json.loads(json_str)
+        # Parse ordered (orjson preserves key order).
+        parsed = orjson.loads(json_str)
         first_key = next(iter(parsed))
         assert first_key == "schema_version"
 
+    def test_top_level_keys_in_canonical_order(self) -> None:
+        """Serialized top-level keys follow the canonical order without re-sorting."""
+        from shruggie_indexer.core.serializer import _TOP_LEVEL_KEY_ORDER
+        from shruggie_indexer.models.schema import EncodingObject
+
+        entry = _make_entry(
+            schema_version=3,
+            encoding=EncodingObject(line_endings="lf"),
+            duplicates=[_make_entry()],
+            session_id="00000000-0000-4000-8000-000000000000",
+        )
+        keys = list(orjson.loads(serialize_entry(entry)))
+        canonical = [k for k in keys if k in _TOP_LEVEL_KEY_ORDER]
+        assert canonical == [k for k in _TOP_LEVEL_KEY_ORDER if k in keys]
+        assert keys[0] == "schema_version"
+        assert keys[-1] == "session_id"
+
 
 class TestSha512Omission:
     """Tests for sha512 omission when not computed."""
@@ -109,7 +136,7 @@ class TestSha512Omission:
         """When sha512 is None, it does not appear in output."""
         entry = _make_entry(hashes=_make_hashset(sha512=None))
         json_str = serialize_entry(entry)
-        parsed = json.loads(json_str)
+        parsed = orjson.loads(json_str)
         assert "sha512" not in parsed["hashes"]
 
     def test_sha512_present_when_computed(self) -> None:
@@ -117,9 +144,23 @@ class TestSha512Omission:
         sha512_val = "A" * 128
         entry = _make_entry(hashes=_make_hashset(sha512=sha512_val))
         json_str = serialize_entry(entry)
-        parsed = json.loads(json_str)
+        parsed = orjson.loads(json_str)
         assert parsed["hashes"]["sha512"] == sha512_val
 
+    def test_sidecar_data_null_sha512_preserved(self) -> None:
+        """Only HashSet omits sha512; embedded sidecar JSON is kept verbatim."""
+        meta = MetadataEntry(
+            id="yABCDEF0123456789ABCDEF0123456789",
+            origin="sidecar",
+            name=NameObject(text="test.txt.json", hashes=_HASHSET),
+            hashes=_HASHSET,
+            attributes=MetadataAttributes(type="json_metadata", format="json", transforms=[]),
+            data={"sha512": None},
+        )
+        parsed = orjson.loads(serialize_entry(_make_entry(metadata=[meta])))
+        assert "sha512" not in parsed["metadata"][0]["hashes"]
+        assert parsed["metadata"][0]["data"] == {"sha512": None}
+
 
 class TestPrettyVsCompact:
     """Tests for pretty-print vs compact output modes."""
@@ -146,7 +187,7 @@ class TestEnsureAscii:
     def test_unicode_preserved(self) -> None:
         """Non-ASCII characters are preserved in output, not escaped."""
         entry = _make_entry(
-            name=NameObject(text="café.txt", hashes=_make_hashset()),
+            name=NameObject(text="café.txt", hashes=_HASHSET),
             extension="txt",
         )
         json_str = serialize_entry(entry)
@@ -169,9 +210,23 @@ class TestWriteOutput:
 
         output = captured.getvalue()
         assert "schema_version" in output
-        parsed = json.loads(output.strip())
+        parsed = orjson.loads(output.strip())
         assert parsed["schema_version"] == 4
 
+    @pytest.mark.skipif(os.linesep != "\n", reason="stdout translates newlines here")
+    def test_stdout_output_bypasses_text_encoder(self) -> None:
+        """A UTF-8 stdout receives the serialized bytes through its buffer."""
+        entry = _make_entry(name=NameObject(text="caf\u00e9.txt", hashes=_HASHSET))
+        config = _cfg(output_stdout=True)
+
+        raw = BytesIO()
+        stream = TextIOWrapper(raw, encoding="utf-8")
+        with patch("sys.stdout", stream), patch.object(stream, "write") as text_write:
+            write_output(entry, config)
+
+        text_write.assert_not_called()
+        assert raw.getvalue() == (serialize_entry(entry) + "\n").encode("utf-8")
+
 
 class TestWriteInplace:
     """Tests for write_inplace() sidecar file naming."""
@@ -186,9 +241,47 @@ class TestWriteInplace:
 
         sidecar = tmp_path / "test.txt_idx.json"
         assert sidecar.exists()
-        parsed = json.loads(sidecar.read_text(encoding="utf-8"))
+        parsed = orjson.loads(sidecar.read_bytes())
         assert parsed["schema_version"] == 4
 
+    def test_inplace_content_matches_serialize_entry(self, tmp_path: Path) -> None:
+        """Sidecar bytes are the pretty JSON plus a newline, in text-mode line endings."""
+        entry = _make_entry(name=NameObject(text="caf\u00e9.txt", hashes=_HASHSET))
+        item_path = tmp_path / "caf\u00e9.txt"
+        item_path.write_text("content", encoding="utf-8")
+
+        write_inplace(entry, item_path, "file")
+
+        sidecar = tmp_path / "caf\u00e9.txt_idx.json"
+        expected = (serialize_entry(entry) + "\n").replace("\n", os.linesep)
+        assert sidecar.read_bytes() == expected.encode("utf-8")
+
+    def test_inplace_rewrite_truncates(self, tmp_path: Path) -> None:
+        """Rewriting a sidecar with shorter content leaves no stale tail."""
+        item_path = tmp_path / "test.txt"
+        item_path.write_text("content", encoding="utf-8")
+        long_entry = _make_entry(mime_type="text/plain" + "x" * 500)
+        short_entry = _make_entry()
+
+        write_inplace(long_entry, item_path, "file")
+        write_inplace(short_entry, item_path, "file")
+
+        sidecar = tmp_path / "test.txt_idx.json"
+        assert orjson.loads(sidecar.read_bytes()) == orjson.loads(serialize_entry(short_entry))
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fallocate"), reason="no posix_fallocate")
+    def test_large_output_preallocated(self, tmp_path: Path) -> None:
+        """Only outputs past the threshold reserve their extent up front."""
+        big = _make_entry(mime_type="x" * (1024 * 1024))
+        with patch("os.posix_fallocate", wraps=os.posix_fallocate) as fallocate:
+            write_inplace(_make_entry(), tmp_path / "small.txt", "file")
+            fallocate.assert_not_called()
+            write_inplace(big, tmp_path / "big.txt", "file")
+            fallocate.assert_called_once()
+
+        sidecar = tmp_path / "big.txt_idx.json"
+        assert orjson.loads(sidecar.read_bytes()) == orjson.loads(serialize_entry(big))
+
     def test_inplace_directory_naming(self, tmp_path: Path) -> None:
         """Directory sidecar is written inside the directory as {dirname}_idxd.json."""
         entry = _make_entry(type="directory", hashes=None, extension=None)
@@ -222,11 +315,7 @@ class TestWriteDirectoryMetaSuppression:
             "type": "directory",
             "name": NameObject(
                 text="mydir",
-                hashes=HashSet(
-                    md5="D41D8CD98F00B204E9800998ECF8427E",
-                    sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
-                    sha512=None,
-                ),
+                hashes=_HASHSET,
             ),
             "extension": None,
             "size": SizeObject(text="0 B", bytes=0),
@@ -261,11 +350,7 @@ class TestWriteDirectoryMetaSuppression:
         sub_entry = self._make_dir_entry(
             name=NameObject(
                 text="sub",
-                hashes=HashSet(
-                    md5="D41D8CD98F00B204E9800998ECF8427E",
-                    sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
-                    sha512=None,
-                ),
+                hashes=_HASHSET,
             ),
             file_system=FileSystemObject(relative="sub", parent=None),
             items=[file_entry],
@@ -273,11 +358,7 @@ class TestWriteDirectoryMetaSuppression:
         root_entry = self._make_dir_entry(
             name=NameObject(
                 text="root",
-                hashes=HashSet(
-                    md5="D41D8CD98F00B204E9800998ECF8427E",
-                    sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
-                    sha512=None,
-                ),
+                hashes=_HASHSET,
             ),
             file_system=FileSystemObject(relative=".", parent=None),
             items=[sub_entry],
@@ -316,11 +397,7 @@ class TestWriteDirectoryMetaSuppression:
         sub_entry = self._make_dir_entry(
             name=NameObject(
                 text="sub",
-                hashes=HashSet(
-                    md5="D41D8CD98F00B204E9800998ECF8427E",
-                    sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
-                    sha512=None,
-                ),
+                hashes=_HASHSET,
             ),
             file_system=FileSystemObject(relative="sub", parent=None),
             items=[file_entry],
@@ -328,11 +405,7 @@ class TestWriteDirectoryMetaSuppression:
         root_entry = self._make_dir_entry(
             name=NameObject(
                 text="root",
-                hashes=HashSet(
-                    md5="D41D8CD98F00B204E9800998ECF8427E",
-                    sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
-                    sha512=None,
-                ),
+                hashes=_HASHSET,
             ),
             file_system=FileSystemObject(relative=".", parent=None),
             items=[sub_entry],
@@ -367,11 +440,7 @@ class TestWriteDirectoryMetaSuppression:
                 _make_entry(
                     name=NameObject(
                         text=name,
-                        hashes=HashSet(
-                            md5="D41D8CD98F00B204E9800998ECF8427E",
-                            sha256="E3B0C44298FC1C149AFBF4C8996FB92427AE41E4649B934CA495991B7852B855",
-                            sha512=None,
-                        ),
+                        hashes=_HASHSET,
                     ),
                     extension=name.rsplit(".", 1)[-1],
                     file_system=FileSystemObject(
@@ -395,3 +464,71 @@ class TestWriteDirectoryMetaSuppression:
 
         assert (root / "a.txt_idx.json").exists()
         assert (root / "b.txt_idx.json").exists()
+
+    def test_write_failure_propagates(self, tmp_path: Path) -> None:
+        """A failing sidecar write is re-raised after the other writes finish."""
+        from shruggie_indexer.cli.main import _write_inplace_tree
+
+        entries = [
+            _make_entry(file_system=FileSystemObject(relative=f"f{i}.txt", parent=None))
+            for i in range(8)
+        ]
+        root_entry = self._make_dir_entry(
+            file_system=FileSystemObject(relative=".", parent=None),
+            items=entries,
+        )
+        written: list[str] = []
+
+        def write_fn(entry: IndexEntry, path: Path, kind: str) -> None:
+            if path.name == "f3.txt":
+                raise OSError("disk full")
+            written.append(path.name)
+
+        with pytest.raises(OSError, match="disk full"):
+            _write_inplace_tree(root_entry, tmp_path, write_fn)
+        assert sorted(written) == [f"f{i}.txt" for i in range(8) if i != 3]
+
+    def test_every_write_failure_is_logged(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Each failed write is logged with its path; the first is re-raised."""
+        from shruggie_indexer.cli.main import _write_inplace_tree
+
+        entries = [
+            _make_entry(file_system=FileSystemObject(relative=f"f{i}.txt", parent=None))
+            for i in range(8)
+        ]
+        root_entry = self._make_dir_entry(
+            file_system=FileSystemObject(relative=".", parent=None),
+            items=entries,
+        )
+
+        def write_fn(entry: IndexEntry, path: Path, kind: str) -> None:
+            if path.name in ("f2.txt", "f5.txt"):
+                raise OSError(f"cannot write {path.name}")
+
+        with (
+            caplog.at_level("ERROR", logger="shruggie_indexer"),
+            pytest.raises(OSError, match=r"cannot write f2\.txt"),
+        ):
+            _write_inplace_tree(root_entry, tmp_path, write_fn)
+        failed = [r.getMessage() for r in caplog.records if "FAILED" in r.getMessage()]
+        assert len(failed) == 2
+        assert str(tmp_path / "f2.txt") in failed[0]
+        assert str(tmp_path / "f5.txt") in failed[1]
+
+    def test_deep_tree_walked_in_order(self, tmp_path: Path) -> None:
+        """Trees deeper than the recursion limit are walked depth-first."""
+        from shruggie_indexer.cli.main import _collect_inplace_writes
+
+        depth = sys.getrecursionlimit() + 100
+        node = _make_entry(file_system=FileSystemObject(relative="leaf.txt", parent=None))
+        for level in range(depth):
+            node = self._make_dir_entry(
+                file_system=FileSystemObject(relative=f"d{level}", parent=None),
+                items=[node],
+            )
+
+        jobs = _collect_inplace_writes(node, tmp_path, _is_root=True, write_directory_meta=True)
+        names = [path.name for _, path, _ in jobs]
+        assert names == [f"d{level}" for level in reversed(range(depth - 1))] + ["leaf.txt"]
@@ -7,14 +7,18 @@ from __future__ import annotations
 
 import os
 import re
+from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
+from shruggie_indexer.core import timestamps
 from shruggie_indexer.core.timestamps import extract_timestamps
 
 # ISO 8601 pattern: YYYY-MM-DDTHH:MM:SS with optional fractional seconds
-# and timezone offset.
-_ISO_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?([+-]\d{2}:\d{2}|Z)$")
+# and timezone offset.  Used with fullmatch(), so no anchors are needed.
+_ISO_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{1,9})?(?:[+-]\d{2}:\d{2}|Z)")
 
 
 def _make_stat(
@@ -24,14 +28,12 @@ def _make_stat(
     st_ctime: float = 1700000000.0,
     st_birthtime: float | None = None,
 ) -> os.stat_result:
-    """Build a mock stat_result with the given timestamp values.
+    """Build an ``os.stat_result`` with the given timestamp values.
 
-    On Windows, real ``os.stat_result`` always has ``st_birthtime``.
-    We simulate platform differences by conditionally adding the attribute.
+    ``st_birthtime`` only lands on the result where the platform's
+    ``stat_result`` has the field.  Elsewhere, a requested birth time is
+    carried on a thin stand-in exposing the same timestamp attributes.
     """
-    # os.stat_result cannot be directly instantiated with keyword args in all
-    # contexts.  We create a surrogate object that behaves identically for
-    # timestamp access.
     fields = {
         "st_atime": st_atime,
         "st_mtime": st_mtime,
@@ -39,9 +41,9 @@ def _make_stat(
     }
     if st_birthtime is not None:
         fields["st_birthtime"] = st_birthtime
-
-    # Use a SimpleNamespace as a duck-type replacement.
-    return SimpleNamespace(**fields)  # type: ignore[return-value]
+        if not timestamps._HAS_BIRTHTIME:
+            return SimpleNamespace(**fields)  # type: ignore[return-value]
+    return os.stat_result((0,) * 10, fields)
 
 
 # ---------------------------------------------------------------------------
@@ -57,37 +59,69 @@ class TestExtractTimestamps:
         stat = os.stat(sample_file)
         result = extract_timestamps(stat)
         assert result.modified.unix == int(stat.st_mtime * 1000)
-        assert _ISO_PATTERN.match(result.modified.iso)
+        assert _ISO_PATTERN.fullmatch(result.modified.iso)
 
     def test_atime_extraction(self, sample_file: Path) -> None:
         """accessed.unix and accessed.iso consistent with st_atime."""
         stat = os.stat(sample_file)
         result = extract_timestamps(stat)
         assert result.accessed.unix == int(stat.st_atime * 1000)
-        assert _ISO_PATTERN.match(result.accessed.iso)
+        assert _ISO_PATTERN.fullmatch(result.accessed.iso)
 
-    def test_creation_time_present(self) -> None:
+    def test_creation_time_present(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """When st_birthtime exists, created timestamp uses it."""
+        monkeypatch.setattr(
+            timestamps, "_creation_time_and_source", timestamps._creation_from_birthtime
+        )
         stat = _make_stat(st_birthtime=1600000000.5, st_ctime=1700000000.0)
         result = extract_timestamps(stat)
         assert result.created.unix == int(1600000000.5 * 1000)
+        assert result.created_source == "birthtime"
 
-    def test_creation_time_fallback(self) -> None:
+    def test_creation_time_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """When st_birthtime is absent, falls back to st_ctime."""
+        monkeypatch.setattr(
+            timestamps, "_creation_time_and_source", timestamps._creation_from_ctime
+        )
         stat = _make_stat(st_ctime=1700000000.0)  # no st_birthtime
         result = extract_timestamps(stat)
         assert result.created.unix == int(1700000000.0 * 1000)
+        assert result.created_source == "ctime_fallback"
 
     def test_iso_format(self) -> None:
         """ISO strings match YYYY-MM-DDTHH:MM:SS pattern with timezone."""
         stat = _make_stat(st_birthtime=1700000000.123)
         result = extract_timestamps(stat)
-        assert _ISO_PATTERN.match(result.accessed.iso)
-        assert _ISO_PATTERN.match(result.created.iso)
-        assert _ISO_PATTERN.match(result.modified.iso)
+        assert _ISO_PATTERN.fullmatch(result.accessed.iso)
+        assert _ISO_PATTERN.fullmatch(result.created.iso)
+        assert _ISO_PATTERN.fullmatch(result.modified.iso)
 
     def test_unix_milliseconds(self) -> None:
         """st_mtime=1700000000.123 -> unix=1700000000123 (integer ms)."""
         stat = _make_stat(st_mtime=1700000000.123, st_birthtime=1700000000.0)
         result = extract_timestamps(stat)
         assert result.modified.unix == 1700000000123
+
+    def test_repeated_timestamps_share_iso_string(self) -> None:
+        """Equal timestamps reuse the memoized ISO string."""
+        stat = _make_stat(
+            st_atime=1700000000.25,
+            st_mtime=1700000000.25,
+            st_ctime=1700000000.25,
+            st_birthtime=1700000000.25,
+        )
+        result = extract_timestamps(stat)
+        assert result.accessed.iso is result.modified.iso
+        assert result.created.iso is result.modified.iso
+        assert extract_timestamps(stat).modified.iso is result.modified.iso
+
+    @pytest.mark.parametrize(
+        "ts",
+        [0.0, -1.5, 1700000000.123456, 1700000000.0000005, 1700000000.9999996, 1e9 + 0.25],
+    )
+    def test_iso_matches_datetime_isoformat(self, ts: float) -> None:
+        """The ISO fast path renders exactly what aware datetime.isoformat() does."""
+        expected = (
+            datetime.fromtimestamp(ts, tz=UTC).astimezone().isoformat(timespec="microseconds")
+        )
+        assert timestamps._stat_to_iso(ts) == expected
@@ -6,24 +6,20 @@
 from __future__ import annotations
 
 import os
+import re
 import sys
 from pathlib import Path
 
 import pytest
 
-from shruggie_indexer.config.loader import load_config
-from shruggie_indexer.config.types import IndexerConfig
-from shruggie_indexer.core.traversal import list_children
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def _cfg(**overrides: object) -> IndexerConfig:
-    """Quick config builder for traversal tests."""
-    return load_config(overrides=overrides)  # type: ignore[arg-type]
-
+from shruggie_indexer.core.traversal import (
+    _compile_metadata_excludes,
+    iter_children,
+    list_children,
+    scan_children,
+    walk_tree,
+)
+from tests.helpers import cached_config as _cfg
 
 # ---------------------------------------------------------------------------
 # Tests
@@ -82,6 +78,37 @@ class TestExclusionFilters:
         assert "keep_me" in dir_names
         assert ".trash-1000" not in dir_names
 
+    def test_multiple_glob_exclusions(self, tmp_path: Path) -> None:
+        """Every configured glob is applied, case-insensitively."""
+        for name in ("notes.TMP", "build7", "build", "data.csv"):
+            (tmp_path / name).write_text(name, encoding="utf-8")
+
+        config = _cfg(filesystem_exclude_globs=("*.tmp", "build?"))
+        files, _ = list_children(tmp_path, config)
+        file_names = {p.name for p in files}
+
+        assert file_names == {"build", "data.csv"}
+
+    def test_metadata_exclude_matcher_joined_or_not(self) -> None:
+        """Joined and per-pattern metadata matchers agree on every name."""
+        names = ("a_meta2.json", "b_x.json", "c_xx.json", "d_yy.json", "keep.json")
+        with_backref = (re.compile(r"_meta2\.json$"), re.compile(r"_(x|y)\1\.json$"))
+        joinable = (re.compile(r"_meta2\.json$"), re.compile(r"_(x|yy)\.json$"))
+        # As loaded from config: IGNORECASE plus a redundant inline flag.
+        with_inline_flag = (
+            re.compile(r"_meta2\.json$", re.IGNORECASE),
+            re.compile(r"(?i)_XX\.json$", re.IGNORECASE),
+        )
+
+        for patterns, excluded in (
+            (with_backref, {"a_meta2.json", "c_xx.json", "d_yy.json"}),
+            (joinable, {"a_meta2.json", "b_x.json", "d_yy.json"}),
+            (with_inline_flag, {"a_meta2.json", "c_xx.json"}),
+        ):
+            matcher = _compile_metadata_excludes(patterns)
+            assert matcher is not None
+            assert {n for n in names if matcher(n)} == excluded
+
 
 class TestSymlinks:
     """Tests for symlink classification."""
@@ -102,6 +129,22 @@ class TestSymlinks:
         file_names = {p.name for p in files}
         assert "link.txt" in file_names
 
+    @pytest.mark.skipif(
+        sys.platform == "win32" and not os.environ.get("CI"),
+        reason="Symlink creation may require elevated privileges on Windows",
+    )
+    def test_symlink_targets_classified(self, tmp_path: Path) -> None:
+        """Directory symlinks are directories; dangling symlinks are files."""
+        (tmp_path / "real_dir").mkdir()
+        (tmp_path / "dir_link").symlink_to(tmp_path / "real_dir")
+        (tmp_path / "dangling").symlink_to(tmp_path / "missing.txt")
+
+        config = _cfg()
+        files, directories = list_children(tmp_path, config)
+
+        assert [p.name for p in files] == ["dangling"]
+        assert [p.name for p in directories] == ["dir_link", "real_dir"]
+
 
 class TestEdgeCases:
     """Tests for empty dirs, hidden files, sort order, mixed types."""
@@ -131,6 +174,15 @@ class TestEdgeCases:
         sorted_names = [p.name for p in files]
         assert sorted_names == ["apple.txt", "Mango.txt", "Zebra.txt"]
 
+    def test_sort_order_casefolds(self, tmp_path: Path) -> None:
+        """Sorting uses full case folding, so "ß" orders like "ss"."""
+        for name in ("strasse2.txt", "STRASSE1.txt", "Straße.txt"):
+            (tmp_path / name).write_text(name, encoding="utf-8")
+
+        config = _cfg()
+        files, _ = list_children(tmp_path, config)
+        assert [p.name for p in files] == ["Straße.txt", "STRASSE1.txt", "strasse2.txt"]
+
     def test_mixed_file_and_directory_classification(self, tmp_path: Path) -> None:
         """Files and directories are correctly separated."""
         (tmp_path / "readme.md").write_text("# Hi", encoding="utf-8")
@@ -146,6 +198,44 @@ class TestEdgeCases:
         assert file_names == {"readme.md", "setup.py"}
         assert dir_names == {"src", "tests"}
 
+    def test_scan_children_names_match_list_children(self, sample_tree: Path) -> None:
+        """scan_children yields the names behind list_children's paths."""
+        config = _cfg()
+        result = scan_children(sample_tree, config)
+        files, directories = list_children(sample_tree, config)
+
+        assert result.file_names == [p.name for p in files]
+        assert result.dir_names == [p.name for p in directories]
+        assert (result.files, result.directories) == (files, directories)
+
+    def test_cached_listing_reused_until_directory_changes(self, tmp_path: Path) -> None:
+        """A cached listing is reused until the directory's mtime changes."""
+        (tmp_path / "one.txt").write_text("1", encoding="utf-8")
+        config = _cfg()
+        st = tmp_path.stat()
+
+        first = scan_children(tmp_path, config, cache_ttl=3600)
+        first.file_names.append("caller-mutation")
+
+        # Same inode and mtime: the memoized listing is served as-is.
+        (tmp_path / "two.txt").write_text("2", encoding="utf-8")
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert scan_children(tmp_path, config, cache_ttl=3600).file_names == ["one.txt"]
+
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        files, _ = list_children(tmp_path, config, cache_ttl=3600)
+        assert [p.name for p in files] == ["one.txt", "two.txt"]
+
+    def test_iter_children_matches_list_children(self, sample_tree: Path) -> None:
+        """iter_children yields list_children's entries, sorted or streamed."""
+        config = _cfg()
+        files, directories = list_children(sample_tree, config)
+        expected = [(str(p), "file") for p in files] + [(str(p), "directory") for p in directories]
+
+        assert [(c.path, c.kind) for c in iter_children(sample_tree, config)] == expected
+        streamed = iter_children(sample_tree, config, sort=False)
+        assert sorted((c.path, c.kind) for c in streamed) == sorted(expected)
+
     def test_deeply_nested_is_not_visible(self, tmp_path: Path) -> None:
         """Only immediate children are returned, not deeply nested items."""
         d = tmp_path / "a" / "b" / "c"
@@ -157,3 +247,42 @@ class TestEdgeCases:
         all_names = {p.name for p in files} | {p.name for p in directories}
         assert "deep.txt" not in all_names
         assert "a" in all_names
+
+
+class TestWalkTree:
+    """Tests for the parallel tree walker."""
+
+    def test_walk_matches_list_children(self, tmp_path: Path) -> None:
+        """Every directory is yielded once, breadth-first, with its listing."""
+        for rel in ("a/b/c", "a/d", "e", ".git/objects"):
+            (tmp_path / rel).mkdir(parents=True)
+        (tmp_path / "a" / "b" / "c" / "deep.txt").write_text("deep", encoding="utf-8")
+        (tmp_path / "e" / "top.txt").write_text("top", encoding="utf-8")
+
+        config = _cfg()
+        walked = list(walk_tree(tmp_path, config, max_workers=4))
+
+        assert [d.relative_to(tmp_path).as_posix() for d, _, _ in walked] == [
+            ".",
+            "a",
+            "e",
+            "a/b",
+            "a/d",
+            "a/b/c",
+        ]
+        for directory, files, directories in walked:
+            assert (files, directories) == list_children(directory, config)
+
+    @pytest.mark.skipif(
+        sys.platform == "win32" and not os.environ.get("CI"),
+        reason="Symlink creation may require elevated privileges on Windows",
+    )
+    def test_walk_does_not_follow_directory_symlinks(self, tmp_path: Path) -> None:
+        """A directory symlink cycle is listed but not descended into."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "loop").symlink_to(tmp_path)
+
+        walked = list(walk_tree(tmp_path, _cfg()))
+
+        assert [d.name for d, _, _ in walked] == [tmp_path.name, "real"]
+        assert [p.name for p in walked[1][2]] == ["loop"]